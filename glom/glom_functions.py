@@ -9,11 +9,19 @@ transforming, and manipulating nested data structures. These functions work with
 native CTY/schema structures and JSON data.
 """
 
+import ast
+import binascii
+import copy
 import json
-from typing import Any, Dict, List, Union, Optional, Callable
+import math
+import re
+import sys
+import weakref
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterator, List, Union, Optional, Callable
 
 import glom
-from glom import glom as glom_extract, Path, Assign, T, Coalesce, Literal, Spec
+from glom import glom as glom_extract, Path, Assign, T, Coalesce, Literal, Spec, SKIP
 from glom.core import GlomError, PathAccessError, PathAssignError
 
 from pyvider.hub import register_function
@@ -25,6 +33,19 @@ from pyvider.cty import (
 )
 from pyvider.exceptions import FunctionError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import yaml
+    # Prefer the libyaml-backed safe loader/dumper when PyYAML was built with it
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+except ImportError:
+    yaml = None
+
 class Extract:
     """
     Filter elements in a collection based on a predicate.
@@ -41,7 +62,7 @@ class Extract:
         self.predicate = predicate
         
     def __call__(self, target):
-        logger.debug(f"🧰🔍🔄 Extract filtering collection at {self.path}")
+        logger.debug("🧰🔍🔄 Extract filtering collection at %s", self.path)
         try:
             # Get the collection using glom
             collection = glom_extract(target, self.path)
@@ -52,7 +73,7 @@ class Extract:
                 return []
                 
             result = [item for item in collection if self.predicate(item)]
-            logger.debug(f"🧰🔍✅ Extract filtered from {len(collection)} to {len(result)} items")
+            logger.debug("🧰🔍✅ Extract filtered from %s to %s items", len(collection), len(result))
             return result
             
         except Exception as e:
@@ -61,17 +82,22 @@ class Extract:
 
 # --- Type Conversion Utilities ---
 
+# Exact types that are passed through without any conversion work
+_NATIVE_TYPES = frozenset((str, int, float, bool, list, dict, set, tuple))
+# Strings may still hold JSON or numeric paths, so they need the full check
+_NATIVE_NON_STRING_TYPES = _NATIVE_TYPES - {str}
+
 def cty_to_python(value: Any) -> Any:
     """
     Convert CTY types to Python native types that glom can work with.
     """
-    logger.debug(f"🧰🔍🔄 Converting CTY to Python: {type(value).__name__}")
+    # Fast path for values that are already native
+    if value is None or type(value) in _NATIVE_TYPES:
+        return value
     
-    # Handle None
-    if value is None:
-        return None
+    logger.debug("🧰🔍🔄 Converting CTY to Python: %s", type(value).__name__)
         
-    # Handle already native types
+    # Handle native subclasses
     if isinstance(value, (str, int, float, bool, list, dict, set, tuple)):
         return value
         
@@ -120,7 +146,7 @@ def python_to_cty(value: Any) -> Any:
     """
     Convert Python native types back to CTY types.
     """
-    logger.debug(f"🧰🔍🔄 Converting Python to CTY: {type(value).__name__}")
+    logger.debug("🧰🔍🔄 Converting Python to CTY: %s", type(value).__name__)
     
     # Handle None
     if value is None:
@@ -192,9 +218,28 @@ def python_to_cty(value: Any) -> Any:
     logger.warning(f"🧰⚠️⚠️ No direct CTY equivalent for {type(value).__name__}, wrapping as CtyDynamic")
     return CtyDynamic(value)
 
+# orjson turns integers outside 64 bits into floats; any run of 19+ digits
+# sends the document to the stdlib parser, which keeps them exact
+_LONG_DIGITS = re.compile(r"\d{19}")
+
+def _json_loads(data: str) -> Any:
+    """
+    Parse a JSON string, using orjson when it is installed.
+    
+    Documents orjson would parse differently (very large integers) or
+    rejects (NaN/Infinity literals, invalid JSON) go to the stdlib parser,
+    which either accepts them or raises the usual json.JSONDecodeError.
+    """
+    if orjson is not None and not _LONG_DIGITS.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 def parse_json_if_needed(value: Any) -> Any:
     """Parse JSON strings to Python structures when detected."""
-    logger.debug(f"🧰🔍🔄 Checking if value is JSON: {type(value).__name__}")
+    logger.debug("🧰🔍🔄 Checking if value is JSON: %s", type(value).__name__)
     
     if not isinstance(value, str):
         return value
@@ -204,7 +249,7 @@ def parse_json_if_needed(value: Any) -> Any:
     if (value_str.startswith('{') and value_str.endswith('}')) or \
        (value_str.startswith('[') and value_str.endswith(']')):
         try:
-            return json.loads(value_str)
+            return _json_loads(value_str)
         except json.JSONDecodeError:
             # Not valid JSON after all
             return value
@@ -220,7 +265,11 @@ def ensure_glom_compatible(value: Any) -> Any:
     2. Parses JSON strings if detected
     3. Handles special case conversions
     """
-    logger.debug(f"🧰🔍🔄 Preparing value for glom: {type(value).__name__}")
+    # Fast path: native non-string values need no conversion or parsing
+    if value is None or type(value) in _NATIVE_NON_STRING_TYPES:
+        return value
+    
+    logger.debug("🧰🔍🔄 Preparing value for glom: %s", type(value).__name__)
     
     # First convert from CTY to Python
     py_value = cty_to_python(value)
@@ -241,11 +290,218 @@ def ensure_glom_compatible(value: Any) -> Any:
         
         # If we made any conversions, return a Path object instead
         if any(isinstance(part, int) for part in converted_parts):
-            logger.debug(f"🧰🔍🔄 Converting string path with numeric indices to Path: {parsed_value}")
+            logger.debug("🧰🔍🔄 Converting string path with numeric indices to Path: %s", parsed_value)
             return Path(*converted_parts)
     
     return parsed_value
 
+def _flatten_iter(root: Any, sep: str = ".") -> dict:
+    """
+    Flatten nested dicts/lists into a single-level dict with path keys.
+
+    Walks the structure with an explicit stack of item iterators instead of
+    recursing, writing leaves straight into one result dict. Paths are kept
+    as tuples of segments and only joined into a key at each leaf. Key order
+    matches a depth-first walk. Empty nested containers are kept as leaf
+    values.
+
+    Nested containers are detected by exact type (dict/list), which is what
+    JSON parsing and CTY conversion produce; subclasses are treated as leaves.
+    """
+    out = {}
+    set_leaf = out.__setitem__
+    stack = [((), iter(root.items()) if isinstance(root, dict) else enumerate(root))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            path = prefix + (str(k),)
+            # Descend into non-empty containers; this frame's iterator
+            # resumes once the child is done
+            value_type = type(v)
+            if value_type is dict and v:
+                stack.append((path, iter(v.items())))
+                break
+            if value_type is list and v:
+                stack.append((path, enumerate(v)))
+                break
+            set_leaf(sep.join(path), v)
+        else:
+            stack.pop()
+    return out
+
+def _flatten_keys(root: Any, sep: str = ".") -> Iterator[str]:
+    """
+    Yield the path keys _flatten_iter would produce, without the values.
+
+    Same depth-first walk and container rules, but nothing is materialized,
+    so callers that only need the paths can filter them lazily.
+    """
+    stack = [((), iter(root.items()) if isinstance(root, dict) else enumerate(root))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            path = prefix + (str(k),)
+            value_type = type(v)
+            if value_type is dict and v:
+                stack.append((path, iter(v.items())))
+                break
+            if value_type is list and v:
+                stack.append((path, enumerate(v)))
+                break
+            yield sep.join(path)
+        else:
+            stack.pop()
+
+def _set_nested(root: Any, key_parts: List[str], value: Any) -> None:
+    """
+    Set a value in a nested dict/list structure by following key_parts.
+    
+    Intermediate containers are created as needed: a list when the next
+    part is numeric, otherwise a dict. Walks the parts iteratively and
+    checks each part for digits only once.
+    """
+    classified = [(part, part.isdigit()) for part in key_parts]
+    cur = root
+    
+    for i in range(len(classified) - 1):
+        part, is_digit = classified[i]
+        child_type = list if classified[i + 1][1] else dict
+        
+        if isinstance(cur, list):
+            idx = int(part) if is_digit else part
+            # Expand list if needed
+            while len(cur) <= idx:
+                cur.append(child_type())
+            # Ensure we have a dict or list at this position
+            if not isinstance(cur[idx], (dict, list)):
+                cur[idx] = child_type()
+            cur = cur[idx]
+        else:
+            # Create or replace non-container values as appropriate
+            if part not in cur or not isinstance(cur[part], (dict, list)):
+                cur[part] = child_type()
+            cur = cur[part]
+    
+    # Last key part gets the value directly
+    part, is_digit = classified[-1]
+    if isinstance(cur, list):
+        idx = int(part) if is_digit else part
+        while len(cur) <= idx:
+            cur.append(None)
+        cur[idx] = value
+    else:
+        cur[part] = value
+
+def _merge_into(dst: dict, src: dict, owned: Dict[int, dict]) -> None:
+    """
+    Deep merge src into dst in place - src takes precedence.
+    
+    Nested dicts that both sides share are copied the first time they are
+    merged into, so the inputs are never mutated; owned maps id() to the
+    dicts already copied into the result (holding them keeps the ids
+    unique), which later merges modify directly. Every other value from
+    src is assigned as-is.
+    """
+    for k, v in src.items():
+        existing = dst.get(k)
+        if isinstance(existing, dict) and isinstance(v, dict):
+            if id(existing) not in owned:
+                existing = dict(existing)
+                owned[id(existing)] = existing
+                dst[k] = existing
+            _merge_into(existing, v, owned)
+        else:
+            dst[k] = v
+
+def _clone_tree(value: Any) -> Any:
+    """
+    Deep-copy plain dict/list trees without copy.deepcopy's memo bookkeeping.
+    
+    Scalars are immutable and returned as-is; any other type is handed to
+    copy.deepcopy. Shared sub-containers are copied separately, which is
+    fine for the acyclic data CTY and JSON conversion produce.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {k: _clone_tree(v) for k, v in value.items()}
+    if value_type is list:
+        return [_clone_tree(v) for v in value]
+    if value is None or value_type in (str, int, float, bool):
+        return value
+    return copy.deepcopy(value)
+
+def _copy_assign(root: Any, key_parts: List[str], value: Any) -> Any:
+    """
+    Return a copy of root with value assigned at the path in key_parts.
+    
+    Only the containers along the path are copied; untouched branches are
+    shared with root, which is left unmodified. Numeric parts index lists.
+    Like a glom Assign, intermediate containers must already exist.
+    """
+    def fail(idx):
+        path_str = '.'.join(key_parts)
+        raise FunctionError(
+            f"Could not assign to '{path_str}' (failed at position {idx}: '{key_parts[idx]}')"
+        )
+    
+    def copy_container(node, idx):
+        if isinstance(node, dict):
+            return dict(node)
+        if isinstance(node, list):
+            return list(node)
+        fail(idx)
+    
+    def child_key(node, idx, must_exist):
+        part = key_parts[idx]
+        if isinstance(node, list):
+            if not part.lstrip('-').isdigit() or not -len(node) <= int(part) < len(node):
+                fail(idx)
+            return int(part)
+        if must_exist and part not in node:
+            fail(idx)
+        return part
+    
+    result = cur = copy_container(root, 0)
+    last = len(key_parts) - 1
+    for idx in range(last):
+        key = child_key(cur, idx, must_exist=True)
+        child = copy_container(cur[key], idx + 1)
+        cur[key] = child
+        cur = child
+    
+    cur[child_key(cur, last, must_exist=False)] = value
+    return result
+
+# id(cty_value) -> (weakref to the value, converted Python value)
+_CONVERSION_CACHE: Dict[int, tuple] = {}
+
+def _cached_glom_compatible(value: Any) -> Any:
+    """
+    ensure_glom_compatible, memoized per CTY object.
+    
+    The same CTY value often flows through several glom functions in a row;
+    this converts it once and reuses the result while the value is alive.
+    CTY values are frozen, so the conversion can't go stale, but the cached
+    Python structure is shared: callers must not mutate it in place.
+    """
+    if value is None or type(value) in _NATIVE_TYPES:
+        return ensure_glom_compatible(value)
+    
+    key = id(value)
+    hit = _CONVERSION_CACHE.get(key)
+    if hit is not None and hit[0]() is value:
+        return hit[1]
+    
+    result = ensure_glom_compatible(value)
+    try:
+        # Drop the entry as soon as the CTY value is garbage collected
+        ref = weakref.ref(value, lambda _, key=key: _CONVERSION_CACHE.pop(key, None))
+    except TypeError:
+        # Not weak-referenceable; don't cache
+        return result
+    _CONVERSION_CACHE[key] = (ref, result)
+    return result
+
 def format_glom_error(error: Exception) -> str:
     """Format a glom error for better readability and context."""
     if isinstance(error, PathAccessError):
@@ -268,9 +524,108 @@ def format_glom_error(error: Exception) -> str:
     # Generic error handling with more context
     return f"Error during glom operation: {error} ({type(error).__name__})"
 
+# Sentinel returned by path walkers and extractors when a path does not resolve
+_MISSING = object()
+
+@lru_cache(maxsize=4096)
+def _split_path(path_str: str) -> tuple:
+    """
+    Split a dot-notation path into (key, index) pairs, once per distinct string.
+    
+    index is the part as an int when it is made of ASCII digits, else None.
+    Dicts are looked up by key and lists by index, so a digit-only part
+    still matches a string dict key.
+    """
+    return tuple(
+        (part, int(part) if part.isascii() and part.isdigit() else None)
+        for part in path_str.split('.')
+    )
+
+def _walk_path(target: Any, parts: tuple) -> Any:
+    """Follow _split_path parts through dicts and lists; _MISSING if any step fails."""
+    cur = target
+    for key, index in parts:
+        # Exact-type checks first; isinstance only runs for other types
+        cur_type = type(cur)
+        if cur_type is dict or (cur_type is not list and isinstance(cur, dict)):
+            cur = cur.get(key, _MISSING)
+            if cur is _MISSING:
+                return _MISSING
+        elif (cur_type is list or isinstance(cur, list)) and index is not None and index < len(cur):
+            cur = cur[index]
+        else:
+            return _MISSING
+    return cur
+
+def _lookup_path(path_str: str, target: Any) -> Any:
+    """
+    Resolve a dot-notation path the way extract_value does; _MISSING if it doesn't.
+    
+    Dicts and lists are walked directly, so a digit part matches a string
+    key or a list index; glom handles attributes and other sequences.
+    """
+    result = _walk_path(target, _split_path(path_str))
+    if result is _MISSING:
+        result = glom.glom(target, _compile_path(path_str), default=_MISSING)
+    return result
+
+@lru_cache(maxsize=256)
+def _compile_path_trie(paths: tuple) -> dict:
+    """
+    Merge split paths into a trie so shared prefixes are walked once.
+    
+    Each node maps a (key, index) part to its child node; the None key
+    holds the positions of the paths that end at that node.
+    """
+    trie = {}
+    for i, path in enumerate(paths):
+        node = trie
+        for part in _split_path(path):
+            node = node.setdefault(part, {})
+        node.setdefault(None, []).append(i)
+    return trie
+
+def _extract_paths(target: Any, paths: tuple) -> list:
+    """Resolve many dot-notation paths in one trie walk; unresolved paths are _MISSING."""
+    out = [_MISSING] * len(paths)
+    stack = [(target, _compile_path_trie(paths))]
+    while stack:
+        cur, node = stack.pop()
+        for part, child in node.items():
+            if part is None:
+                for i in child:
+                    out[i] = cur
+                continue
+            key, index = part
+            cur_type = type(cur)
+            if cur_type is dict or (cur_type is not list and isinstance(cur, dict)):
+                value = cur.get(key, _MISSING)
+                if value is _MISSING:
+                    continue
+            elif (cur_type is list or isinstance(cur, list)) and index is not None and index < len(cur):
+                value = cur[index]
+            else:
+                continue
+            stack.append((value, child))
+    return out
+
+@lru_cache(maxsize=4096)
+def _compile_path(path_str: str) -> Path:
+    """
+    Parse a dot-notation path string into a Path, once per distinct string.
+    
+    Parts made only of ASCII digits become integers for list access; other
+    Unicode digits that str.isdigit() accepts stay as keys. Path objects are
+    immutable, so the cached instances are safe to share between calls.
+    """
+    return Path(*(
+        int(part) if part.isascii() and part.isdigit() else part
+        for part in path_str.split('.')
+    ))
+
 def create_glom_spec(path_or_spec: Any) -> Any:
     """Create a proper glom Spec object from the given path or spec."""
-    logger.debug(f"🧰🔍🔄 Creating glom spec from: {type(path_or_spec).__name__}")
+    logger.debug("🧰🔍🔄 Creating glom spec from: %s", type(path_or_spec).__name__)
     
     # If it's already a Path or Spec object, return as is
     if isinstance(path_or_spec, (Path, Spec, T.__class__)):
@@ -284,14 +639,7 @@ def create_glom_spec(path_or_spec: Any) -> Any:
             
         # Handle dot notation
         if '.' in path_or_spec:
-            path_parts = []
-            for part in path_or_spec.split('.'):
-                # Convert numeric parts to integers for list access
-                if part.isdigit():
-                    path_parts.append(int(part))
-                else:
-                    path_parts.append(part)
-            return Path(*path_parts)
+            return _compile_path(path_or_spec)
             
         # Single segment path
         return path_or_spec
@@ -309,24 +657,13 @@ def extract_value(target: Any, path_or_spec: Any, default: Any = None) -> Any:
         default: Value to return if path doesn't exist
         
     Returns:
-        The extracted value or default
+        The extracted value or default. For path strings a null value also
+        yields the default when one is given; without a default it is
+        returned as None.
     """
-    logger.debug(f"🧰📝🔄 Extracting value with path: {path_or_spec}")
+    logger.debug("🧰📝🔄 Extracting value with path: %s", path_or_spec)
     
     try:
-        # Handle different path formats
-        if isinstance(path_or_spec, str):
-            # Convert string path to Path object with proper int indices
-            parts = []
-            for part in path_or_spec.split('.'):
-                if part.isdigit():
-                    parts.append(int(part))
-                else:
-                    parts.append(part)
-            spec = Path(*parts)
-        else:
-            spec = path_or_spec
-            
         # Handle different target types
         if not isinstance(target, (dict, list)) and target is not None:
             if hasattr(target, "value"):  # Handle CTY types
@@ -334,21 +671,135 @@ def extract_value(target: Any, path_or_spec: Any, default: Any = None) -> Any:
             else:
                 raise FunctionError(f"Invalid data structure: {type(target).__name__}")
         
-        # Use glom to extract the value
-        if default is not None:
-            result = glom_extract(target, spec, default=default)
+        if isinstance(path_or_spec, str):
+            # Walk plain paths directly over the cached split parts;
+            # a null value falls back to the default like a missing one
+            result = _lookup_path(path_or_spec, target)
+            if result is _MISSING:
+                raise FunctionError(f"Path '{path_or_spec}' not found")
+            if result is None and default is not None:
+                result = default
+        elif default is not None:
+            # Anything else is a glom spec; call the glom library directly,
+            # since glom_extract is rebound to the Terraform function below
+            result = glom.glom(target, path_or_spec, default=default)
         else:
-            result = glom_extract(target, spec)
+            result = glom.glom(target, path_or_spec)
             
-        logger.debug(f"🧰📝✅ Extracted value of type: {type(result).__name__}")
+        logger.debug("🧰📝✅ Extracted value of type: %s", type(result).__name__)
         return result
         
     except Exception as e:
         if default is not None:
-            logger.debug(f"🧰📝⚠️ Extraction failed, returning default: {e}")
+            logger.debug("🧰📝⚠️ Extraction failed, returning default: %r", e)
             return default
         logger.error(f"🧰📝❌ Extraction failed: {e}")
-        raise FunctionError(f"Failed to extract value: {e}")
+        raise FunctionError(f"Failed to extract value: {e}") from e
+
+def extract_many(target: Any, paths: List[Any], default: Any = None) -> list:
+    """
+    Extract several values from a nested structure in one pass.
+    
+    Args:
+        target: The data structure to extract from
+        paths: Path strings with dot notation (or glom specs)
+        default: Value for paths that don't exist
+        
+    Returns:
+        The extracted values, in the order of paths
+    """
+    logger.debug("🧰📝🔄 Extracting %s values", len(paths))
+    
+    if hasattr(target, "value"):  # Handle CTY types
+        target = cty_to_python(target)
+    
+    # String paths share one trie walk; anything else goes through extract_value
+    string_paths = tuple(path for path in paths if isinstance(path, str))
+    values = iter(_extract_paths(target, string_paths))
+    
+    result = []
+    for path in paths:
+        if isinstance(path, str):
+            value = next(values)
+            if value is _MISSING:
+                # The trie only walks dicts and lists; glom also reads
+                # attributes and other sequences, as in extract_value
+                value = glom.glom(target, _compile_path(path), default=_MISSING)
+            if value is _MISSING or (value is None and default is not None):
+                value = default
+        else:
+            value = extract_value(target, path, default=default)
+        result.append(value)
+    return result
+
+def _simple_projection(spec: Any) -> Optional[List[tuple]]:
+    """
+    Recognize transform specs that need no glom machinery.
+    
+    Returns (output_key, path, key_map) entries when every value of a dict
+    spec is a path string, or a (path, [{output_key: path, ...}]) list
+    projection whose inner paths are all strings; key_map is None for plain
+    paths. Returns None for anything else.
+    """
+    if not isinstance(spec, dict):
+        return None
+    
+    projection = []
+    for output_key, sub_spec in spec.items():
+        if isinstance(sub_spec, str):
+            projection.append((output_key, sub_spec, None))
+        elif (isinstance(sub_spec, tuple) and len(sub_spec) == 2
+              and isinstance(sub_spec[0], str)
+              and isinstance(sub_spec[1], list) and len(sub_spec[1]) == 1
+              and isinstance(sub_spec[1][0], dict)
+              and all(isinstance(path, str) for path in sub_spec[1][0].values())):
+            projection.append((output_key, sub_spec[0], sub_spec[1][0]))
+        else:
+            return None
+    return projection
+
+def _project_records(records: Any, key_map: Dict[str, str]) -> Optional[list]:
+    """
+    Build one {output_key: value} row per record, like glom's (path, [{...}]).
+    
+    Returns None when records is not a list or an inner path does not walk,
+    so the caller can leave those inputs to glom.
+    """
+    if not isinstance(records, list):
+        return None
+    
+    # Split the inner paths once for all records
+    columns = [(output_key, _split_path(record_path)) for output_key, record_path in key_map.items()]
+    rows = []
+    for record in records:
+        row = {}
+        for output_key, parts in columns:
+            value = _walk_path(record, parts)
+            if value is _MISSING:
+                return None
+            row[output_key] = value
+        rows.append(row)
+    return rows
+
+def _apply_projection(target: Any, projection: List[tuple]) -> Optional[dict]:
+    """
+    Resolve a _simple_projection over dicts and lists in one path walk.
+    
+    Returns None if any path needs more than dict keys and list indices
+    (attributes, tuples, or a genuinely missing path); glom then applies
+    the spec and reports errors as before.
+    """
+    values = _extract_paths(target, tuple(path for _, path, _ in projection))
+    result = {}
+    for (output_key, path, key_map), value in zip(projection, values):
+        if value is _MISSING:
+            return None
+        if key_map is not None:
+            value = _project_records(value, key_map)
+            if value is None:
+                return None
+        result[output_key] = value
+    return result
 
 def transform_data(target: Any, spec: Any) -> dict:
     """
@@ -361,7 +812,7 @@ def transform_data(target: Any, spec: Any) -> dict:
     Returns:
         Transformed data structure
     """
-    logger.debug(f"🧰📝🔄 Transforming data with spec: {spec}")
+    logger.debug("🧰📝🔄 Transforming data with spec: %s", spec)
     
     try:
         # Ensure target is a compatible type
@@ -375,14 +826,19 @@ def transform_data(target: Any, spec: Any) -> dict:
         if not isinstance(spec, (dict, tuple, list)):
             raise FunctionError(f"Invalid transformation spec: {type(spec).__name__}")
             
-        # Apply the transformation
-        result = glom_extract(target, spec)
-        logger.debug(f"🧰📝✅ Transformation complete: {type(result).__name__}")
+        # Output keys mapped to paths (or list projections) resolve in one
+        # walk over dicts and lists; anything else goes to glom
+        projection = _simple_projection(spec)
+        result = _apply_projection(target, projection) if projection is not None else None
+        if result is None:
+            # Apply the transformation with the glom library directly
+            result = glom.glom(target, spec)
+        logger.debug("🧰📝✅ Transformation complete: %s", type(result).__name__)
         return result
         
     except Exception as e:
         logger.error(f"🧰📝❌ Transformation failed: {e}")
-        raise FunctionError(f"Failed to apply transformation: {e}")
+        raise FunctionError(f"Failed to apply transformation: {e}") from e
 
 def flatten_structure(target: Any, separator: str = ".") -> dict:
     """
@@ -395,7 +851,7 @@ def flatten_structure(target: Any, separator: str = ".") -> dict:
     Returns:
         Flattened dictionary with path keys
     """
-    logger.debug(f"🧰📝🔄 Flattening structure with separator: {separator}")
+    logger.debug("🧰📝🔄 Flattening structure with separator: %s", separator)
     
     # Convert target if it's a CTY type
     if hasattr(target, "value"):
@@ -406,27 +862,9 @@ def flatten_structure(target: Any, separator: str = ".") -> dict:
         logger.warning(f"🧰📝⚠️ Cannot flatten {type(target).__name__}, returning empty dict")
         return {}
         
-    # Recursive function to flatten
-    def _flatten(obj, parent_key="", sep=separator):
-        items = []
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                new_key = f"{parent_key}{sep}{k}" if parent_key else str(k)
-                if isinstance(v, (dict, list)) and v:  # Skip empty containers
-                    items.extend(_flatten(v, new_key, sep).items())
-                else:
-                    items.append((new_key, v))
-        elif isinstance(obj, list):
-            for i, v in enumerate(obj):
-                new_key = f"{parent_key}{sep}{i}" if parent_key else str(i)
-                if isinstance(v, (dict, list)) and v:  # Skip empty containers
-                    items.extend(_flatten(v, new_key, sep).items())
-                else:
-                    items.append((new_key, v))
-        return dict(items)
-    
-    result = _flatten(target)
-    logger.debug(f"🧰📝✅ Flattening complete: {len(result)} keys")
+    # Iterative walk; keys are joined once per leaf
+    result = _flatten_iter(target, separator)
+    logger.debug("🧰📝✅ Flattening complete: %s keys", len(result))
     return result
 
 def path_exists(target: Any, path: str) -> bool:
@@ -440,17 +878,24 @@ def path_exists(target: Any, path: str) -> bool:
     Returns:
         True if path exists, False otherwise
     """
-    logger.debug(f"🧰📝🔄 Checking if path exists: {path}")
+    logger.debug("🧰📝🔄 Checking if path exists: %s", path)
     
     try:
-        # Use a sentinel value to distinguish between None and not found
-        sentinel = object()
-        result = extract_value(target, path, default=sentinel)
-        exists = result is not sentinel
-        logger.debug(f"🧰📝✅ Path {'exists' if exists else 'does not exist'}")
+        if isinstance(path, str):
+            # Walk the cached parts; a null value exists, but a path
+            # through a null parent does not
+            if hasattr(target, "value"):  # Handle CTY types
+                target = cty_to_python(target)
+            exists = _walk_path(target, _split_path(path)) is not _MISSING
+        else:
+            # Use a sentinel value to distinguish between None and not found
+            sentinel = object()
+            result = extract_value(target, path, default=sentinel)
+            exists = result is not sentinel
+        logger.debug("🧰📝✅ Path %s", 'exists' if exists else 'does not exist')
         return exists
     except Exception:
-        logger.debug(f"🧰📝⚠️ Error checking path, assuming it doesn't exist")
+        logger.debug("🧰📝⚠️ Error checking path, assuming it doesn't exist")
         return False
 
 def _resolve_path(path: Any) -> Union[list, Path]:
@@ -463,7 +908,7 @@ def _resolve_path(path: Any) -> Union[list, Path]:
     Returns:
         Resolved path as list or Path object
     """
-    logger.debug(f"🧰🔄🔍 Resolving path: {path}")
+    logger.debug("🧰🔄🔍 Resolving path: %s", path)
     
     if isinstance(path, str):
         # Convert numeric parts to integers
@@ -495,64 +940,53 @@ def validate_structure(target: Any, schema: Any, exact_match: bool = False,
     Returns:
         Bool or (bool, list) if return_errors is True
     """
-    logger.debug(f"🧰📝🔄 Validating structure (exact_match={exact_match})")
+    logger.debug("🧰📝🔄 Validating structure (exact_match=%s)", exact_match)
     
     errors = []
     
-    def _validate_dict(data, schema_dict, path=""):
-        valid = True
-        
-        # Convert data if it's a CTY type
-        if hasattr(data, "value"):
-            data = cty_to_python(data)
-            
-        # Check required fields in schema
-        for key, expected_type in schema_dict.items():
-            key_path = f"{path}.{key}" if path else key
-            
-            if isinstance(expected_type, dict):
-                # Nested schema
-                if key not in data:
-                    errors.append(f"Missing required field: {key_path}")
-                    valid = False
-                    continue
-                    
-                if not isinstance(data[key], dict):
-                    errors.append(f"{key_path} should be a dict, got {type(data[key]).__name__}")
-                    valid = False
-                    continue
-                    
-                # Recursive validation
-                valid = _validate_dict(data[key], expected_type, key_path) and valid
-                
-            else:
-                # Type checking
-                if key not in data:
-                    errors.append(f"Missing required field: {key_path}")
-                    valid = False
-                    continue
-                
-                if not isinstance(data[key], expected_type):
-                    errors.append(f"{key_path} should be {expected_type.__name__}, got {type(data[key]).__name__}")
-                    valid = False
-        
-        # Check for unexpected fields if exact match required
-        if exact_match:
-            for key in data:
-                key_path = f"{path}.{key}" if path else key
-                if key not in schema_dict:
-                    errors.append(f"Unexpected field: {key_path}")
-                    valid = False
-        
-        return valid
-    
     if not isinstance(target, dict) or not isinstance(schema, dict):
         errors.append("Both target and schema must be dictionaries")
         if return_errors:
             return False, errors
         return False
     
-    valid = _validate_dict(target, schema)
+    # Run the schema's precompiled steps; slots hold the data dict matched
+    # to each nested schema, or _MISSING when that level failed validation
+    slot_count, steps = _compile_schema(schema)
+    slots = [_MISSING] * slot_count
+    slots[0] = target
+    valid = True
+    
+    # Loop-invariant names bound locally (LOAD_FAST instead of global lookups)
+    missing = _MISSING
+    add_error = errors.append
+    is_instance = isinstance
+    
+    for step in steps:
+        data = slots[step[1]]
+        if data is missing:
+            continue
+        
+        if step[0] == "field":
+            _, _, key, expected_type, child_slot, missing_error, type_error_prefix = step
+            value = data.get(key, missing)
+            if value is missing:
+                add_error(missing_error)
+                valid = False
+            elif not is_instance(value, expected_type):
+                add_error(type_error_prefix + type(value).__name__)
+                valid = False
+            elif child_slot is not None:
+                slots[child_slot] = value
+        
+        # Check for unexpected fields if exact match required
+        elif exact_match:
+            _, _, path, schema_keys = step
+            for key in data:
+                if key not in schema_keys:
+                    key_path = f"{path}.{key}" if path else key
+                    errors.append(f"Unexpected field: {key_path}")
+                    valid = False
     
     if return_errors:
         return valid, errors
@@ -570,7 +1004,7 @@ def merge_structures(*structures, overwrite: bool = True, append_lists: bool = F
     Returns:
         Merged structure
     """
-    logger.debug(f"🧰📝🔄 Merging {len(structures)} structures")
+    logger.debug("🧰📝🔄 Merging %s structures", len(structures))
     
     if not structures:
         raise FunctionError("At least one structure is required for merging")
@@ -580,27 +1014,32 @@ def merge_structures(*structures, overwrite: bool = True, append_lists: bool = F
         if not isinstance(struct, dict):
             raise FunctionError(f"All structures must be dictionaries, got {type(struct).__name__} for structure {i}")
     
-    # Helper for deep merge
-    def deep_merge(a, b):
-        result = a.copy()
-        for k, v in b.items():
-            if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-                # Recursive merge for nested dicts
-                result[k] = deep_merge(result[k], v)
-            elif k in result and isinstance(result[k], list) and isinstance(v, list) and append_lists:
-                # Append lists instead of replacing
-                result[k] = result[k] + v
-            elif k not in result or overwrite:
-                # Add new keys or overwrite existing values
-                result[k] = v
-        return result
-    
-    # Apply merges sequentially
-    result = structures[0].copy()
+    # Merge each source into one result with an explicit stack of
+    # (destination, source) dict pairs. Nested dicts are copied the first
+    # time they are merged into, so the inputs are never mutated and
+    # dicts already owned by the result are not copied again.
+    result = dict(structures[0])
+    owned = {id(result)}
     for source in structures[1:]:
-        result = deep_merge(result, source)
-    
-    logger.debug(f"🧰📝✅ Structures merged successfully")
+        stack = [(result, source)]
+        while stack:
+            dst, src = stack.pop()
+            for k, v in src.items():
+                existing = dst.get(k, _MISSING)
+                if isinstance(existing, dict) and isinstance(v, dict):
+                    if id(existing) not in owned:
+                        existing = dict(existing)
+                        owned.add(id(existing))
+                        dst[k] = existing
+                    stack.append((existing, v))
+                elif isinstance(existing, list) and isinstance(v, list) and append_lists:
+                    # Append lists instead of replacing
+                    dst[k] = existing + v
+                elif existing is _MISSING or overwrite:
+                    # Add new keys or overwrite existing values
+                    dst[k] = v
+    
+    logger.debug("🧰📝✅ Structures merged successfully")
     return result
 
 def filter_structure(target: Any, include_keys: List[str] = None, exclude_keys: List[str] = None,
@@ -618,48 +1057,49 @@ def filter_structure(target: Any, include_keys: List[str] = None, exclude_keys:
     Returns:
         Filtered structure
     """
-    logger.debug(f"🧰📝🔄 Filtering structure")
+    logger.debug("🧰📝🔄 Filtering structure")
     
-    include_keys = include_keys or []
-    exclude_keys = exclude_keys or []
-    value_types = value_types or []
+    # Normalize the criteria once: sets for key membership, a type tuple
+    # for a single isinstance call. Paths are only tracked for the predicate.
+    include_keys = frozenset(include_keys) if include_keys else None
+    exclude_keys = frozenset(exclude_keys) if exclude_keys else None
+    value_types = tuple(value_types) if value_types else None
+    track_path = predicate is not None
     
     # Convert target if it's a CTY type
     if hasattr(target, "value"):
         target = cty_to_python(target)
     
-    def filter_node(obj, path=None):
-        path = path or []
-        
+    def filter_node(obj, path):
         if isinstance(obj, dict):
             result = {}
             for k, v in obj.items():
                 # Skip excluded keys
-                if k in exclude_keys:
+                if exclude_keys is not None and k in exclude_keys:
                     continue
                 
+                child_path = path + [k] if track_path else None
+                
                 # Check include keys if specified
-                if include_keys and k not in include_keys:
+                if include_keys is not None and k not in include_keys:
                     # Still check nested structures for included keys
                     if isinstance(v, (dict, list)):
-                        filtered = filter_node(v, path + [k])
+                        filtered = filter_node(v, child_path)
                         if filtered: # Not empty
                             result[k] = filtered
                     continue
                 
                 # Type checking
-                if value_types and not any(isinstance(v, t) for t in value_types):
+                if value_types is not None and not isinstance(v, value_types):
                     continue
                 
                 # Check predicate
-                if predicate and not predicate(path + [k], v):
+                if track_path and not predicate(child_path, v):
                     continue
                 
                 # Recursive filtering for collections
                 if isinstance(v, (dict, list)):
-                    filtered = filter_node(v, path + [k])
-                    if filtered is not None:  # Could be empty dict/list
-                        result[k] = filtered
+                    result[k] = filter_node(v, child_path)
                 else:
                     result[k] = v
                     
@@ -669,18 +1109,18 @@ def filter_structure(target: Any, include_keys: List[str] = None, exclude_keys:
             result = []
             for i, v in enumerate(obj):
                 # Type checking
-                if value_types and not any(isinstance(v, t) for t in value_types):
+                if value_types is not None and not isinstance(v, value_types):
                     continue
                 
+                child_path = path + [i] if track_path else None
+                
                 # Check predicate
-                if predicate and not predicate(path + [i], v):
+                if track_path and not predicate(child_path, v):
                     continue
                 
                 # Recursive filtering
                 if isinstance(v, (dict, list)):
-                    filtered = filter_node(v, path + [i])
-                    if filtered is not None:
-                        result.append(filtered)
+                    result.append(filter_node(v, child_path))
                 else:
                     result.append(v)
                     
@@ -690,10 +1130,75 @@ def filter_structure(target: Any, include_keys: List[str] = None, exclude_keys:
             # Simple value - already passed checks
             return obj
     
-    result = filter_node(target)
-    logger.debug(f"🧰📝✅ Filtering complete")
+    result = filter_node(target, [] if track_path else None)
+    logger.debug("🧰📝✅ Filtering complete")
     return result
 
+def _to_cty_string(value: Any, cty_type: Any) -> Any:
+    return CtyString(str(value))
+
+def _to_cty_number(value: Any, cty_type: Any) -> Any:
+    return CtyNumber(float(value))
+
+def _to_cty_bool(value: Any, cty_type: Any) -> Any:
+    return CtyBool(bool(value))
+
+def _to_cty_list(value: Any, cty_type: Any) -> Any:
+    element_type = getattr(cty_type, "element_type", None)
+    if not isinstance(value, list):
+        value = [value]
+    # Resolve the element converter once for the whole list
+    convert_element = _to_cty_converter(element_type)
+    elements = [None if v is None else convert_element(v, element_type) for v in value]
+    return CtyList(element_type=element_type, elements=elements)
+
+def _to_cty_map(value: Any, cty_type: Any) -> Any:
+    if not isinstance(value, dict):
+        logger.warning(f"🧰📝⚠️ Expected dict for CtyMap, got {type(value).__name__}")
+        return CtyMap(key_type=CtyString(), value_type=getattr(cty_type, "value_type", None))
+        
+    key_type = getattr(cty_type, "key_type", CtyString())
+    value_type = getattr(cty_type, "value_type", None)
+    convert_key = _to_cty_converter(key_type)
+    convert_value = _to_cty_converter(value_type)
+    
+    elements = {}
+    for k, v in value.items():
+        key = None if k is None else convert_key(k, key_type)
+        elements[key] = None if v is None else convert_value(v, value_type)
+        
+    return CtyMap(key_type=key_type, value_type=value_type, elements=elements)
+
+def _to_cty_default(value: Any, cty_type: Any) -> Any:
+    # Default to using constructor
+    try:
+        return cty_type.__class__(value)
+    except Exception as e:
+        logger.error(f"🧰📝❌ Failed to convert to {cty_type.__class__.__name__}: {e}")
+        return None
+
+# CTY type class -> converter(value, cty_type); subclasses are resolved
+# through the MRO on first use and added to the table
+_TO_CTY_CONVERTERS: Dict[type, Callable[[Any, Any], Any]] = {
+    CtyString: _to_cty_string,
+    CtyNumber: _to_cty_number,
+    CtyBool: _to_cty_bool,
+    CtyList: _to_cty_list,
+    CtyMap: _to_cty_map,
+}
+
+def _to_cty_converter(cty_type: Any) -> Callable[[Any, Any], Any]:
+    """Return the converter for a CTY type instance."""
+    type_class = type(cty_type)
+    converter = _TO_CTY_CONVERTERS.get(type_class)
+    if converter is None:
+        converter = next(
+            (_TO_CTY_CONVERTERS[base] for base in type_class.__mro__ if base in _TO_CTY_CONVERTERS),
+            _to_cty_default,
+        )
+        _TO_CTY_CONVERTERS[type_class] = converter
+    return converter
+
 def convert_to_terraform_value(value: Any, cty_type: Any) -> Any:
     """
     Convert a Python value to a Terraform CTY value.
@@ -705,49 +1210,498 @@ def convert_to_terraform_value(value: Any, cty_type: Any) -> Any:
     Returns:
         Converted CTY value
     """
-    logger.debug(f"🧰📝🔄 Converting to Terraform type: {cty_type.__class__.__name__}")
+    logger.debug("🧰📝🔄 Converting to Terraform type: %s", cty_type.__class__.__name__)
     
     if value is None:
         return None
+    
+    return _to_cty_converter(cty_type)(value, cty_type)
+
+# --- Filter Conditions ---
+
+def _path_extractor(path: Optional[str]) -> Optional[Callable[[Any], Any]]:
+    """
+    Build a one-argument extractor for a dot-notation path.
+    
+    Single-segment paths on dicts are plain item lookups; deeper paths are
+    resolved through a Path built once up front. Returns None for an empty
+    path. Missing paths yield _MISSING instead of raising.
+    """
+    if not path:
+        return None
+    
+    parts = path.split('.')
+    
+    # Call the glom library directly; glom_extract is rebound to the
+    # pyvider_glom Terraform function further down this module.
+    if len(parts) == 1:
+        key = parts[0]
         
-    # Handle primitive types
-    if isinstance(cty_type, CtyString):
-        return CtyString(str(value))
-    elif isinstance(cty_type, CtyNumber):
-        return CtyNumber(float(value))
-    elif isinstance(cty_type, CtyBool):
-        return CtyBool(bool(value))
-        
-    # Handle collections
-    elif isinstance(cty_type, CtyList):
-        element_type = getattr(cty_type, "element_type", None)
-        if not isinstance(value, list):
-            value = [value]
-        elements = [convert_to_terraform_value(v, element_type) for v in value]
-        return CtyList(element_type=element_type, elements=elements)
+        def extract(item):
+            if isinstance(item, dict):
+                return item.get(key, _MISSING)
+            if isinstance(item, list):
+                try:
+                    return item[int(key)]
+                except (ValueError, IndexError):
+                    return _MISSING
+            return glom.glom(item, key, default=_MISSING)
         
-    elif isinstance(cty_type, CtyMap):
-        if not isinstance(value, dict):
-            logger.warning(f"🧰📝⚠️ Expected dict for CtyMap, got {type(value).__name__}")
-            return CtyMap(key_type=CtyString(), value_type=getattr(cty_type, "value_type", None))
-            
-        key_type = getattr(cty_type, "key_type", CtyString())
-        value_type = getattr(cty_type, "value_type", None)
-        
-        elements = {}
-        for k, v in value.items():
-            key = convert_to_terraform_value(k, key_type)
-            val = convert_to_terraform_value(v, value_type)
-            elements[key] = val
-            
-        return CtyMap(key_type=key_type, value_type=value_type, elements=elements)
+        return extract
+    
+    spec = Path(*parts)
+    return lambda item: glom.glom(item, spec, default=_MISSING)
+
+def _is_truthy(T: Any) -> bool:
+    """Terraform-style truthiness used by the default "T" filter condition."""
+    # Truthy check - empty collections are falsy
+    if isinstance(T, (list, dict)):
+        return bool(T)
+    # None is falsy
+    if T is None:
+        return False
+    # Bool is directly usable
+    if isinstance(T, bool):
+        return T
+    # Numbers - 0 is falsy
+    if isinstance(T, (int, float)):
+        return T != 0
+    # Strings - empty is falsy
+    if isinstance(T, str):
+        return bool(T)
+    # Default to truthy
+    return True
+
+# Common conditions are dispatched directly instead of being evaluated
+_BUILTIN_CONDITIONS: Dict[str, Callable[[Any], bool]] = {
+    "T": _is_truthy,
+    "T != null": lambda T: T is not None,
+    "T == null": lambda T: T is None,
+    "T > 0": lambda T: isinstance(T, (int, float)) and T > 0,
+    "T >= 0": lambda T: isinstance(T, (int, float)) and T >= 0,
+    "T < 0": lambda T: isinstance(T, (int, float)) and T < 0,
+    "T <= 0": lambda T: isinstance(T, (int, float)) and T <= 0,
+}
+
+# Builtins visible to custom filter/validation expressions
+_EXPRESSION_BUILTINS = {
+    "len": len, "abs": abs, "min": min, "max": max, "sum": sum,
+    "any": any, "all": all, "str": str, "int": int, "float": float,
+    "bool": bool, "isinstance": isinstance,
+    "list": list, "dict": dict, "True": True, "False": False, "None": None,
+}
+
+# Attributes that read object internals even without a leading underscore
+_BLOCKED_EXPRESSION_ATTRIBUTES = frozenset({"format", "format_map"})
+
+@lru_cache(maxsize=256)
+def _compile_expression(expr: str, name: str) -> Callable[[Any], Any]:
+    """
+    Compile a custom expression once and return an evaluator for it.
+    
+    The evaluator binds its single argument to ``name`` and exposes only a
+    small set of builtins. Attribute access to underscore names (and to
+    str.format, which reaches them through format fields) is rejected, so
+    ``().__class__.__mro__`` style escapes do not compile. This narrows
+    what an expression can reach but is not a sandbox: expressions must
+    come from trusted configuration. Raises SyntaxError if the expression
+    cannot be compiled or uses a rejected attribute.
+    """
+    tree = ast.parse(expr, f"<{name} expression>", "eval")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and (
+            node.attr.startswith("_") or node.attr in _BLOCKED_EXPRESSION_ATTRIBUTES
+        ):
+            raise SyntaxError(f"Attribute '{node.attr}' is not allowed in expressions")
+    code = compile(tree, f"<{name} expression>", "eval")
+    scope = {"__builtins__": _EXPRESSION_BUILTINS}
+    
+    def evaluate(arg):
+        return eval(code, scope, {name: arg})
+    
+    return evaluate
+
+def _compile_condition(expr: str) -> Callable[[Any], Any]:
+    """Compile a custom filter condition, which sees the value as ``T``."""
+    return _compile_expression(expr, "T")
+
+# --- Validation ---
+
+def _never(value: Any) -> bool:
+    return False
+
+# Rule "type" name -> check; bools are not numbers even though bool is an int
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+    "null": lambda value: value is None,
+    "any": lambda value: True,
+}
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> "re.Pattern":
+    """Compile a validation regex once per distinct pattern string."""
+    return re.compile(pattern)
+
+def _pattern_matcher(pattern: Any) -> Callable[[str], bool]:
+    """Return a match predicate; invalid patterns never match."""
+    try:
+        match = _compile_pattern(pattern).match
+    except Exception:
+        return _never
+    return lambda value: match(value) is not None
+
+def _compile_rule(field_path: str, rule_set: Dict[str, Any]) -> tuple:
+    """
+    Compile one field's rules into (field_path, required, checks).
+
+    Each check takes the field value and returns None when it passes, or a
+    ("errors" | "warnings", message) pair. Checks run in the order the rules
+    were historically interpreted and the first failure wins.
+    """
+    checks = []
+    
+    if "type" in rule_set:
+        expected_type = rule_set["type"]
+        type_check = _TYPE_CHECKS.get(expected_type, _never)
+        
+        def check_type(value):
+            if value is not None and not type_check(value):
+                return "errors", f"Expected type '{expected_type}', got '{type(value).__name__}'"
+        checks.append(check_type)
+    
+    # Numbers are bounded by value, strings and arrays by length
+    if "min" in rule_set:
+        minimum = rule_set["min"]
+        
+        def check_min(value):
+            if isinstance(value, (int, float)):
+                if value < minimum:
+                    return "errors", f"Value {value} is less than minimum {minimum}"
+            elif isinstance(value, (str, list)) and len(value) < minimum:
+                return "errors", f"Length {len(value)} is less than minimum {minimum}"
+        checks.append(check_min)
+    
+    if "max" in rule_set:
+        maximum = rule_set["max"]
+        
+        def check_max(value):
+            if isinstance(value, (int, float)):
+                if value > maximum:
+                    return "errors", f"Value {value} is greater than maximum {maximum}"
+            elif isinstance(value, (str, list)) and len(value) > maximum:
+                return "errors", f"Length {len(value)} is greater than maximum {maximum}"
+        checks.append(check_max)
+    
+    if "pattern" in rule_set:
+        pattern = rule_set["pattern"]
+        matches = _pattern_matcher(pattern)
+        
+        def check_pattern(value):
+            if isinstance(value, str) and not matches(value):
+                return "errors", f"Value doesn't match pattern '{pattern}'"
+        checks.append(check_pattern)
+    
+    if isinstance(rule_set.get("values"), list):
+        allowed_values = rule_set["values"]
+        
+        def check_values(value):
+            if value is not None and value not in allowed_values:
+                return "errors", f"Value '{value}' not in allowed values: {allowed_values}"
+        checks.append(check_values)
+    
+    if "custom" in rule_set:
+        custom_expr = rule_set["custom"]
+        
+        def check_custom(value):
+            if value is None:
+                return None
+            try:
+                # Evaluate the (cached) expression with the field as `value`
+                if not _compile_expression(custom_expr, "value")(value):
+                    return "errors", f"Failed custom validation: {custom_expr}"
+            except Exception as e:
+                logger.error(f"🧰📝❌ Error in custom validation for '{field_path}': {e}")
+                return "warnings", f"Invalid validation rule: {e}"
+        checks.append(check_custom)
+    
+    return field_path, bool(rule_set.get("required", False)), tuple(checks)
+
+def _freeze(value: Any) -> Any:
+    """
+    Build a hashable form of a nested dict/list value that compares equal
+    exactly when the values do, keeping dict order and leaf types.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(map(_freeze, value)))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(map(_freeze, value)))
+    return (type(value), value)
+
+def _structural_cache(maxsize: int) -> Callable:
+    """
+    Cache a one-argument compile function on the contents of its argument.
+
+    For compiled forms of dicts, which are not hashable themselves. The key
+    is the argument's _freeze() form, so a dict mutated in place is compiled
+    afresh and equal dicts share one compiled form. Arguments holding
+    unhashable leaves are compiled on every call. The oldest entry is
+    evicted once maxsize is reached.
+    """
+    def decorator(compile_fn):
+        cache: Dict[Any, Any] = {}
         
-    # Default to using constructor
+        def cached(obj):
+            key = _freeze(obj)
+            try:
+                compiled = cache.get(key, _MISSING)
+            except TypeError:
+                return compile_fn(obj)
+            if compiled is not _MISSING:
+                return compiled
+            compiled = compile_fn(obj)
+            if len(cache) >= maxsize:
+                # Evict the oldest entry (dicts keep insertion order)
+                del cache[next(iter(cache))]
+            cache[key] = compiled
+            return compiled
+        
+        cached.cache = cache
+        cached.__wrapped__ = compile_fn
+        cached.__doc__ = compile_fn.__doc__
+        return cached
+    return decorator
+
+@_structural_cache(maxsize=64)
+def _compile_ruleset(rules: Dict[str, Any]) -> tuple:
+    """
+    Compile a glom_validate rule set once into (bulk_spec, fields).
+
+    bulk_spec extracts every ruled field in one glom call, yielding _MISSING
+    for absent fields so they can be told apart from nulls. Fields resolve
+    through _lookup_path, the same as in extract_value. Reused for rules
+    with the same contents.
+    """
+    compiled = []
+    for field_path, rule_set in rules.items():
+        # Skip invalid rules
+        if not isinstance(rule_set, dict):
+            logger.warning(f"🧰📝⚠️ Rule for '{field_path}' is not a dictionary, skipping")
+            continue
+        compiled.append(_compile_rule(field_path, rule_set))
+    bulk_spec = {
+        field_path: partial(_lookup_path, field_path)
+        for field_path, _, _ in compiled
+    }
+    return bulk_spec, tuple(compiled)
+
+@_structural_cache(maxsize=64)
+def _compile_schema(schema: Dict[str, Any]) -> tuple:
+    """
+    Flatten a validate_structure schema into a tuple of steps, once per schema.
+
+    Nested schema dicts are numbered as slots (the target is slot 0) in
+    depth-first order. Steps are ("field", slot, key, expected, child_slot,
+    missing_error, type_error_prefix) for each schema entry, where
+    child_slot is set for nested schemas and expected is then dict, followed
+    by ("exact", slot, path, keys) once a level's entries are done. Error
+    messages are built here, so a failing field only appends the actual
+    type name. Steps on a slot whose data failed validation are skipped at
+    run time.
+    """
+    steps = []
+    slot_count = 1
+    # (slot, path, schema dict, schema items iterator) frames
+    stack = [(0, "", schema, iter(schema.items()))]
+    while stack:
+        slot, path, level, items = stack[-1]
+        for key, expected_type in items:
+            key_path = f"{path}.{key}" if path else key
+            missing_error = f"Missing required field: {key_path}"
+            if isinstance(expected_type, dict):
+                child_slot = slot_count
+                slot_count += 1
+                steps.append(("field", slot, key, dict, child_slot, missing_error,
+                              f"{key_path} should be a dict, got "))
+                stack.append((child_slot, key_path, expected_type, iter(expected_type.items())))
+                break
+            type_name = getattr(expected_type, "__name__", repr(expected_type))
+            steps.append(("field", slot, key, expected_type, None, missing_error,
+                          f"{key_path} should be {type_name}, got "))
+        else:
+            stack.pop()
+            steps.append(("exact", slot, path, frozenset(level)))
+    return slot_count, tuple(steps)
+
+# --- Transform Pipeline ---
+
+def _transform_length(value: Any) -> int:
+    return len(value) if hasattr(value, "__len__") else 0
+
+def _transform_sort(value: list) -> list:
     try:
-        return cty_type.__class__(value)
+        return sorted(value)
+    except TypeError:
+        logger.error(f"🧰📝❌ Cannot sort heterogeneous list")
+        raise FunctionError("Cannot sort list with mixed types")
+
+def _transform_reverse(value: Any) -> Any:
+    if isinstance(value, (list, str)):
+        return value[::-1]
+    logger.error(f"🧰📝❌ Cannot reverse {type(value).__name__}")
+    raise FunctionError(f"Cannot reverse {type(value).__name__}")
+
+def _transform_sum(value: list) -> Any:
+    # Floats get a correctly rounded sum; ints (and anything else) use sum()
+    value_types = set(map(type, value))
+    if float in value_types and value_types <= {int, float}:
+        return math.fsum(value)
+    try:
+        return sum(value)
+    except TypeError:
+        logger.error(f"🧰📝❌ Cannot sum non-numeric list")
+        raise FunctionError("Cannot sum list with non-numeric elements")
+
+def _transform_join(separator: str, value: list) -> str:
+    try:
+        return separator.join(str(v) for v in value)
     except Exception as e:
-        logger.error(f"🧰📝❌ Failed to convert to {cty_type.__class__.__name__}: {e}")
-        return None
+        logger.error(f"🧰📝❌ Join failed: {e}")
+        raise FunctionError(f"Join failed: {e}") from e
+
+def _transform_split(separator: str, value: str) -> list:
+    return value.split(separator)
+
+# Transform name -> (accepted input types or None for any, operation).
+# Keys are interned so lookups of interned step names compare by identity.
+_TRANSFORMS: Dict[str, tuple] = {
+    "lower": (str, str.lower),
+    "upper": (str, str.upper),
+    "title": (str, str.title),
+    "length": (None, _transform_length),
+    "keys": (dict, lambda value: list(value.keys())),
+    "values": (dict, lambda value: list(value.values())),
+    "sort": (list, _transform_sort),
+    "reverse": (None, _transform_reverse),
+    "sum": (list, _transform_sum),
+}
+_TRANSFORMS = {sys.intern(name): entry for name, entry in _TRANSFORMS.items()}
+
+@lru_cache(maxsize=256)
+def _compile_pipeline(transforms: str) -> tuple:
+    """
+    Parse a pipe-separated transform string into (name, accepts, op) steps.
+    
+    Unknown transforms compile to a step that accepts nothing, so the
+    pipeline fails at that step with the type of the value it received.
+    """
+    steps = []
+    for name in transforms.split('|'):
+        # Interned names hit the identity fast path in the table lookup
+        name = sys.intern(name.strip())
+        entry = _TRANSFORMS.get(name)
+        if entry is not None:
+            accepts, op = entry
+            steps.append((name, accepts, op))
+        elif name.startswith("join:"):
+            steps.append((name, list, partial(_transform_join, name[5:])))
+        elif name.startswith("split:"):
+            steps.append((name, str, partial(_transform_split, name[6:])))
+        else:
+            steps.append((name, (), None))
+    return tuple(steps)
+
+# --- Format Converters ---
+
+def _require_string(value: Any, action: str) -> None:
+    if not isinstance(value, str):
+        logger.error(f"🧰📝❌ Input must be a string for {action}")
+        raise FunctionError(f"Input must be a string for {action}")
+
+def _require_yaml() -> None:
+    if yaml is None:
+        logger.error(f"🧰📝❌ PyYAML is required for YAML conversion")
+        raise FunctionError("PyYAML is required for YAML conversion")
+
+def _convert_to_json(data: Any, options: Dict[str, Any]) -> str:
+    result = json.dumps(data, indent=options.get("indent", 2), sort_keys=options.get("sort_keys", False))
+    logger.debug("🧰📝✅ Converted to JSON: %s characters", len(result))
+    return result
+
+def _convert_from_json(data: Any, options: Dict[str, Any]) -> Any:
+    _require_string(data, "JSON parsing")
+    result = _json_loads(data)
+    logger.debug("🧰📝✅ Parsed JSON to %s", type(result).__name__)
+    return result
+
+def _convert_to_yaml(data: Any, options: Dict[str, Any]) -> str:
+    _require_yaml()
+    result = yaml.dump(
+        data,
+        Dumper=_YAML_DUMPER,
+        default_flow_style=options.get("default_flow_style", False),
+        indent=options.get("indent", 2),
+    )
+    logger.debug("🧰📝✅ Converted to YAML: %s characters", len(result))
+    return result
+
+def _convert_from_yaml(data: Any, options: Dict[str, Any]) -> Any:
+    _require_yaml()
+    _require_string(data, "YAML parsing")
+    result = yaml.load(data, Loader=_YAML_LOADER)
+    logger.debug("🧰📝✅ Parsed YAML to %s", type(result).__name__)
+    return result
+
+def _convert_to_base64(data: Any, options: Dict[str, Any]) -> str:
+    # Non-string input is encoded as its JSON text
+    if not isinstance(data, str):
+        data = json.dumps(data)
+    result = binascii.b2a_base64(data.encode('utf-8'), newline=False).decode('ascii')
+    logger.debug("🧰📝✅ Encoded to base64: %s characters", len(result))
+    return result
+
+def _convert_from_base64(data: Any, options: Dict[str, Any]) -> Any:
+    _require_string(data, "base64 decoding")
+    try:
+        # First decode the base64
+        decoded = binascii.a2b_base64(data).decode('utf-8')
+        
+        # Then try to parse as JSON if it looks like JSON; one lstrip and
+        # a first-character check (JSON parsers skip surrounding whitespace)
+        if decoded.lstrip()[:1] in ('{', '['):
+            try:
+                result = _json_loads(decoded)
+                logger.debug("🧰📝✅ Decoded base64 to JSON object")
+                return result
+            except json.JSONDecodeError:
+                # Not valid JSON, return the string
+                pass
+        
+        logger.debug("🧰📝✅ Decoded base64 to string: %s characters", len(decoded))
+        return decoded
+    except Exception as e:
+        logger.error(f"🧰📝❌ Failed to decode base64: {e}")
+        raise FunctionError(f"Failed to decode base64: {e}") from e
+
+# glom_convert format name -> handler(data, options)
+_CONVERTERS: Dict[str, Callable[[Any, Dict[str, Any]], Any]] = {
+    "to_json": _convert_to_json,
+    "from_json": _convert_from_json,
+    "to_yaml": _convert_to_yaml,
+    "from_yaml": _convert_from_yaml,
+    "to_base64": _convert_to_base64,
+    "from_base64": _convert_from_base64,
+}
+
+# Parsing formats take the raw string; ensure_glom_compatible would already
+# parse JSON-looking input (which the parsers then reject)
+_RAW_INPUT_FORMATS = frozenset({"from_json", "from_yaml", "from_base64"})
+
 # --- Terraform Functions ---
 
 @register_function(
@@ -788,43 +1742,43 @@ def convert_to_terraform_value(value: Any, cty_type: Any) -> Any:
 )
 def glom_extract(target: CtyDynamic, spec: CtyDynamic, default: CtyDynamic = None) -> CtyDynamic:
     """Extract data from a complex nested structure using glom specifications."""
-    logger.debug(f"🧰📝🔄 Glom extract called with spec: {spec}")
+    logger.debug("🧰📝🔄 Glom extract called with spec: %s", spec)
     
     try:
         # Convert inputs to Python types glom can work with
-        py_target = ensure_glom_compatible(target)
+        py_target = _cached_glom_compatible(target)
         py_spec = ensure_glom_compatible(spec)
         py_default = ensure_glom_compatible(default) if default is not None else None
         
-        logger.debug(f"🧰🔍🔄 Converted target type: {type(py_target).__name__}")
-        logger.debug(f"🧰🔍🔄 Converted spec type: {type(py_spec).__name__}")
+        logger.debug("🧰🔍🔄 Converted target type: %s", type(py_target).__name__)
+        logger.debug("🧰🔍🔄 Converted spec type: %s", type(py_spec).__name__)
         
         # Create a proper glom spec
         glom_spec = create_glom_spec(py_spec)
-        logger.debug(f"🧰🔍🔄 Created glom spec: {glom_spec}")
+        logger.debug("🧰🔍🔄 Created glom spec: %s", glom_spec)
         
         # Apply glom with the appropriate args
         if py_default is not None:
             result = glom_extract(py_target, glom_spec, default=py_default)
-            logger.debug(f"🧰📝✅ Glom extract with default successful: {type(result).__name__}")
+            logger.debug("🧰📝✅ Glom extract with default successful: %s", type(result).__name__)
         else:
             result = glom_extract(py_target, glom_spec)
-            logger.debug(f"🧰📝✅ Glom extract successful: {type(result).__name__}")
+            logger.debug("🧰📝✅ Glom extract successful: %s", type(result).__name__)
         
         # Convert result back to CTY
         cty_result = python_to_cty(result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except GlomError as e:
         error_msg = format_glom_error(e)
         ### logger.error(f"🧰📝❌ Glom extract failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
     except Exception as e:
         error_msg = f"Extraction failed: {e} ({type(e).__name__})"
         ###logger.error(f"🧰📝❌ Glom extract failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_path",
@@ -850,41 +1804,41 @@ def glom_extract(target: CtyDynamic, spec: CtyDynamic, default: CtyDynamic = Non
 )
 def glom_path(target: CtyDynamic, path: CtyString, default: CtyDynamic = None) -> CtyDynamic:
     """Extract a value from a nested structure using a path with dot notation."""
-    logger.debug(f"🧰📝🔄 Glom path called with path: {path}")
+    logger.debug("🧰📝🔄 Glom path called with path: %s", path)
     
     try:
         # Convert inputs to Python types glom can work with
-        py_target = ensure_glom_compatible(target)
+        py_target = _cached_glom_compatible(target)
         py_path = cty_to_python(path)
         py_default = ensure_glom_compatible(default) if default is not None else None
         
-        logger.debug(f"🧰🔍🔄 Converted target type: {type(py_target).__name__}")
+        logger.debug("🧰🔍🔄 Converted target type: %s", type(py_target).__name__)
         
         # Create Path object for the dot notation
         if isinstance(py_path, str):
             glom_path = Path(*py_path.split('.'))
-            logger.debug(f"🧰🔍🔄 Converted string path to Path: {glom_path}")
+            logger.debug("🧰🔍🔄 Converted string path to Path: %s", glom_path)
         else:
             glom_path = py_path
         
         # Apply glom with the appropriate args
         if py_default is not None:
             result = glom_extract(py_target, glom_path, default=py_default)
-            logger.debug(f"🧰📝✅ Glom path with default successful: {type(result).__name__}")
+            logger.debug("🧰📝✅ Glom path with default successful: %s", type(result).__name__)
         else:
             result = glom_extract(py_target, glom_path)
-            logger.debug(f"🧰📝✅ Glom path successful: {type(result).__name__}")
+            logger.debug("🧰📝✅ Glom path successful: %s", type(result).__name__)
         
         # Convert result back to CTY
         cty_result = python_to_cty(result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except Exception as e:
         error_msg = format_glom_error(e)
         logger.error(f"🧰📝❌ Glom path failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_assign",
@@ -914,40 +1868,42 @@ def glom_path(target: CtyDynamic, path: CtyString, default: CtyDynamic = None) -
 )
 def glom_assign(target: CtyDynamic, path: CtyString, value: CtyDynamic) -> CtyDynamic:
     """Update a nested data structure by assigning a value at a specified path."""
-    logger.debug(f"🧰📝🔄 Glom assign called with path: {path}")
+    logger.debug("🧰📝🔄 Glom assign called with path: %s", path)
     
     try:
         # Convert inputs to Python types glom can work with
-        py_target = ensure_glom_compatible(target)
+        py_target = _cached_glom_compatible(target)
         py_path = cty_to_python(path)
         py_value = ensure_glom_compatible(value)
         
-        logger.debug(f"🧰🔍🔄 Converted target type: {type(py_target).__name__}")
-        logger.debug(f"🧰🔍🔄 Converted value type: {type(py_value).__name__}")
-        
-        # Make a deep copy to avoid modifying the original
-        import copy
-        target_copy = copy.deepcopy(py_target)
+        logger.debug("🧰🔍🔄 Converted target type: %s", type(py_target).__name__)
+        logger.debug("🧰🔍🔄 Converted value type: %s", type(py_value).__name__)
         
-        # Create Path object and Assign spec
-        path_parts = py_path.split('.') if isinstance(py_path, str) else py_path
-        assign_spec = Assign(Path(*path_parts), py_value)
-        logger.debug(f"🧰🔍🔄 Created assign spec: {assign_spec}")
-        
-        # Apply the assignment
-        result = glom_extract(target_copy, assign_spec)
-        logger.debug(f"🧰📝✅ Glom assign successful: {type(result).__name__}")
+        if isinstance(py_path, str):
+            # Plain dot paths copy only the containers along the path
+            result = _copy_assign(py_target, py_path.split('.'), py_value)
+        else:
+            # Make a deep copy to avoid modifying the original
+            target_copy = _clone_tree(py_target)
+            
+            # Create Path object and Assign spec
+            assign_spec = Assign(Path(*py_path), py_value)
+            logger.debug("🧰🔍🔄 Created assign spec: %s", assign_spec)
+            
+            # Apply the assignment
+            result = glom.glom(target_copy, assign_spec)
+        logger.debug("🧰📝✅ Glom assign successful: %s", type(result).__name__)
         
         # Convert result back to CTY
         cty_result = python_to_cty(result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except Exception as e:
-        error_msg = format_glom_error(e)
+        error_msg = str(e) if isinstance(e, FunctionError) else format_glom_error(e)
         logger.error(f"🧰📝❌ Glom assign failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_flatten",
@@ -980,46 +1936,40 @@ def glom_assign(target: CtyDynamic, path: CtyString, value: CtyDynamic) -> CtyDy
 )
 def glom_flatten(target: CtyDynamic, separator: CtyString = None) -> CtyDynamic:
     """Flatten a nested data structure into a single-level dictionary with path keys."""
-    logger.debug(f"🧰📝🔄 Glom flatten called")
+    logger.debug("🧰📝🔄 Glom flatten called")
     
     try:
         # Convert inputs to Python types
-        py_target = ensure_glom_compatible(target)
+        py_target = _cached_glom_compatible(target)
         py_separator = cty_to_python(separator) if separator is not None else "."
         
-        logger.debug(f"🧰🔍🔄 Converted target type: {type(py_target).__name__}")
-        logger.debug(f"🧰🔍🔄 Using separator: {py_separator}")
+        # Validate the separator once so key building can rely on str methods
+        if not isinstance(py_separator, str):
+            logger.error(f"🧰📝❌ Separator must be a string, got {type(py_separator).__name__}")
+            raise FunctionError(f"Separator must be a string, got {type(py_separator).__name__}")
+        py_separator = sys.intern(py_separator)
         
-        # Recursive function to flatten the structure
-        def flatten_dict(d, parent_key="", sep=py_separator):
-            items = []
-            for k, v in d.items() if isinstance(d, dict) else enumerate(d) if isinstance(d, list) else []:
-                new_key = f"{parent_key}{sep}{k}" if parent_key else str(k)
-                
-                if isinstance(v, (dict, list)) and v:  # Skip empty containers
-                    items.extend(flatten_dict(v, new_key, sep=sep).items())
-                else:
-                    items.append((new_key, v))
-            return dict(items)
+        logger.debug("🧰🔍🔄 Converted target type: %s", type(py_target).__name__)
+        logger.debug("🧰🔍🔄 Using separator: %s", py_separator)
         
         # Apply flattening
         if not isinstance(py_target, (dict, list)):
             logger.warning(f"🧰⚠️⚠️ Cannot flatten non-container type: {type(py_target).__name__}")
             return python_to_cty({})
-            
-        result = flatten_dict(py_target)
-        logger.debug(f"🧰📝✅ Flattening successful: {len(result)} keys")
+
+        result = _flatten_iter(py_target, py_separator)
+        logger.debug("🧰📝✅ Flattening successful: %s keys", len(result))
         
         # Convert result back to CTY
         cty_result = python_to_cty(result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except Exception as e:
         error_msg = f"Failed to flatten structure: {e}"
         logger.error(f"🧰📝❌ Glom flatten failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_transform",
@@ -1075,16 +2025,16 @@ def glom_transform(target: CtyDynamic, path: CtyString, transforms: CtyString, d
     transformations specified as a pipe-separated string. Each transformation
     is applied in order, with the output of one feeding into the next.
     """
-    logger.debug(f"🧰📝🔄 Glom transform called with path: {path}, transforms: {transforms}")
+    logger.debug("🧰📝🔄 Glom transform called with path: %s, transforms: %s", path, transforms)
     
     try:
         # Convert inputs to Python types
-        py_target = ensure_glom_compatible(target)
+        py_target = _cached_glom_compatible(target)
         py_path = cty_to_python(path)
         py_transforms = cty_to_python(transforms)
         py_default = ensure_glom_compatible(default) if default is not None else None
         
-        logger.debug(f"🧰🔍🔄 Converted target type: {type(py_target).__name__}")
+        logger.debug("🧰🔍🔄 Converted target type: %s", type(py_target).__name__)
         
         # Extract initial value
         if py_path:
@@ -1096,78 +2046,35 @@ def glom_transform(target: CtyDynamic, path: CtyString, transforms: CtyString, d
         else:
             value = py_target
             
-        logger.debug(f"🧰🔍🔄 Extracted initial value: {type(value).__name__}")
+        logger.debug("🧰🔍🔄 Extracted initial value: %s", type(value).__name__)
         
-        # Split transforms by pipe
-        transform_list = py_transforms.split('|')
-        logger.debug(f"🧰🔍🔄 Transform list: {transform_list}")
+        # Parse the pipeline (cached per transforms string)
+        pipeline = _compile_pipeline(py_transforms)
+        logger.debug("🧰🔍🔄 Transform list: %s", [name for name, _, _ in pipeline])
         
         # Apply each transformation
-        for t in transform_list:
-            t = t.strip()
+        for name, accepts, op in pipeline:
+            if accepts is not None and not isinstance(value, accepts):
+                logger.error(f"🧰📝❌ Unknown or incompatible transform: {name}")
+                raise FunctionError(f"Unknown or incompatible transform: {name} for {type(value).__name__}")
             
-            if t == "lower" and isinstance(value, str):
-                value = value.lower()
-            elif t == "upper" and isinstance(value, str):
-                value = value.upper()
-            elif t == "title" and isinstance(value, str):
-                value = value.title()
-            elif t == "length":
-                value = len(value) if hasattr(value, "__len__") else 0
-            elif t == "keys" and isinstance(value, dict):
-                value = list(value.keys())
-            elif t == "values" and isinstance(value, dict):
-                value = list(value.values())
-            elif t == "sort" and isinstance(value, list):
-                try:
-                    value = sorted(value)
-                except TypeError:
-                    logger.error(f"🧰📝❌ Cannot sort heterogeneous list")
-                    raise FunctionError("Cannot sort list with mixed types")
-            elif t == "reverse":
-                if isinstance(value, list):
-                    value = list(reversed(value))
-                elif isinstance(value, str):
-                    value = value[::-1]
-                else:
-                    logger.error(f"🧰📝❌ Cannot reverse {type(value).__name__}")
-                    raise FunctionError(f"Cannot reverse {type(value).__name__}")
-            elif t == "sum" and isinstance(value, list):
-                try:
-                    value = sum(value)
-                except TypeError:
-                    logger.error(f"🧰📝❌ Cannot sum non-numeric list")
-                    raise FunctionError("Cannot sum list with non-numeric elements")
-            elif t.startswith("join:") and isinstance(value, list):
-                separator = t[5:]
-                try:
-                    value = separator.join(str(v) for v in value)
-                except Exception as e:
-                    logger.error(f"🧰📝❌ Join failed: {e}")
-                    raise FunctionError(f"Join failed: {e}")
-            elif t.startswith("split:") and isinstance(value, str):
-                separator = t[6:] 
-                value = value.split(separator)
-            else:
-                logger.error(f"🧰📝❌ Unknown or incompatible transform: {t}")
-                raise FunctionError(f"Unknown or incompatible transform: {t} for {type(value).__name__}")
-                
-            logger.debug(f"🧰🔍🔄 After '{t}': {type(value).__name__}")
+            value = op(value)
+            logger.debug("🧰🔍🔄 After '%s': %s", name, type(value).__name__)
         
         # Convert result back to CTY
         cty_result = python_to_cty(value)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except GlomError as e:
         error_msg = format_glom_error(e)
         logger.error(f"🧰📝❌ Glom transform failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
     except Exception as e:
         error_msg = f"Transform failed: {e}"
         logger.error(f"🧰📝❌ Glom transform failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_merge",
@@ -1209,63 +2116,44 @@ def glom_merge(target: CtyDynamic, *sources: CtyDynamic) -> CtyDynamic:
     conflict, later sources take precedence over earlier ones. For non-dict
     values, later sources completely replace earlier values.
     """
-    logger.debug(f"🧰📝🔄 Glom merge called with {len(sources)} sources")
+    logger.debug("🧰📝🔄 Glom merge called with %s sources", len(sources))
     
     try:
-        # Convert inputs to Python types
-        py_target = ensure_glom_compatible(target)
-        py_sources = [ensure_glom_compatible(s) for s in sources]
-        
-        logger.debug(f"🧰🔍🔄 Converted target type: {type(py_target).__name__}")
-        
-        # Helper function for deep merge
-        def deep_merge(a, b):
-            """Deep merge dictionaries - b takes precedence"""
-            if isinstance(a, dict) and isinstance(b, dict):
-                result = a.copy()
-                for k, v in b.items():
-                    if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-                        result[k] = deep_merge(result[k], v)
-                    else:
-                        result[k] = v
-                return result
-            return b  # If not both dicts, b wins
+        # Convert the target; sources are converted as they are merged
+        py_target = _cached_glom_compatible(target)
+        
+        logger.debug("🧰🔍🔄 Converted target type: %s", type(py_target).__name__)
+        
+        # Start with a shallow copy of the target so merging never touches it;
+        # owned tracks the dicts the result has copied and may modify
+        result = dict(py_target) if isinstance(py_target, dict) else py_target
+        owned = {id(result): result}
         
-        # Start with the target
-        if not isinstance(py_target, dict):
-            if not py_sources:
-                return python_to_cty(py_target)
-                
-            # If target isn't a dict but we have sources, use first source as base
-            result = py_sources[0]
-            remaining_sources = py_sources[1:]
-        else:
-            result = py_target
-            remaining_sources = py_sources
-            
         # Apply merges sequentially
-        for source in remaining_sources:
-            if isinstance(result, dict) and isinstance(source, dict):
-                result = deep_merge(result, source)
-            elif isinstance(source, dict):
-                # If result is not a dict but source is, convert result to dict
-                result = deep_merge({}, source)
+        for source in sources:
+            py_source = _cached_glom_compatible(source)
+            if isinstance(result, dict) and isinstance(py_source, dict):
+                _merge_into(result, py_source, owned)
+            elif isinstance(py_source, dict):
+                # If result is not a dict but source is, source becomes the base
+                result = dict(py_source)
+                owned = {id(result): result}
             else:
-                # If neither is a dict, source replaces result
-                result = source
+                # If source is not a dict, it replaces result
+                result = py_source
         
-        logger.debug(f"🧰📝✅ Merge successful: {type(result).__name__}")
+        logger.debug("🧰📝✅ Merge successful: %s", type(result).__name__)
         
         # Convert result back to CTY
         cty_result = python_to_cty(result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except Exception as e:
         error_msg = f"Merge failed: {e}"
         logger.error(f"🧰📝❌ Glom merge failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_unflatten",
@@ -1301,56 +2189,27 @@ def glom_merge(target: CtyDynamic, *sources: CtyDynamic) -> CtyDynamic:
 )
 def glom_unflatten(flat_dict: CtyDynamic, separator: CtyString = None) -> CtyDynamic:
     """Convert a flat dictionary with dot-notation keys into a nested structure."""
-    logger.debug(f"🧰📝🔄 Glom unflatten called")
+    logger.debug("🧰📝🔄 Glom unflatten called")
     
     try:
         # Convert inputs to Python types
-        py_flat_dict = ensure_glom_compatible(flat_dict)
+        py_flat_dict = _cached_glom_compatible(flat_dict)
         py_separator = cty_to_python(separator) if separator is not None else "."
         
-        logger.debug(f"🧰🔍🔄 Converted flat_dict type: {type(py_flat_dict).__name__}")
-        logger.debug(f"🧰🔍🔄 Using separator: {py_separator}")
+        # Validate the separator once so key building can rely on str methods
+        if not isinstance(py_separator, str):
+            logger.error(f"🧰📝❌ Separator must be a string, got {type(py_separator).__name__}")
+            raise FunctionError(f"Separator must be a string, got {type(py_separator).__name__}")
+        py_separator = sys.intern(py_separator)
+        
+        logger.debug("🧰🔍🔄 Converted flat_dict type: %s", type(py_flat_dict).__name__)
+        logger.debug("🧰🔍🔄 Using separator: %s", py_separator)
         
         # Ensure we have a dictionary
         if not isinstance(py_flat_dict, dict):
             logger.error(f"🧰📝❌ Input must be a dictionary/map")
             raise FunctionError("Input must be a dictionary/map")
         
-        # Helper function to set nested value
-        def set_nested(d, key_parts, value):
-            """Set a value in a nested dict by following key_parts."""
-            # Last key part gets the value directly
-            if len(key_parts) == 1:
-                d[key_parts[0]] = value
-                return
-                
-            # Create intermediate dicts as needed
-            current_key = key_parts[0]
-            # If key is a number string and we need a list
-            if current_key.isdigit() and isinstance(d, list):
-                idx = int(current_key)
-                # Expand list if needed
-                while len(d) <= idx:
-                    d.append({} if len(key_parts) > 1 else None)
-                # Ensure we have a dict or list at this position
-                if len(key_parts) > 1:
-                    if not isinstance(d[idx], (dict, list)):
-                        d[idx] = {} if not key_parts[1].isdigit() else []
-                    
-                # Recurse
-                set_nested(d[idx], key_parts[1:], value)
-            else:
-                # Create dict/list as appropriate
-                if current_key not in d:
-                    # If next part is a number, create list, else dict
-                    d[current_key] = [] if len(key_parts) > 1 and key_parts[1].isdigit() else {}
-                elif not isinstance(d[current_key], (dict, list)):
-                    # Convert to dict/list if needed
-                    d[current_key] = {} if not (len(key_parts) > 1 and key_parts[1].isdigit()) else []
-                
-                # Recurse
-                set_nested(d[current_key], key_parts[1:], value)
-        
         # Start with empty result
         result = {}
         
@@ -1364,20 +2223,20 @@ def glom_unflatten(flat_dict: CtyDynamic, separator: CtyString = None) -> CtyDyn
             key_parts = flat_key.split(py_separator)
             
             # Set the value at this path
-            set_nested(result, key_parts, value)
+            _set_nested(result, key_parts, value)
             
-        logger.debug(f"🧰📝✅ Unflatten successful")
+        logger.debug("🧰📝✅ Unflatten successful")
         
         # Convert result back to CTY
         cty_result = python_to_cty(result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except Exception as e:
         error_msg = f"Failed to unflatten structure: {e}"
         logger.error(f"🧰📝❌ Glom unflatten failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_filter",
@@ -1424,142 +2283,97 @@ def glom_filter(
     key_path: CtyString = None
 ) -> CtyDynamic:
     """Filter elements in a collection based on a condition."""
-    logger.debug(f"🧰📝🔄 Glom filter called with condition_path: {condition_path}")
+    logger.debug("🧰📝🔄 Glom filter called with condition_path: %s", condition_path)
     
     try:
         # Convert inputs to Python types
-        py_target = ensure_glom_compatible(target)
+        py_target = _cached_glom_compatible(target)
         py_condition_path = cty_to_python(condition_path)
         py_true_condition = cty_to_python(true_condition) if true_condition is not None else "T"
         py_key_path = cty_to_python(key_path) if key_path is not None else None
         
-        logger.debug(f"🧰🔍🔄 Converted target type: {type(py_target).__name__}")
-        logger.debug(f"🧰🔍🔄 Condition: {py_true_condition}")
+        logger.debug("🧰🔍🔄 Converted target type: %s", type(py_target).__name__)
+        logger.debug("🧰🔍🔄 Condition: %s", py_true_condition)
         
         # Ensure target is a collection
         if not isinstance(py_target, (list, dict)):
             logger.error(f"🧰📝❌ Cannot filter non-collection type: {type(py_target).__name__}")
             raise FunctionError(f"Cannot filter non-collection type: {type(py_target).__name__}")
         
-        # Create a condition checker based on the true_condition string
+        # Resolve the condition once so the row loop never re-parses it
+        condition = _BUILTIN_CONDITIONS.get(py_true_condition)
+        if condition is None:
+            try:
+                condition = _compile_condition(py_true_condition)
+            except SyntaxError as e:
+                logger.error(f"🧰📝❌ Invalid condition expression '{py_true_condition}': {e}")
+                raise FunctionError(f"Invalid condition expression '{py_true_condition}': {e}") from e
+        
         def check_condition(value):
             """Check if a value satisfies the condition."""
-            # Replace 'T' with the actual value in the condition string
-            # This is a simple approach - for complex cases we'd need a proper parser
+            # Unresolved condition paths never match
+            if value is _MISSING:
+                return False
             try:
-                # Set up the evaluation context with the value as T
-                T = value  # Local variable for the condition
-                # Direct evaluation for common cases
-                if py_true_condition == "T":
-                    # Truthy check - empty collections are falsy
-                    if isinstance(T, (list, dict)):
-                        return bool(T)
-                    # None is falsy
-                    if T is None:
-                        return False
-                    # Bool is directly usable
-                    if isinstance(T, bool):
-                        return T
-                    # Numbers - 0 is falsy
-                    if isinstance(T, (int, float)):
-                        return T != 0
-                    # Strings - empty is falsy
-                    if isinstance(T, str):
-                        return bool(T)
-                    # Default to truthy
-                    return True
-                elif py_true_condition == "T != null":
-                    return T is not None
-                elif py_true_condition == "T == null":
-                    return T is None
-                elif py_true_condition == "T > 0":
-                    return isinstance(T, (int, float)) and T > 0
-                elif py_true_condition == "T >= 0":
-                    return isinstance(T, (int, float)) and T >= 0
-                elif py_true_condition == "T < 0":
-                    return isinstance(T, (int, float)) and T < 0
-                elif py_true_condition == "T <= 0":
-                    return isinstance(T, (int, float)) and T <= 0
-                # For more complex conditions, use eval - ONLY with trusted input
-                # Normally we'd use a proper parser for expressions
-                else:
-                    return eval(py_true_condition)
+                return condition(value)
             except Exception as e:
                 logger.error(f"🧰📝❌ Error evaluating condition: {e}")
                 return False
         
-        # Path object for condition checking
-        condition_path_obj = Path(*py_condition_path.split('.')) if py_condition_path else None
+        # Extractor for condition checking
+        extract_condition = _path_extractor(py_condition_path)
         
-        # Path object for key extraction (if specified)
-        key_path_obj = Path(*py_key_path.split('.')) if py_key_path else None
+        # Extractor for key extraction (if specified)
+        extract_key = _path_extractor(py_key_path)
             
         # Filter based on collection type
         if isinstance(py_target, list):
             # Filter list elements
-            result = []
-            for item in py_target:
-                try:
-                    # Extract the condition value
-                    if condition_path_obj:
-                        condition_value = glom_extract(item, condition_path_obj)
-                    else:
-                        condition_value = item
-                        
-                    # Check condition
-                    if check_condition(condition_value):
-                        result.append(item)
-                except Exception as e:
-                    # Skip items that cause errors
-                    logger.debug(f"🧰📝⚠️ Skipping item due to error: {e}")
-                    continue
-                    
-            logger.debug(f"🧰📝✅ Filtered list from {len(py_target)} to {len(result)} items")
+            if extract_condition:
+                result = [item for item in py_target if check_condition(extract_condition(item))]
+            else:
+                result = [item for item in py_target if check_condition(item)]
+            
+            logger.debug("🧰📝✅ Filtered list from %s to %s items", len(py_target), len(result))
             
         else:  # Dictionary/map
             # Filter dictionary items
             result = {}
+            set_result = result.__setitem__
             for key, item in py_target.items():
                 try:
                     # Extract the condition value
-                    if condition_path_obj:
-                        condition_value = glom_extract(item, condition_path_obj)
-                    else:
-                        condition_value = item
+                    condition_value = extract_condition(item) if extract_condition else item
                         
                     # Check condition
                     if check_condition(condition_value):
                         # Determine the result key
-                        if key_path_obj:
-                            try:
-                                result_key = glom_extract(item, key_path_obj)
-                                # Ensure key is hashable
-                                if not isinstance(result_key, (str, int, float, bool, tuple)):
-                                    result_key = str(result_key)
-                            except Exception:
-                                # Fall back to original key on extraction error
-                                result_key = key
-                        else:
+                        result_key = extract_key(item) if extract_key else _MISSING
+                        if result_key is _MISSING:
+                            # Fall back to original key
                             result_key = key
+                        elif not isinstance(result_key, (str, int, float, bool, tuple)):
+                            # Ensure key is hashable
+                            result_key = str(result_key)
                             
-                        result[result_key] = item
+                        set_result(result_key, item)
                 except Exception as e:
                     # Skip items that cause errors
-                    logger.debug(f"🧰📝⚠️ Skipping key '{key}' due to error: {e}")
+                    logger.debug("🧰📝⚠️ Skipping key %r due to error: %r", key, e)
                     continue
                     
-            logger.debug(f"🧰📝✅ Filtered dict from {len(py_target)} to {len(result)} items")
+            logger.debug("🧰📝✅ Filtered dict from %s to %s items", len(py_target), len(result))
         
         # Convert result back to CTY
         cty_result = python_to_cty(result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except Exception as e:
         error_msg = f"Filter failed: {e}"
         logger.error(f"🧰📝❌ Glom filter failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_coalesce",
@@ -1589,16 +2403,16 @@ def glom_filter(
 )
 def glom_coalesce(target: CtyDynamic, paths: CtyDynamic, default: CtyDynamic = None) -> CtyDynamic:
     """Try multiple paths and return the first successful result."""
-    logger.debug(f"🧰📝🔄 Glom coalesce called")
+    logger.debug("🧰📝🔄 Glom coalesce called")
     
     try:
         # Convert inputs to Python types
-        py_target = ensure_glom_compatible(target)
+        py_target = _cached_glom_compatible(target)
         py_paths = ensure_glom_compatible(paths)
         py_default = ensure_glom_compatible(default) if default is not None else None
         
-        logger.debug(f"🧰🔍🔄 Converted target type: {type(py_target).__name__}")
-        logger.debug(f"🧰🔍🔄 Paths to try: {py_paths}")
+        logger.debug("🧰🔍🔄 Converted target type: %s", type(py_target).__name__)
+        logger.debug("🧰🔍🔄 Paths to try: %s", py_paths)
         
         # Ensure paths is a list
         if not isinstance(py_paths, list):
@@ -1608,20 +2422,9 @@ def glom_coalesce(target: CtyDynamic, paths: CtyDynamic, default: CtyDynamic = N
         # Create a proper Coalesce spec
         path_specs = []
         for path in py_paths:
-            # Convert path string to Path object
-            if isinstance(path, str):
-                # Handle dot notation
-                if '.' in path:
-                    path_parts = []
-                    for part in path.split('.'):
-                        # Convert numeric indices
-                        if part.isdigit():
-                            path_parts.append(int(part))
-                        else:
-                            path_parts.append(part)
-                    path_specs.append(Path(*path_parts))
-                else:
-                    path_specs.append(path)
+            # Convert dot notation path strings to (cached) Path objects
+            if isinstance(path, str) and '.' in path:
+                path_specs.append(_compile_path(path))
             else:
                 path_specs.append(path)
                 
@@ -1629,24 +2432,24 @@ def glom_coalesce(target: CtyDynamic, paths: CtyDynamic, default: CtyDynamic = N
         if py_default is not None:
             path_specs.append(Literal(py_default))
             
-        logger.debug(f"🧰🔍🔄 Created {len(path_specs)} path specs")
+        logger.debug("🧰🔍🔄 Created %s path specs", len(path_specs))
         
         # Create and apply Coalesce spec
         spec = Coalesce(*path_specs)
         result = glom_extract(py_target, spec)
         
-        logger.debug(f"🧰📝✅ Found result of type: {type(result).__name__}")
+        logger.debug("🧰📝✅ Found result of type: %s", type(result).__name__)
         
         # Convert result back to CTY
         cty_result = python_to_cty(result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except Exception as e:
         error_msg = f"Coalesce failed: {e}"
         logger.error(f"🧰📝❌ Glom coalesce failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_pick",
@@ -1677,51 +2480,54 @@ def glom_coalesce(target: CtyDynamic, paths: CtyDynamic, default: CtyDynamic = N
 )
 def glom_pick(target: CtyDynamic, spec: CtyDynamic) -> CtyDynamic:
     """Create a new object with only the specified paths from the source."""
-    logger.debug(f"🧰📝🔄 Glom pick called")
+    logger.debug("🧰📝🔄 Glom pick called")
     
     try:
         # Convert inputs to Python types
-        py_target = ensure_glom_compatible(target)
+        py_target = _cached_glom_compatible(target)
         py_spec = ensure_glom_compatible(spec)
         
-        logger.debug(f"🧰🔍🔄 Converted target type: {type(py_target).__name__}")
+        logger.debug("🧰🔍🔄 Converted target type: %s", type(py_target).__name__)
         
         # Ensure spec is a dictionary
         if not isinstance(py_spec, dict):
             logger.error(f"🧰📝❌ Spec must be a map/dictionary, got {type(py_spec).__name__}")
             raise FunctionError(f"Spec must be a map/dictionary")
         
-        # Extract each specified path
-        result = {}
-        for output_key, input_path in py_spec.items():
-            try:
-                # Convert path to appropriate spec
-                path_spec = create_glom_spec(input_path)
-                
-                # Extract value
-                value = glom_extract(py_target, path_spec)
-                
-                # Add to result
-                result[output_key] = value
-                
-            except Exception as e:
-                # Log error but continue with other paths
-                logger.debug(f"🧰📝⚠️ Error extracting path '{input_path}': {e}")
-                # Skip this path
-                continue
+        # Extract all paths in a single glom call; missing paths are skipped
+        combined_spec = {
+            output_key: Coalesce(create_glom_spec(input_path), default=SKIP)
+            for output_key, input_path in py_spec.items()
+        }
+        try:
+            result = glom.glom(py_target, combined_spec)
+        except Exception as e:
+            # Fall back to extracting path by path so one bad spec
+            # doesn't drop the others
+            logger.debug("🧰📝⚠️ Combined pick failed, extracting paths one by one: %r", e)
+            def pick_path(input_path):
+                try:
+                    return glom.glom(py_target, create_glom_spec(input_path))
+                except Exception as e:
+                    # Log error but continue with other paths
+                    logger.debug("🧰📝⚠️ Error extracting path %r: %r", input_path, e)
+                    return _MISSING
+            
+            picked = ((output_key, pick_path(input_path)) for output_key, input_path in py_spec.items())
+            result = {output_key: value for output_key, value in picked if value is not _MISSING}
                 
-        logger.debug(f"🧰📝✅ Picked {len(result)} fields")
+        logger.debug("🧰📝✅ Picked %s fields", len(result))
         
         # Convert result back to CTY
         cty_result = python_to_cty(result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except Exception as e:
         error_msg = f"Pick failed: {e}"
         logger.error(f"🧰📝❌ Glom pick failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_convert",
@@ -1765,124 +2571,39 @@ def glom_pick(target: CtyDynamic, spec: CtyDynamic) -> CtyDynamic:
 )
 def glom_convert(data: CtyDynamic, format: CtyString, options: CtyDynamic = None) -> CtyDynamic:
     """Convert data between different formats."""
-    logger.debug(f"🧰📝🔄 Glom convert called with format: {format}")
+    logger.debug("🧰📝🔄 Glom convert called with format: %s", format)
     
     try:
         # Convert inputs to Python types
-        py_data = ensure_glom_compatible(data)
         py_format = cty_to_python(format)
-        py_options = ensure_glom_compatible(options) if options is not None else {}
-        
-        logger.debug(f"🧰🔍🔄 Converting data of type: {type(py_data).__name__}")
-        logger.debug(f"🧰🔍🔄 Format: {py_format}")
         
-        # Process based on format
-        if py_format == "to_json":
-            # Get formatting options
-            indent = py_options.get("indent", 2)
-            sort_keys = py_options.get("sort_keys", False)
-            
-            # Convert to JSON
-            result = json.dumps(py_data, indent=indent, sort_keys=sort_keys)
-            logger.debug(f"🧰📝✅ Converted to JSON: {len(result)} characters")
-            
-        elif py_format == "from_json":
-            # Parse JSON
-            if not isinstance(py_data, str):
-                logger.error(f"🧰📝❌ Input must be a string for JSON parsing")
-                raise FunctionError("Input must be a string for JSON parsing")
-                
-            result = json.loads(py_data)
-            logger.debug(f"🧰📝✅ Parsed JSON to {type(result).__name__}")
-            
-        elif py_format == "to_yaml":
-            # Check for PyYAML
-            try:
-                import yaml
-                
-                # Get formatting options
-                default_flow_style = py_options.get("default_flow_style", False)
-                indent = py_options.get("indent", 2)
-                
-                # Convert to YAML
-                result = yaml.dump(py_data, default_flow_style=default_flow_style, indent=indent)
-                logger.debug(f"🧰📝✅ Converted to YAML: {len(result)} characters")
-                
-            except ImportError:
-                logger.error(f"🧰📝❌ PyYAML is required for YAML conversion")
-                raise FunctionError("PyYAML is required for YAML conversion")
-                
-        elif py_format == "from_yaml":
-            # Check for PyYAML
-            try:
-                import yaml
-                
-                # Parse YAML
-                if not isinstance(py_data, str):
-                    logger.error(f"🧰📝❌ Input must be a string for YAML parsing")
-                    raise FunctionError("Input must be a string for YAML parsing")
-                    
-                result = yaml.safe_load(py_data)
-                logger.debug(f"🧰📝✅ Parsed YAML to {type(result).__name__}")
-                
-            except ImportError:
-                logger.error(f"🧰📝❌ PyYAML is required for YAML conversion")
-                raise FunctionError("PyYAML is required for YAML conversion")
-                
-        elif py_format == "to_base64":
-            # Ensure string input
-            if not isinstance(py_data, str):
-                py_data = json.dumps(py_data)
-                
-            # Encode to base64
-            import base64
-            result = base64.b64encode(py_data.encode('utf-8')).decode('utf-8')
-            logger.debug(f"🧰📝✅ Encoded to base64: {len(result)} characters")
-            
-        elif py_format == "from_base64":
-            # Ensure string input
-            if not isinstance(py_data, str):
-                logger.error(f"🧰📝❌ Input must be a string for base64 decoding")
-                raise FunctionError("Input must be a string for base64 decoding")
-                
-            # Decode from base64
-            import base64
-            try:
-                # First decode the base64
-                decoded = base64.b64decode(py_data).decode('utf-8')
-                
-                # Then try to parse as JSON if it looks like JSON
-                if decoded.strip().startswith('{') or decoded.strip().startswith('['):
-                    try:
-                        result = json.loads(decoded)
-                        logger.debug(f"🧰📝✅ Decoded base64 to JSON object")
-                    except json.JSONDecodeError:
-                        # Not valid JSON, return the string
-                        result = decoded
-                        logger.debug(f"🧰📝✅ Decoded base64 to string: {len(result)} characters")
-                else:
-                    # Not JSON-like, return the string
-                    result = decoded
-                    logger.debug(f"🧰📝✅ Decoded base64 to string: {len(result)} characters")
-                    
-            except Exception as e:
-                logger.error(f"🧰📝❌ Failed to decode base64: {e}")
-                raise FunctionError(f"Failed to decode base64: {e}")
-                
-        else:
+        # Resolve the handler before converting the data
+        handler = _CONVERTERS.get(py_format)
+        if handler is None:
             logger.error(f"🧰📝❌ Unsupported format: {py_format}")
             raise FunctionError(f"Unsupported format: {py_format}")
         
+        if py_format in _RAW_INPUT_FORMATS:
+            py_data = cty_to_python(data)
+        else:
+            py_data = _cached_glom_compatible(data)
+        py_options = ensure_glom_compatible(options) if options is not None else {}
+        
+        logger.debug("🧰🔍🔄 Converting data of type: %s", type(py_data).__name__)
+        logger.debug("🧰🔍🔄 Format: %s", py_format)
+        
+        result = handler(py_data, py_options)
+        
         # Convert result back to CTY
         cty_result = python_to_cty(result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except Exception as e:
         error_msg = f"Conversion failed: {e}"
         logger.error(f"🧰📝❌ Glom convert failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
 
 @register_function(
     name="pyvider_glom_validate",
@@ -1924,16 +2645,16 @@ def glom_convert(data: CtyDynamic, format: CtyString, options: CtyDynamic = None
 )
 def glom_validate(data: CtyDynamic, rules: CtyDynamic, strict: CtyBool = None) -> CtyDynamic:
     """Validate data against a set of rules and return validation results."""
-    logger.debug(f"🧰📝🔄 Glom validate called")
+    logger.debug("🧰📝🔄 Glom validate called")
     
     try:
         # Convert inputs to Python types
-        py_data = ensure_glom_compatible(data)
-        py_rules = ensure_glom_compatible(rules)
+        py_data = _cached_glom_compatible(data)
+        py_rules = _cached_glom_compatible(rules)
         py_strict = cty_to_python(strict) if strict is not None else False
         
-        logger.debug(f"🧰🔍🔄 Validating data of type: {type(py_data).__name__}")
-        logger.debug(f"🧰🔍🔄 With {len(py_rules)} rules, strict={py_strict}")
+        logger.debug("🧰🔍🔄 Validating data of type: %s", type(py_data).__name__)
+        logger.debug("🧰🔍🔄 With %s rules, strict=%s", len(py_rules), py_strict)
         
         # Initialize results
         validation_result = {
@@ -1942,165 +2663,66 @@ def glom_validate(data: CtyDynamic, rules: CtyDynamic, strict: CtyBool = None) -
             "warnings": {}
         }
         
-        # Helper for type checking
-        def check_type(value, expected_type):
-            """Check if value matches expected type."""
-            if expected_type == "string":
-                return isinstance(value, str)
-            elif expected_type == "number":
-                return isinstance(value, (int, float))
-            elif expected_type == "boolean":
-                return isinstance(value, bool)
-            elif expected_type == "array":
-                return isinstance(value, list)
-            elif expected_type == "object":
-                return isinstance(value, dict)
-            elif expected_type == "null":
-                return value is None
-            elif expected_type == "any":
-                return True
-            return False
-        
-        # Helper for regex pattern validation
-        def check_pattern(value, pattern):
-            """Check if string matches regex pattern."""
-            import re
-            try:
-                return bool(re.match(pattern, value))
-            except:
-                return False
+        errors = validation_result["errors"]
         
-        # Process each rule
-        for field_path, rule_set in py_rules.items():
-            # Skip invalid rules
-            if not isinstance(rule_set, dict):
-                logger.warning(f"🧰📝⚠️ Rule for '{field_path}' is not a dictionary, skipping")
-                continue
-                
-            # Extract field value
-            try:
-                # Use dot notation for path
-                path_obj = Path(*field_path.split('.'))
-                field_value = glom_extract(py_data, path_obj, default=None)
-                field_exists = True
-            except Exception:
-                field_value = None
-                field_exists = False
+        bulk_spec, fields = _compile_ruleset(py_rules)
+        
+        # Extract every ruled field in one pass; absent fields are _MISSING
+        try:
+            field_values = glom.glom(py_data, bulk_spec)
+        except Exception as e:
+            logger.debug("🧰📝⚠️ Bulk field extraction failed, extracting fields one by one: %r", e)
+            field_values = {}
+            for field_path, spec in bulk_spec.items():
+                try:
+                    field_values[field_path] = glom.glom(py_data, spec)
+                except Exception:
+                    field_values[field_path] = _MISSING
+        
+        # Run each field's compiled checks; the first failure wins
+        for field_path, required, checks in fields:
+            field_value = field_values[field_path]
+            field_exists = field_value is not _MISSING
             
             # Check required fields
-            if rule_set.get("required", False) and (not field_exists or field_value is None):
+            if required and (not field_exists or field_value is None):
                 validation_result["valid"] = False
-                validation_result["errors"][field_path] = "Field is required"
+                errors[field_path] = "Field is required"
                 continue
                 
             # Skip validation for non-existent optional fields
             if not field_exists:
                 continue
-                
-            # Type validation
-            if "type" in rule_set and field_value is not None:
-                expected_type = rule_set["type"]
-                if not check_type(field_value, expected_type):
-                    validation_result["valid"] = False
-                    validation_result["errors"][field_path] = f"Expected type '{expected_type}', got '{type(field_value).__name__}'"
-                    continue
-            
-            # Min/max for numbers
-            if isinstance(field_value, (int, float)):
-                if "min" in rule_set and field_value < rule_set["min"]:
-                    validation_result["valid"] = False
-                    validation_result["errors"][field_path] = f"Value {field_value} is less than minimum {rule_set['min']}"
-                    continue
-                    
-                if "max" in rule_set and field_value > rule_set["max"]:
-                    validation_result["valid"] = False
-                    validation_result["errors"][field_path] = f"Value {field_value} is greater than maximum {rule_set['max']}"
-                    continue
-            
-            # Min/max length for strings and arrays
-            if isinstance(field_value, (str, list)):
-                if "min" in rule_set and len(field_value) < rule_set["min"]:
-                    validation_result["valid"] = False
-                    validation_result["errors"][field_path] = f"Length {len(field_value)} is less than minimum {rule_set['min']}"
-                    continue
-                    
-                if "max" in rule_set and len(field_value) > rule_set["max"]:
-                    validation_result["valid"] = False
-                    validation_result["errors"][field_path] = f"Length {len(field_value)} is greater than maximum {rule_set['max']}"
-                    continue
             
-            # Pattern validation for strings
-            if isinstance(field_value, str) and "pattern" in rule_set:
-                if not check_pattern(field_value, rule_set["pattern"]):
-                    validation_result["valid"] = False
-                    validation_result["errors"][field_path] = f"Value doesn't match pattern '{rule_set['pattern']}'"
-                    continue
-            
-            # Enum validation - check against allowed values
-            if "values" in rule_set and field_value is not None:
-                allowed_values = rule_set["values"]
-                if isinstance(allowed_values, list) and field_value not in allowed_values:
-                    validation_result["valid"] = False
-                    validation_result["errors"][field_path] = f"Value '{field_value}' not in allowed values: {allowed_values}"
-                    continue
-            
-            # Custom validation
-            if "custom" in rule_set and field_value is not None:
-                custom_expr = rule_set["custom"]
-                try:
-                    # Setup context for validation
-                    value = field_value  # Local variable for validation expression
-                    
-                    # Evaluate the expression
-                    if not eval(custom_expr):
+            for check in checks:
+                failure = check(field_value)
+                if failure is not None:
+                    kind, message = failure
+                    validation_result[kind][field_path] = message
+                    if kind == "errors":
                         validation_result["valid"] = False
-                        validation_result["errors"][field_path] = f"Failed custom validation: {custom_expr}"
-                        continue
-                except Exception as e:
-                    logger.error(f"🧰📝❌ Error in custom validation for '{field_path}': {e}")
-                    validation_result["warnings"][field_path] = f"Invalid validation rule: {e}"
+                    break
             
         # Strict mode - check for extra fields
         if py_strict:
-            # Flatten the data
-            flat_data = {}
-            
-            def flatten_dict(d, parent_key="", sep="."):
-                """Flatten nested dictionary to dot notation."""
-                items = []
-                for k, v in d.items() if isinstance(d, dict) else enumerate(d) if isinstance(d, list) else []:
-                    new_key = f"{parent_key}{sep}{k}" if parent_key else str(k)
-                    
-                    if isinstance(v, (dict, list)) and v:  # Skip empty containers
-                        items.extend(flatten_dict(v, new_key, sep=sep).items())
-                    else:
-                        items.append((new_key, v))
-                return dict(items)
-            
             if isinstance(py_data, (dict, list)):
-                flat_data = flatten_dict(py_data)
-                
-                # Check for extra fields
-                rule_paths = set(py_rules.keys())
-                data_paths = set(flat_data.keys())
-                
-                # Find paths in data but not in rules
-                extra_paths = data_paths - rule_paths
+                # Stream dot-notation paths in data that are not in rules
+                extra_paths = (path for path in _flatten_keys(py_data) if path not in py_rules)
                 
                 # Add warnings for extra fields
                 for path in extra_paths:
                     validation_result["warnings"][path] = "Field not defined in rules"
         
-        logger.debug(f"🧰📝✅ Validation complete: valid={validation_result['valid']}")
-        logger.debug(f"🧰📝✅ Errors: {len(validation_result['errors'])}, Warnings: {len(validation_result['warnings'])}")
+        logger.debug("🧰📝✅ Validation complete: valid=%s", validation_result['valid'])
+        logger.debug("🧰📝✅ Errors: %s, Warnings: %s", len(validation_result['errors']), len(validation_result['warnings']))
         
         # Convert result back to CTY
         cty_result = python_to_cty(validation_result)
-        logger.debug(f"🧰🔍✅ Converted result to CTY: {type(cty_result).__name__}")
+        logger.debug("🧰🔍✅ Converted result to CTY: %s", type(cty_result).__name__)
         
         return cty_result
         
     except Exception as e:
         error_msg = f"Validation failed: {e}"
         logger.error(f"🧰📝❌ Glom validate failed: {error_msg}")
-        raise FunctionError(error_msg)
+        raise FunctionError(error_msg) from e
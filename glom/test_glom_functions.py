@@ -47,8 +47,9 @@ class Extract:
             logger.error(f"🧰🔍❌ Extract operation failed: {e}")
             return []
 
-# Fixture for common test data structures
-@pytest.fixture
+# Fixtures for common test data structures. They are built once per session
+# and shared, so tests (and the functions under test) must not mutate them.
+@pytest.fixture(scope="session")
 def terraform_data():
     """Provides a sample Terraform-like nested data structure for testing."""
     return {
@@ -91,12 +92,12 @@ def terraform_data():
         }
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_data():
     """Provides an empty data structure for edge case testing."""
     return {}
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nested_null_data():
     """Provides a data structure with nested nulls for testing null handling."""
     return {
@@ -181,6 +182,18 @@ def test_extract_value_null_handling(nested_null_data):
     # Test extracting from a null parent
     result = glom_functions.extract_value(nested_null_data, "resource.aws_instance.web_server.tags.Name", default="no-name")
     assert result == "no-name"
+    
+    # Without a default an explicit null is returned as None
+    assert glom_functions.extract_value(nested_null_data, "resource.aws_instance.web_server.id") is None
+
+def test_extract_value_object_attributes():
+    """Test that path strings read attributes of non-dict values like glom."""
+    class Interface:
+        public_ip = "54.12.34.56"
+    
+    data = {"resource": {"network_interface": [Interface()]}}
+    assert glom_functions.extract_value(data, "resource.network_interface.0.public_ip") == "54.12.34.56"
+    assert glom_functions.extract_value(data, "resource.network_interface.0.missing", default="none") == "none"
 
 # Property-based test using Hypothesis
 @given(st.dictionaries(
@@ -204,6 +217,35 @@ def test_extract_value_property_based(data):
         # We should be able to extract this value directly
         assert glom_functions.extract_value(data, top_key) == data[top_key]
 
+def test_extract_many(terraform_data):
+    """Test extracting several paths in one pass."""
+    paths = [
+        "resource.aws_instance.web_server.id",
+        "resource.aws_instance.web_server.network_interface.0.public_ip",
+        "resource.aws_instance.web_server.subnet_id",
+        "data.aws_vpc.main.id",
+    ]
+    
+    result = glom_functions.extract_many(terraform_data, paths)
+    assert result == ["i-1234567890abcdef0", "54.12.34.56", None, "vpc-12345"]
+    
+    # Missing paths and null values take the default, like extract_value
+    result = glom_functions.extract_many(terraform_data, [
+        "resource.aws_instance.web_server.subnet_id",
+        "resource.aws_instance.web_server.network_interface.1.public_ip",
+    ], default="none")
+    assert result == ["none", "none"]
+
+def test_extract_many_object_attributes():
+    """Test that extract_many reads attributes and tuples like extract_value."""
+    class Interface:
+        public_ip = "54.12.34.56"
+
+    data = {"interface": Interface(), "tags": ({"name": "web"},)}
+    paths = ["interface.public_ip", "tags.0.name", "interface.missing"]
+    assert glom_functions.extract_many(data, paths, default="none") == ["54.12.34.56", "web", "none"]
+    assert [glom_functions.extract_value(data, path, default="none") for path in paths] == ["54.12.34.56", "web", "none"]
+
 # =============================================================================
 # Test transform_data function
 # =============================================================================
@@ -306,6 +348,15 @@ def test_transform_data_with_default_values(terraform_data):
     result = glom_functions.transform_data(terraform_data, spec)
     assert result == expected
 
+def test_transform_data_object_attributes():
+    """Test that path specs read attributes and tuples like glom."""
+    class Interface:
+        public_ip = "54.12.34.56"
+
+    data = {"interface": Interface(), "tags": ({"name": "web"},)}
+    assert glom_functions.transform_data(data, {"ip": "interface.public_ip"}) == {"ip": "54.12.34.56"}
+    assert glom_functions.transform_data(data, {"tags": ("tags", [{"tag": "name"}])}) == {"tags": [{"tag": "web"}]}
+
 def test_transform_data_with_glom_operators(terraform_data):
     """Test transformation using advanced glom operators."""
     spec = {
@@ -914,3 +965,188 @@ def test_helper_resolve_path():
     # Test with glom Path object
     path_obj = Path("a", "b", "c")
     assert glom_functions._resolve_path(path_obj) == path_obj
+
+def test_helper_flatten_iter():
+    """Test the iterative flatten helper used by pyvider_glom_flatten."""
+    data = {"a": {"b": 1, "c": [1, {"d": 2}], "e": {}}, "f": None}
+    
+    # Leaves keep depth-first order and empty containers stay as values
+    assert glom_functions._flatten_iter(data) == {
+        "a.b": 1, "a.c.0": 1, "a.c.1.d": 2, "a.e": {}, "f": None
+    }
+    assert list(glom_functions._flatten_iter(data)) == ["a.b", "a.c.0", "a.c.1.d", "a.e", "f"]
+    
+    # Lists at the root and custom separators
+    assert glom_functions._flatten_iter([1, [2, 3]], "/") == {"0": 1, "1/0": 2, "1/1": 3}
+
+def test_helper_compile_condition():
+    """Test compiled custom conditions used by pyvider_glom_filter."""
+    check = glom_functions._compile_condition("len(T) > 1")
+    assert check("ab") is True
+    assert check("a") is False
+    
+    # Same expression string reuses the compiled checker
+    assert glom_functions._compile_condition("len(T) > 1") is check
+    
+    # Only whitelisted builtins are visible to expressions
+    with pytest.raises(NameError):
+        glom_functions._compile_condition("__import__('os')")(1)
+    
+    with pytest.raises(SyntaxError):
+        glom_functions._compile_condition("T >")
+    
+    # Underscore attributes are rejected before anything is evaluated
+    with pytest.raises(SyntaxError):
+        glom_functions._compile_condition("().__class__.__mro__[1].__subclasses__()")
+    with pytest.raises(SyntaxError):
+        glom_functions._compile_condition("'{0.__class__}'.format(T)")
+
+def test_helper_set_nested_round_trip():
+    """Test that _set_nested rebuilds what _flatten_iter flattened."""
+    flat = {
+        "user.name": "John",
+        "user.address.city": "NY",
+        "tags.0": "a",
+        "tags.1": "b",
+        "ports.0.number": 80,
+    }
+    
+    result = {}
+    for flat_key, value in flat.items():
+        glom_functions._set_nested(result, flat_key.split("."), value)
+    
+    assert result == {
+        "user": {"name": "John", "address": {"city": "NY"}},
+        "tags": ["a", "b"],
+        "ports": [{"number": 80}],
+    }
+    assert glom_functions._flatten_iter(result) == flat
+
+def test_helper_compile_pipeline():
+    """Test parsing of pyvider_glom_transform pipelines."""
+    pipeline = glom_functions._compile_pipeline("join:, | upper|bogus")
+    
+    assert [name for name, _, _ in pipeline] == ["join:,", "upper", "bogus"]
+    assert pipeline[0][2](["a", "b"]) == "a,b"
+    assert pipeline[1][1] is str
+    
+    # Unknown transforms accept no input type
+    assert pipeline[2][1] == ()
+    
+    # Pipelines are cached per transforms string
+    assert glom_functions._compile_pipeline("join:, | upper|bogus") is pipeline
+
+def test_helper_copy_assign(terraform_data):
+    """Test path-copying assignment used by pyvider_glom_assign."""
+    path = "resource.aws_instance.web_server.network_interface.1.public_ip"
+    result = glom_functions._copy_assign(terraform_data, path.split("."), "54.12.34.57")
+    
+    assert glom_functions.extract_value(result, path) == "54.12.34.57"
+    
+    # The original is untouched and unrelated branches are shared
+    assert terraform_data["resource"]["aws_instance"]["web_server"]["network_interface"][1]["public_ip"] is None
+    assert result["data"] is terraform_data["data"]
+    
+    # Missing intermediate containers are an error, like glom's Assign
+    with pytest.raises(FunctionError) as excinfo:
+        glom_functions._copy_assign(terraform_data, ["resource", "aws_lambda", "name"], "x")
+    assert "Could not assign" in str(excinfo.value)
+
+def test_helper_compile_path():
+    """Test cached parsing of dot-notation paths."""
+    path = glom_functions._compile_path("a.0.b")
+    assert path == Path("a", 0, "b")
+    
+    # The same string returns the same cached Path
+    assert glom_functions._compile_path("a.0.b") is path
+    assert glom_functions.create_glom_spec("a.0.b") is path
+
+def test_helper_compile_ruleset():
+    """Test compiled validation rules used by pyvider_glom_validate."""
+    rules = {
+        "count": {"type": "number", "min": 1},
+        "name": {"pattern": "^web", "max": 3},
+        "skipped": "not a rule",
+    }
+    compiled = glom_functions._compile_ruleset(rules)
+    bulk_spec, fields = compiled
+    
+    # Non-dictionary rules are dropped at compile time
+    assert [field_path for field_path, _, _ in fields] == ["count", "name"]
+    assert list(bulk_spec) == ["count", "name"]
+    
+    _, required, checks = fields[0]
+    assert required is False
+    assert [check(0) for check in checks] == [None, ("errors", "Value 0 is less than minimum 1")]
+    
+    # Checks run in order, so the length bound fails before the pattern
+    _, _, checks = fields[1]
+    assert checks[0]("database") == ("errors", "Length 8 is greater than maximum 3")
+    assert checks[1]("database") == ("errors", "Value doesn't match pattern '^web'")
+    
+    # The same rules object reuses its compiled form
+    assert glom_functions._compile_ruleset(rules) is compiled
+    
+    # Rules mutated in place are compiled again
+    rules["count"]["min"] = 5
+    recompiled = glom_functions._compile_ruleset(rules)
+    assert recompiled is not compiled
+    assert recompiled[1][0][2][1](3) == ("errors", "Value 3 is less than minimum 5")
+
+def test_helper_flatten_keys(terraform_data):
+    """Test that path-only flattening matches _flatten_iter."""
+    keys = glom_functions._flatten_keys(terraform_data)
+    
+    # A lazy generator, in the same order as the flattened dict
+    assert not isinstance(keys, (list, dict))
+    assert list(keys) == list(glom_functions._flatten_iter(terraform_data))
+    assert list(glom_functions._flatten_keys({"a": {}, "b": [1]}, sep="/")) == ["a", "b/0"]
+
+def test_helper_ruleset_missing_vs_null():
+    """Test that bulk rule extraction tells null fields apart from missing ones."""
+    bulk_spec, _ = glom_functions._compile_ruleset({"a": {}, "b.c": {}, "d": {}})
+    values = glom({"a": None, "b": {"c": 1}}, bulk_spec)
+    
+    assert values["a"] is None
+    assert values["b.c"] == 1
+    assert values["d"] is glom_functions._MISSING
+    
+    # Digit parts match string keys as well as list indexes, like extract_value
+    bulk_spec, _ = glom_functions._compile_ruleset({"a.0": {}, "l.0": {}})
+    assert glom({"a": {"0": 1}, "l": [2]}, bulk_spec) == {"a.0": 1, "l.0": 2}
+
+def test_helper_split_path():
+    """Test cached path splitting and walking used by extract_value."""
+    parts = glom_functions._split_path("resource.0.name")
+    assert parts == (("resource", None), ("0", 0), ("name", None))
+    assert glom_functions._split_path("resource.0.name") is parts
+    
+    # Digit parts index lists but still match string dict keys
+    assert glom_functions._walk_path({"resource": [{"name": "a"}]}, parts) == "a"
+    assert glom_functions._walk_path({"resource": {"0": {"name": "b"}}}, parts) == "b"
+    assert glom_functions._walk_path({"resource": []}, parts) is glom_functions._MISSING
+
+def test_helper_compile_schema():
+    """Test schema flattening used by validate_structure."""
+    schema = {"a": {"b": str}, "c": int}
+    compiled = glom_functions._compile_schema(schema)
+    slot_count, steps = compiled
+    
+    # Nested schemas get their own slot; exact checks close each level
+    assert slot_count == 2
+    assert steps == (
+        ("field", 0, "a", dict, 1, "Missing required field: a", "a should be a dict, got "),
+        ("field", 1, "b", str, None, "Missing required field: a.b", "a.b should be str, got "),
+        ("exact", 1, "a", frozenset({"b"})),
+        ("field", 0, "c", int, None, "Missing required field: c", "c should be int, got "),
+        ("exact", 0, "", frozenset({"a", "c"})),
+    )
+    
+    # The same schema object reuses its compiled form
+    assert glom_functions._compile_schema(schema) is compiled
+    assert glom_functions._compile_schema({"a": {"b": str}, "c": int}) is compiled
+    
+    # A schema mutated in place is compiled again
+    schema["d"] = bool
+    slot_count, steps = glom_functions._compile_schema(schema)
+    assert steps[-1] == ("exact", 0, "", frozenset({"a", "c", "d"}))
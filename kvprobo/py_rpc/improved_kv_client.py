@@ -3,16 +3,24 @@
 # examples/kvprobo/improved_kv_client.py
 
 import asyncio
+import contextlib
 import logging
 import os
 import sys
 import time
 import traceback
+import weakref
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+import grpc
 
 from pyvider.rpcplugin.logger import logger
 from pyvider.rpcplugin.client import RPCPluginClient
 
+from examples.kvprobo.py_rpc.logging_utils import debug_enabled
 from examples.kvprobo.py_rpc.proto import (
     KVProtocol,
     kv_pb2,
@@ -27,8 +35,143 @@ logging.basicConfig(
 )
 
 
+# Plugin environment, passed through the client config rather than os.environ.
+_PLUGIN_ENV = MappingProxyType(
+    {
+        "PLUGIN_MAGIC_COOKIE_KEY": "BASIC_PLUGIN",
+        "PLUGIN_MAGIC_COOKIE": "hello",
+        "PLUGIN_PROTOCOL_VERSIONS": "1",
+        "PLUGIN_TRANSPORTS": "unix",  # Force Unix for stability
+        "PLUGIN_AUTO_MTLS": "true",
+        "PYTHONUNBUFFERED": "1",      # Ensure Python output is unbuffered
+        "GODEBUG": "asyncpreemptoff=1,panicasync=1", # Improve Go coroutine behavior
+    }
+)
+
+@lru_cache(maxsize=4096)
+def _get_request(key: str) -> kv_pb2.GetRequest:
+    """Build a GetRequest once per key; it is only serialized, never mutated."""
+    return kv_pb2.GetRequest(key=key)
+
+
+def _read_available(pipe, limit: int = 2048) -> bytes:
+    """Read whatever is already buffered in a pipe without blocking the event loop."""
+    fd = pipe.fileno()
+    os.set_blocking(fd, False)
+    try:
+        return os.read(fd, limit)
+    except BlockingIOError:
+        return b""
+
+
+class _SharedPlugin:
+    """One running plugin process, its channel and stderr relay, shared by path."""
+
+    def __init__(self, client: RPCPluginClient) -> None:
+        self.client = client
+        self.channel = client._channel
+        self.stub = kv_pb2_grpc.KVStub(self.channel)
+        self.refs = 0
+        self._stderr_task: asyncio.Task | None = None
+        self._stderr_transport: asyncio.ReadTransport | None = None
+
+    async def relay_stderr(self) -> None:
+        """Attach the server process's stderr pipe to the event loop and relay it."""
+        process = getattr(self.client, "_process", None)
+        if not process or not process.stderr:
+            logger.debug("📝 No server stderr pipe to relay")
+            return
+
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        self._stderr_transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), process.stderr
+        )
+        self._stderr_task = asyncio.create_task(self._pump_stderr(reader))
+        logger.debug("📝 Started stderr relay")
+
+    async def _pump_stderr(self, reader: asyncio.StreamReader) -> None:
+        """Log complete stderr lines until the pipe closes."""
+        try:
+            while line := await reader.readline():
+                decoded = line.decode('utf-8', errors='replace').rstrip()
+                if decoded:
+                    logger.debug(f"📝 SERVER: {decoded}")
+        except Exception as e:
+            logger.error(f"📝 Error reading stderr: {e}")
+
+    async def wait_until_ready(self, timeout: float = 5.0) -> None:
+        """Wait until the channel to the server is connected.
+
+        channel_ready() watches the channel's connectivity state without
+        sending an RPC, so the server logs nothing for the check. Raises
+        asyncio.TimeoutError if the channel is not READY within timeout.
+        """
+        await asyncio.wait_for(self.channel.channel_ready(), timeout=timeout)
+
+    async def close(self) -> None:
+        """Stop the stderr relay and close the plugin client."""
+        if self._stderr_task:
+            self._stderr_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._stderr_task
+            self._stderr_task = None
+        if self._stderr_transport:
+            self._stderr_transport.close()
+            self._stderr_transport = None
+        await self.client.close()
+
+
+class _PluginRegistry:
+    """Plugins shared by server path, and the locks guarding their start/stop.
+
+    Locks and gRPC channels are bound to the event loop that created them, so
+    there is one registry per running loop (see _registry()).
+    """
+
+    def __init__(self) -> None:
+        self.plugins: dict[str, _SharedPlugin] = {}
+        # server path -> [lock, number of tasks holding or waiting for it]
+        self._locks: dict[str, list] = {}
+
+    @contextlib.asynccontextmanager
+    async def locked(self, server_path: str):
+        """Hold the lock for server_path; drop the entry once nobody needs it."""
+        entry = self._locks.get(server_path)
+        if entry is None:
+            entry = self._locks[server_path] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[server_path]
+
+
+# One registry per event loop; it goes away with its loop.
+_REGISTRIES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _PluginRegistry]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _registry() -> _PluginRegistry:
+    """Return the plugin registry of the running event loop."""
+    loop = asyncio.get_running_loop()
+    registry = _REGISTRIES.get(loop)
+    if registry is None:
+        registry = _REGISTRIES[loop] = _PluginRegistry()
+    return registry
+
+
 class KVClient:
-    """Client for KV plugin server with improved error handling & diagnostics."""
+    """Client for KV plugin server with improved error handling & diagnostics.
+
+    KVClients created for the same server path on the same event loop share
+    one plugin process and channel; it is started by the first start() and
+    closed by the last close().
+    """
 
     def __init__(self, server_path: str) -> None:
         """Initialize KV client.
@@ -39,24 +182,34 @@ class KVClient:
         self.server_path = server_path
         self._client = None
         self._stub = None
+        self._shared: _SharedPlugin | None = None
+        self._registry: _PluginRegistry | None = None
         self.connection_timeout = 15.0  # Increased timeout
 
-        # Configure environment for plugin - FORCE unix transport for stability
-        os.environ.update(
-            {
-                "PLUGIN_MAGIC_COOKIE_KEY": "BASIC_PLUGIN",
-                "PLUGIN_MAGIC_COOKIE": "hello",
-                "PLUGIN_PROTOCOL_VERSIONS": "1",
-                "PLUGIN_TRANSPORTS": "unix",  # Force Unix for stability
-                "PLUGIN_AUTO_MTLS": "true",
-                "PYTHONUNBUFFERED": "1",      # Ensure Python output is unbuffered
-                "GODEBUG": "asyncpreemptoff=1,panicasync=1", # Improve Go coroutine behavior
-            }
-        )
-
     async def start(self) -> None:
-        """Connect to the KV server with improved error handling."""
+        """Connect to the KV server, reusing a running plugin for the same path."""
+        if self._shared:
+            return
+
+        registry = _registry()
+        async with registry.locked(self.server_path):
+            shared = registry.plugins.get(self.server_path)
+            if shared is None:
+                shared = await self._launch()
+                registry.plugins[self.server_path] = shared
+            else:
+                logger.debug(f"♻️ Reusing running plugin for server path: {self.server_path}")
+            shared.refs += 1
+
+        self._shared = shared
+        self._registry = registry
+        self._client = shared.client
+        self._stub = shared.stub
+
+    async def _launch(self) -> _SharedPlugin:
+        """Start a new plugin process with improved error handling."""
         start_time = time.time()
+        client = None
         try:
             logger.debug(f"🤝 Creating an RPCPluginClient for server path: {self.server_path}")
             
@@ -70,95 +223,86 @@ class KVClient:
                 raise PermissionError(f"Server executable is not executable: {self.server_path}")
             
             # Create plugin client with explicit environment settings
-            self._client = RPCPluginClient(
+            client = RPCPluginClient(
                 command=[self.server_path], 
-                config={
-                    "plugins": {"kv": KVProtocol()},
-                    "env": {
-                        # Explicitly setting these in config overrides env vars
-                        "PLUGIN_MAGIC_COOKIE_KEY": "BASIC_PLUGIN",
-                        "PLUGIN_MAGIC_COOKIE": "hello",
-                        "PLUGIN_PROTOCOL_VERSIONS": "1",
-                        "PLUGIN_TRANSPORTS": "unix",
-                        "PLUGIN_AUTO_MTLS": "true",
-                        "PYTHONUNBUFFERED": "1",
-                        "GODEBUG": "asyncpreemptoff=1,panicasync=1",
-                    }
-                }
+                config={"plugins": {"kv": KVProtocol()}, "env": dict(_PLUGIN_ENV)},
             )
 
-            # Start a background thread to relay stderr for diagnostics
-            self._relay_stderr()
-            
             # Start client with explicit timeout
             logger.debug(f"▶️ Starting the client with {self.connection_timeout} second timeout")
-            await asyncio.wait_for(self._client.start(), timeout=self.connection_timeout)
+            await asyncio.wait_for(client.start(), timeout=self.connection_timeout)
             
             # Log connection details
-            if hasattr(self._client, "_transport") and self._client._transport:
-                transport_type = type(self._client._transport).__name__
-                endpoint = getattr(self._client._transport, "endpoint", "unknown")
+            if hasattr(client, "_transport") and client._transport:
+                transport_type = type(client._transport).__name__
+                endpoint = getattr(client._transport, "endpoint", "unknown")
                 logger.debug(f"🤝✅ Connected via {transport_type} to {endpoint}")
 
-            # Add a small delay to ensure transport is ready
-            await asyncio.sleep(0.5)
-
-            # Create gRPC stub
-            self._stub = kv_pb2_grpc.KVStub(self._client._channel)
+            # Create gRPC stub, relay the server's stderr line by line for
+            # diagnostics, and wait until the channel is connected
+            shared = _SharedPlugin(client)
+            await shared.relay_stderr()
+            try:
+                await shared.wait_until_ready(timeout=self.connection_timeout)
+            except BaseException:
+                client = None  # shared.close() below owns the client now
+                await shared.close()
+                raise
             logger.info(f"✅ Connected to KV server successfully in {time.time() - start_time:.3f}s")
+            return shared
 
         except asyncio.TimeoutError:
             logger.error(f"🚨 Connection to KV server timed out after {time.time() - start_time:.3f}s")
             # Add extra diagnostics
-            if self._client and self._client._process and self._client._process.poll() is None:
+            if client and client._process and client._process.poll() is None:
                 logger.debug("📝 Server process is still running")
-                if self._client._process.stderr:
+                if client._process.stderr:
                     try:
-                        stderr = self._client._process.stderr.read(2048)
+                        stderr = _read_available(client._process.stderr)
                         if stderr:
                             logger.debug(f"📝 Server stderr: {stderr.decode('utf-8', errors='replace')}")
                     except:
                         pass
-            await self.close()
+            await self._close_failed(client)
             raise
 
         except Exception as e:
             logger.error(f"🚨 Failed to connect to KV server: {e}")
             logger.error(f"Traceback: {traceback.format_exc()}")
-            await self.close()
+            await self._close_failed(client)
             raise
 
-    def _relay_stderr(self) -> None:
-        """Start a background thread to read and relay stderr from the server process."""
-        import threading
-        
-        def read_stderr():
-            while self._client and hasattr(self._client, "_process") and self._client._process:
-                try:
-                    if not self._client._process or not self._client._process.stderr:
-                        break
-                    line = self._client._process.stderr.read(1024)
-                    if not line:
-                        break
-                    decoded = line.decode('utf-8', errors='replace').strip()
-                    if decoded:
-                        logger.debug(f"📝 SERVER: {decoded}")
-                except Exception as e:
-                    logger.error(f"📝 Error reading stderr: {e}")
-                    break
-        
-        thread = threading.Thread(target=read_stderr, daemon=True)
-        thread.start()
-        logger.debug("📝 Started background stderr reader")
+    @staticmethod
+    async def _close_failed(client: RPCPluginClient | None) -> None:
+        """Close a plugin client whose startup failed."""
+        if client:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.error(f"🔒 Error closing client connection: {e}")
 
     async def close(self) -> None:
-        """Close the connection with improved cleanup."""
-        if self._client:
+        """Release the shared plugin, closing it when no other client uses it."""
+        shared = self._shared
+        if not shared:
+            return
+        registry = self._registry
+        self._shared = None
+        self._registry = None
+        self._client = None
+        self._stub = None
+
+        async with registry.locked(self.server_path):
+            shared.refs -= 1
+            if shared.refs > 0:
+                logger.debug(f"🔒 Plugin still used by {shared.refs} other client(s)")
+                return
+            if registry.plugins.get(self.server_path) is shared:
+                del registry.plugins[self.server_path]
+
             logger.debug("🔒 Closing client connection")
             try:
-                await self._client.close()
-                self._client = None
-                self._stub = None
+                await shared.close()
                 logger.debug("🔒 Client connection closed successfully")
             except Exception as e:
                 logger.error(f"🔒 Error closing client connection: {e}")
@@ -179,15 +323,19 @@ class KVClient:
             value = value.encode('utf-8')
 
         try:
-            logger.debug(f"Put request - key={key}, value_size={len(value)}")
-            await asyncio.wait_for(
-                self._stub.Put(kv_pb2.PutRequest(key=key, value=value)),
-                timeout=5.0
-            )
-            logger.debug(f"Put successful: key={key}")
-
-        except asyncio.TimeoutError:
-            logger.error(f"Put timed out: key={key}")
+            debug = debug_enabled(logger)
+            if debug:
+                logger.debug("Put request - key=%s, value_size=%d", key, len(value))
+            # gRPC deadline: enforced by the channel and propagated to the server
+            await self._stub.Put(kv_pb2.PutRequest(key=key, value=value), timeout=5.0)
+            if debug:
+                logger.debug("Put successful: key=%s", key)
+
+        except grpc.aio.AioRpcError as e:
+            if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                logger.error(f"Put timed out: key={key}")
+            else:
+                logger.error(f"Put failed: key={key}, error={e}")
             raise
         except Exception as e:
             logger.error(f"Put failed: key={key}, error={e}")
@@ -206,21 +354,59 @@ class KVClient:
             raise RuntimeError("Not connected to KV server")
 
         try:
-            response = await asyncio.wait_for(
-                self._stub.Get(kv_pb2.GetRequest(key=key)),
-                timeout=5.0
-            )
+            response = await self._stub.Get(_get_request(key), timeout=5.0)
             value = response.value if response else None
-            logger.debug(f"Get successful: key={key}, found={'yes' if value else 'no'}")
+            if debug_enabled(logger):
+                logger.debug(
+                    "Get successful: key=%s, found=%s", key, "yes" if value else "no"
+                )
             return value
 
-        except asyncio.TimeoutError:
-            logger.error(f"Get timed out: key={key}")
+        except grpc.aio.AioRpcError as e:
+            if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                logger.error(f"Get timed out: key={key}")
+            else:
+                logger.error(f"Get failed: key={key}, error={e}")
             raise
         except Exception as e:
             logger.error(f"Get failed: key={key}, error={e}")
             raise
 
+    async def put_many(
+        self, items: Mapping[str, bytes | str] | Iterable[tuple[str, bytes | str]]
+    ) -> None:
+        """Put several values into the KV store concurrently.
+
+        The unary Put calls are issued together and multiplexed as parallel
+        streams over the one HTTP/2 connection, so N puts cost roughly one
+        round-trip instead of N.
+
+        Args:
+            items: Mapping or iterable of (key, value) pairs
+        """
+        if not self._stub:
+            raise RuntimeError("Not connected to KV server")
+
+        pairs = list(items.items()) if isinstance(items, Mapping) else list(items)
+        logger.debug("Put many - count=%d", len(pairs))
+        await asyncio.gather(*(self.put(key, value) for key, value in pairs))
+
+    async def get_many(self, keys: Iterable[str]) -> list[bytes]:
+        """Get several values from the KV store concurrently.
+
+        Args:
+            keys: Keys to retrieve
+
+        Returns:
+            Values in the same order as keys
+        """
+        if not self._stub:
+            raise RuntimeError("Not connected to KV server")
+
+        keys = list(keys)
+        logger.debug("Get many - count=%d", len(keys))
+        return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
 
 async def main() -> None:
     """Example usage of KVClient."""
@@ -0,0 +1,21 @@
+# examples/kvprobo/py_rpc/logging_utils.py
+
+import logging
+from typing import Any
+
+
+def debug_enabled(logger: Any) -> bool:
+    """
+    Return whether the given logger emits DEBUG records.
+
+    pyvider loggers may be structlog wrappers rather than stdlib loggers, so
+    the level is read through whichever API the logger has. If it exposes
+    none, debug output is assumed to be on rather than silently dropped.
+    """
+    is_enabled_for = getattr(logger, "isEnabledFor", None)
+    if is_enabled_for is None:
+        # structlog's filtering bound loggers
+        is_enabled_for = getattr(logger, "is_enabled_for", None)
+    if is_enabled_for is None:
+        return True
+    return bool(is_enabled_for(logging.DEBUG))
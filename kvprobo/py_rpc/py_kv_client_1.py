@@ -6,6 +6,7 @@
 import asyncio
 import logging
 import os
+from types import MappingProxyType
 
 from pyvider.rpcplugin.logger import logger
 from pyvider.rpcplugin.client import RPCPluginClient
@@ -23,6 +24,17 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+# Plugin environment, passed through the client config rather than os.environ.
+_PLUGIN_ENV = MappingProxyType(
+    {
+        "PLUGIN_MAGIC_COOKIE_KEY": "BASIC_PLUGIN",
+        "PLUGIN_MAGIC_COOKIE": "hello",
+        "PLUGIN_PROTOCOL_VERSIONS": "1",
+        "PLUGIN_TRANSPORTS": "unix",
+        "PLUGIN_AUTO_MTLS": "true",
+    }
+)
+
 
 class KVClient:
     """Client for KV plugin server."""
@@ -37,23 +49,13 @@ class KVClient:
         self._client = None
         self._stub = None
 
-        # Configure environment for plugin
-        os.environ.update(
-            {
-                "PLUGIN_MAGIC_COOKIE_KEY": "BASIC_PLUGIN",
-                "PLUGIN_MAGIC_COOKIE": "hello",
-                "PLUGIN_PROTOCOL_VERSIONS": "1",
-                "PLUGIN_TRANSPORTS": "unix",
-                "PLUGIN_AUTO_MTLS": "true",
-            }
-        )
-
     async def start(self) -> None:
         """Connect to the KV server."""
         try:
             # Create plugin client
             self._client = RPCPluginClient(
-                command=[self.server_path], config={"plugins": {"kv": KVProtocol()}}
+                command=[self.server_path],
+                config={"plugins": {"kv": KVProtocol()}, "env": dict(_PLUGIN_ENV)},
             )
             logger.debug("🤝 Created an RPCPluginClient.")
 
@@ -65,7 +67,6 @@ class KVClient:
             if hasattr(self._client, "_client_cert"):
                 logger.info("🔐 Client certificate generated")
 
-            await self._client.start()
             logger.debug("🤝✅ RPCPluginClient connected to server successfully.")
 
             # Create gRPC stub
@@ -3,8 +3,10 @@
 py-kv-server.py
 
 This Python key/value (KV) plugin server uses the RPCPluginServer to set up a gRPC
-server and implements a file‑based key/value store. Each key/value pair is persisted
-in a text file called "kv-data-<key>".
+server and implements a file‑based key/value store. All key/value pairs are
+appended to a single data file (KV_DATA_FILE, "kv-data.db" in the temp directory
+by default) and located through an in-memory index, so a Put or Get never opens a
+file of its own.
 
 On startup, the server performs a self‑test by executing a Put/Get with a key of
 "status" and a value of "pyvider server listening". This validates that the internal
@@ -12,12 +14,17 @@ storage functions work correctly and assists during gRPC debugging.
 """
 
 import asyncio
+import fcntl
 import os
+import struct
+import tempfile
+import threading
 import grpc
 
 from pyvider.rpcplugin.logger import logger
 from pyvider.rpcplugin.server import RPCPluginServer
 
+from examples.kvprobo.py_rpc.logging_utils import debug_enabled
 from examples.kvprobo.py_rpc.proto import (
     KVProtocol,
     kv_pb2,
@@ -40,12 +47,146 @@ class DummyContext:
 
 
 # ------------------------------------------------------------------------------
-# Helper: Summarize a text value by showing first and last 32 characters.
+# Helper: Summarize a value by showing its first and last 32 bytes as text.
+# Only the two ends are decoded, never the whole payload.
 # ------------------------------------------------------------------------------
-def summarize_text(text: str, length: int = 32) -> str:
-    if len(text) <= 2 * length:
-        return text
-    return f"{text[:length]} ... {text[-length:]}"
+def summarize_bytes(value: bytes, length: int = 32) -> str:
+    if len(value) <= 2 * length:
+        return value.decode("utf-8", errors="replace")
+    head = value[:length].decode("utf-8", errors="replace")
+    tail = value[-length:].decode("utf-8", errors="replace")
+    return f"{head} ... {tail}"
+
+
+# ------------------------------------------------------------------------------
+# KVStore: Append-only single-file store with an in-memory index
+# ------------------------------------------------------------------------------
+# Data file used by serve(); stable across restarts unless KV_DATA_FILE overrides it.
+KV_DATA_FILE = os.environ.get(
+    "KV_DATA_FILE", os.path.join(tempfile.gettempdir(), "kv-data.db")
+)
+
+# Record header: key length, value length (little-endian uint32 each).
+_RECORD_HEADER = struct.Struct("<II")
+
+# Records per writev() call; three iovecs each keeps us well under IOV_MAX.
+_WRITEV_BATCH = 256
+
+
+class KVStore:
+    """
+    Persists every key/value pair as a record appended to one data file.
+
+    Each record is a header followed by the UTF-8 key and the raw value bytes.
+    The index maps a key to the (offset, length) of its latest value, so a Get
+    is a single pread() on an already-open descriptor. Overwritten values stay
+    in the file until it is removed; the log is never compacted.
+    With durable=True every batch of writes is followed by fdatasync().
+
+    The index only knows this store's own appends, so a data file belongs to
+    one store at a time: an exclusive lock on "<path>.lock" is held until
+    close(), and a second server on the same file fails to start.
+    Methods block and are meant to be called through asyncio.to_thread().
+    """
+
+    def __init__(self, path: str = KV_DATA_FILE, durable: bool = False) -> None:
+        self.path = path
+        self.durable = durable
+        self._index: dict[str, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._lock_fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(self._lock_fd)
+            raise RuntimeError(f"KV data file '{path}' is in use by another store") from None
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        end = self._load_index()
+        if end != os.fstat(self._fd).st_size:
+            # Only a torn record from an interrupted write lies past end, and
+            # no other store can be appending while we hold the lock
+            os.ftruncate(self._fd, end)
+
+    def _load_index(self) -> int:
+        """Rebuild the index from existing records; return the end of the last whole record.
+
+        Only headers and keys are read; values are skipped over, so startup
+        memory is bounded by the index rather than the file size.
+        """
+        header_size = _RECORD_HEADER.size
+        file_size = os.fstat(self._fd).st_size
+        offset = 0
+        with open(self.path, "rb") as f:
+            while True:
+                header = f.read(header_size)
+                if len(header) < header_size:
+                    break
+                key_len, value_len = _RECORD_HEADER.unpack(header)
+                value_offset = offset + header_size + key_len
+                if value_offset + value_len > file_size:
+                    break  # Truncated trailing record from an interrupted write
+                key = f.read(key_len).decode("utf-8")
+                f.seek(value_len, os.SEEK_CUR)
+                self._index[key] = (value_offset, value_len)
+                offset = value_offset + value_len
+        return offset
+
+    def put(self, key: str, value: bytes) -> None:
+        self.put_many([(key, value)])
+
+    def put_many(self, items: list[tuple[str, bytes]]) -> None:
+        """Append several records with one writev() (and fdatasync()) per batch."""
+        header_size = _RECORD_HEADER.size
+        with self._lock:
+            for start in range(0, len(items), _WRITEV_BATCH):
+                buffers: list[bytes] = []
+                locations: list[tuple[str, int, int]] = []
+                # O_APPEND writes land at the real end of the file, so take
+                # offsets from there rather than from our own bookkeeping
+                end = os.lseek(self._fd, 0, os.SEEK_END)
+                offset = end
+                for key, value in items[start : start + _WRITEV_BATCH]:
+                    key_bytes = key.encode("utf-8")
+                    buffers += (
+                        _RECORD_HEADER.pack(len(key_bytes), len(value)),
+                        key_bytes,
+                        value,
+                    )
+                    value_offset = offset + header_size + len(key_bytes)
+                    locations.append((key, value_offset, len(value)))
+                    offset = value_offset + len(value)
+
+                self._append(buffers, end, offset - end)
+                for key, value_offset, length in locations:
+                    self._index[key] = (value_offset, length)
+
+    def _append(self, buffers: list[bytes], end: int, size: int) -> None:
+        """Write buffers at end, finishing short writes; undo a failed batch."""
+        try:
+            written = os.writev(self._fd, buffers)
+            if written < size:
+                remaining = memoryview(b"".join(buffers))[written:]
+                while remaining:
+                    remaining = remaining[os.write(self._fd, remaining) :]
+            if self.durable:
+                os.fdatasync(self._fd)
+        except OSError:
+            # A partial record would break the next _load_index(); the lock
+            # guarantees nothing else appended after end
+            os.ftruncate(self._fd, end)
+            raise
+
+    def get(self, key: str) -> bytes | None:
+        """Return the latest value for key, or None if it was never stored."""
+        location = self._index.get(key)
+        if location is None:
+            return None
+        offset, length = location
+        return os.pread(self._fd, length, offset)
+
+    def close(self) -> None:
+        os.close(self._fd)
+        os.close(self._lock_fd)
 
 
 # ------------------------------------------------------------------------------
@@ -53,13 +194,19 @@ def summarize_text(text: str, length: int = 32) -> str:
 # ------------------------------------------------------------------------------
 class KVHandler(kv_pb2_grpc.KVServicer):
     """
-    KV service implementation that persists each key/value pair to a file.
-    The file is named "kv-data-<key>" and stores the value as plain text.
+    KV service implementation that persists key/value pairs through a KVStore,
+    a single append-only data file holding the values' raw bytes.
     Detailed logging is added to both Put and Get methods.
     """
 
-    def __init__(self) -> None:
-        logger.debug("🛎️📡✅ KVHandler: Initialized with file‑based persistence.")
+    def __init__(self, store: KVStore | None = None) -> None:
+        self._store = store if store is not None else KVStore()
+        # Puts waiting for the next group write, and the task draining them
+        self._pending: list[tuple[str, bytes, asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+        logger.debug(
+            f"🛎️📡✅ KVHandler: Initialized with file‑based persistence in '{self._store.path}'."
+        )
         # Add explicit logging of certificate parameters
         if hasattr(self, "_server_cert_obj"):
             cert = self._server_cert_obj._cert
@@ -73,25 +220,29 @@ class KVHandler(kv_pb2_grpc.KVServicer):
         """
         🛎️📡🚀 Put:
           - Receives a key/value pair.
-          - Writes the value (decoded from UTF‑8, with errors replaced) to a text file
-            named "kv-data-<key>".
+          - Appends the value's raw bytes to the store's data file.
           - Logs the key, full file name, and a summary (first 32 and last 32 characters)
             of the value.
         """
         try:
             key = request.key
-            logger.info(f"🛎️📡🚀 Put: Received request for key: '{key}'")
-            value_str = request.value.decode("utf-8", errors="replace")
-            summary = summarize_text(value_str)
-            logger.debug(
-                f"🛎️📡📝 Put: Storing key '{key}' with value (summary): {summary}"
-            )
-            filename = f"/tmp/kv-data-{key}"
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(value_str)
-            logger.debug(
-                f"🛎️📡✅ Put: Successfully stored key '{key}' in file '{filename}'."
-            )
+            logger.info("🛎️📡🚀 Put: Received request for key: '%s'", key)
+            value = request.value
+            # Only build the value summary when debug records are emitted
+            debug = debug_enabled(logger)
+            if debug:
+                logger.debug(
+                    "🛎️📡📝 Put: Storing key '%s' with value (summary): %s",
+                    key,
+                    summarize_bytes(value),
+                )
+            await self._write(key, value)
+            if debug:
+                logger.debug(
+                    "🛎️📡✅ Put: Successfully stored key '%s' in '%s'.",
+                    key,
+                    self._store.path,
+                )
             return kv_pb2.Empty()
         except Exception as e:
             logger.error(
@@ -100,32 +251,65 @@ class KVHandler(kv_pb2_grpc.KVServicer):
             )
             await context.abort(grpc.StatusCode.INTERNAL, str(e))
 
+    async def _write(self, key: str, value: bytes) -> None:
+        """Queue a write for the next group write and wait until it is stored."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((key, value, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+        await future
+
+    async def _flush(self) -> None:
+        """Store queued writes in batches until the queue is empty.
+
+        Puts that arrive while a batch is being written are picked up by the
+        next batch, so concurrent Puts share a single writev()/fdatasync().
+        """
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                # Write in a worker thread so the event loop keeps serving RPCs
+                await asyncio.to_thread(
+                    self._store.put_many, [(key, value) for key, value, _ in batch]
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+
     async def Get(
         self, request: kv_pb2.GetRequest, context: grpc.aio.ServicerContext
     ) -> kv_pb2.GetResponse:
         """
         🛎️📡🚀 Get:
-          - Retrieves the value for the given key by reading the file "kv-data-<key>".
+          - Retrieves the value for the given key from the store's data file.
           - Logs the lookup process and displays a summary (first 32 and last 32 characters)
             of the retrieved value.
         """
         try:
             key = request.key
-            logger.info(f"🛎️📡🚀 Get: Received request for key: '{key}'")
-            filename = f"/tmp/kv-data-{key}"
-            logger.debug(f"🛎️📡📝 Get: Looking for file '{filename}' for key '{key}'.")
-            if not os.path.exists(filename):
-                logger.error(
-                    f"🛎️📡❌ Get: Key '{key}' not found (file '{filename}' does not exist)."
+            logger.info("🛎️📡🚀 Get: Received request for key: '%s'", key)
+            debug = debug_enabled(logger)
+            if debug:
+                logger.debug(
+                    "🛎️📡📝 Get: Looking up key '%s' in '%s'.", key, self._store.path
                 )
+            # Read in a worker thread so the event loop keeps serving RPCs
+            value = await asyncio.to_thread(self._store.get, key)
+            if value is None:
+                logger.error(f"🛎️📡❌ Get: Key '{key}' not found.")
                 await context.abort(grpc.StatusCode.NOT_FOUND, f"Key not found: {key}")
-            with open(filename, "r", encoding="utf-8") as f:
-                value_str = f.read()
-            summary = summarize_text(value_str)
-            logger.debug(
-                f"🛎️📡✅ Get: Successfully retrieved key '{key}' with value (summary): {summary}"
-            )
-            return kv_pb2.GetResponse(value=value_str.encode("utf-8"))
+            if debug:
+                logger.debug(
+                    "🛎️📡✅ Get: Successfully retrieved key '%s' with value (summary): %s",
+                    key,
+                    summarize_bytes(value),
+                )
+            return kv_pb2.GetResponse(value=value)
         except Exception as e:
             logger.error(
                 f"🛎️📡❌ Get: Error retrieving key '{request.key}': {e}",
@@ -153,7 +337,7 @@ async def serve() -> None:
     logger.info("🛎️🚀 Starting KV plugin server...")
 
     # Create an instance of KVHandler.
-    kv_handler = KVHandler()
+    kv_handler = KVHandler(KVStore(KV_DATA_FILE))
 
     # Self-Test: Put and then Get with key "status" and value "pyvider server listening"
     dummy_context = DummyContext()
@@ -204,6 +388,7 @@ async def serve() -> None:
             logger.info("🛎️🛑 Received shutdown signal")
         finally:
             await server.stop()
+            kv_handler._store.close()
             logger.info("🛎️🛑 Server: Server stopped")
 
     except Exception as e:
@@ -3,6 +3,7 @@
 
 import asyncio
 import contextlib
+import os
 import sys
 
 import grpc
@@ -15,6 +16,7 @@ from pyvider.rpcplugin.server import RPCPluginServer
 from pyvider.rpcplugin.transport import TCPSocketTransport, UnixSocketTransport
 
 from tests.fixtures import *
+from examples.kvprobo.py_rpc.logging_utils import debug_enabled
 from examples.kvprobo.py_rpc.proto import KVProtocol, kv_pb2, kv_pb2_grpc
 
 def summarize_text(text: str, length: int = 32) -> str:
@@ -23,30 +25,40 @@ def summarize_text(text: str, length: int = 32) -> str:
         return text
     return f"{text[:length]} ... {text[-length:]}"
 
+# KVStub per channel, keyed by id() and holding the channel so the id stays valid.
+_STUBS: dict[int, tuple[grpc.aio.Channel, kv_pb2_grpc.KVStub]] = {}
+
+def _get_stub(channel: grpc.aio.Channel) -> kv_pb2_grpc.KVStub:
+    """Return the KVStub for a channel, building it on first use."""
+    cached = _STUBS.get(id(channel))
+    if cached is None or cached[0] is not channel:
+        cached = _STUBS[id(channel)] = (channel, kv_pb2_grpc.KVStub(channel))
+    return cached[1]
+
 class TestKVHandler(kv_pb2_grpc.KVServicer):
     """KV service handler implementation with proper type handling."""
 
     def __init__(self) -> None:
         """Initialize an in-memory key-value store."""
-        self._store = {}
+        self._store: dict[str, bytes] = {}
         logger.debug("🔌🚀✅ KV handler initialized")
 
     async def Get(self, request, context):
         """Get a value by key with proper error handling."""
         key = request.key
-        logger.debug(f"🔌📖🔍 Get request for key: '{key}'")
+        debug = debug_enabled(logger)
+        if debug:
+            logger.debug("🔌📖🔍 Get request for key: '%s'", key)
 
-        value = self._store.get(key, None)
-        if value is None:
-            logger.debug(f"🔌📖❌ Key not found: '{key}'")
+        try:
+            value = self._store[key]
+        except KeyError:
+            logger.debug("🔌📖❌ Key not found: '%s'", key)
             await context.abort(grpc.StatusCode.NOT_FOUND, f"Key not found: {key}")
             return kv_pb2.GetResponse()  # Return empty response, will not be used because of abort
 
-        # Ensure value is returned as bytes
-        if isinstance(value, str):
-            value = value.encode('utf-8')
-
-        logger.debug(f"🔌📖✅ Retrieved value for key '{key}', size: {len(value)} bytes")
+        if debug:
+            logger.debug("🔌📖✅ Retrieved value for key '%s', size: %d bytes", key, len(value))
         return kv_pb2.GetResponse(value=value)
 
     async def Put(self, request, context):
@@ -57,41 +69,51 @@ class TestKVHandler(kv_pb2_grpc.KVServicer):
             # Store value as-is (should be bytes from gRPC)
             self._store[key] = value
 
-            # For logging, convert to string if needed
-            if isinstance(value, bytes):
-                value_str = value.decode('utf-8', errors='replace')
-                value_summary = summarize_text(value_str)
-            else:
-                # Handle case where value is already a string
-                value_summary = summarize_text(str(value))
+            # For logging, convert to string if needed (only when debug is on)
+            if debug_enabled(logger):
+                if isinstance(value, bytes):
+                    value_str = value.decode('utf-8', errors='replace')
+                    value_summary = summarize_text(value_str)
+                else:
+                    # Handle case where value is already a string
+                    value_summary = summarize_text(str(value))
 
-            logger.debug(f"🔌📤✅ Stored key '{key}' with value: {value_summary}")
+                logger.debug("🔌📤✅ Stored key '%s' with value: %s", key, value_summary)
             return kv_pb2.Empty()
         except Exception as e:
             logger.error(f"🔌📤❌ Error in Put operation: {e}")
             await context.abort(grpc.StatusCode.INTERNAL, str(e))
             return kv_pb2.Empty()  # Return empty response, will not be used because of abort
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def kv_handler() -> TestKVHandler:
-    """Provides a test KV handler instance."""
+    """Provides a test KV handler instance, shared across the session."""
     handler = TestKVHandler()
     logger.debug("🔌🚀✅ Created KV handler")
     return handler
 
-@pytest_asyncio.fixture(params=["tcp", "unix"])
-async def transport_fixture(request, unique_transport_path):
-    """Parameterized fixture for different transport types."""
-    transport_type = request.param
+# Unix sockets by default; set KV_TEST_TRANSPORTS=tcp,unix to also run over TCP.
+KV_TEST_TRANSPORTS = os.environ.get("KV_TEST_TRANSPORTS", "unix").split(",")
+
+@pytest.fixture(scope="session", params=KV_TEST_TRANSPORTS)
+def transport_type(request) -> str:
+    """Parameterized transport type, shared by every fixture of one session leg."""
+    return request.param
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def transport_fixture(transport_type, tmp_path_factory):
+    """Fixture providing a transport of the parameterized type."""
     transport = None
+    # unique_transport_path is per test, so the session transport gets its own socket
+    socket_path = str(tmp_path_factory.mktemp("kv") / "kv.sock")
 
     try:
         if transport_type == "tcp":
             transport = TCPSocketTransport(host="127.0.0.1")
             logger.debug("🔌🚀✅ Created TCP transport")
         else:
-            transport = UnixSocketTransport(path=unique_transport_path)
-            logger.debug(f"🔌🚀✅ Created Unix transport at {unique_transport_path}")
+            transport = UnixSocketTransport(path=socket_path)
+            logger.debug(f"🔌🚀✅ Created Unix transport at {socket_path}")
 
         yield transport_type, transport
     finally:
@@ -104,7 +126,7 @@ async def transport_fixture(request, unique_transport_path):
             except Exception as e:
                 logger.error(f"🔌🔒❌ Error closing {transport_type} transport: {e}")
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def kv_server(transport_fixture, kv_handler, mock_server_config):
     """Provides a running KV server with proper lifecycle management."""
     transport_type, transport = transport_fixture
@@ -154,10 +176,13 @@ async def kv_server(transport_fixture, kv_handler, mock_server_config):
 
         logger.debug("🛎️🔒✅ KV server stopped")
 
-@pytest_asyncio.fixture
-async def kv_client(kv_server, transport_fixture):
-    """Provides a KV client connected to the server."""
-    transport_type, transport = transport_fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def kv_client(kv_server, transport_type):
+    """Provides a KV client connected to a plugin server, shared across tests.
+
+    The client and kv_server start once per transport leg, so the plugin
+    process, mTLS handshake and server setup are not repeated for every test.
+    """
     logger.debug(f"🙋🚀🔍 Creating KV client with {transport_type} transport")
 
     # Set up environment for client
@@ -185,10 +210,15 @@ async def kv_client(kv_server, transport_fixture):
         await client.close()
         logger.debug("🙋🔒✅ KV client closed")
 
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def reset_kv_store(kv_handler) -> None:
+    """Clear the shared handler's store so each test starts empty."""
+    kv_handler._store.clear()
+
+@pytest.mark.asyncio(loop_scope="session")
 async def test_kv_put_get_flow(kv_client) -> None:
     """Test basic Put/Get operations."""
-    stub = kv_pb2_grpc.KVStub(kv_client._channel)
+    stub = _get_stub(kv_client._channel)
     logger.debug("🔌🧪🚀 Starting Put/Get flow test")
 
     # Put a value
@@ -214,10 +244,10 @@ async def test_kv_put_get_flow(kv_client) -> None:
         logger.error(f"🔌🧪❌ Unexpected error during Put/Get test: {e}")
         raise
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_kv_missing_key(kv_client) -> None:
     """Test Get with nonexistent key."""
-    stub = kv_pb2_grpc.KVStub(kv_client._channel)
+    stub = _get_stub(kv_client._channel)
     logger.debug("🔌🧪🚀 Starting missing key test")
 
     with pytest.raises(grpc.RpcError) as exc_info:
@@ -229,26 +259,33 @@ async def test_kv_missing_key(kv_client) -> None:
 
     logger.debug("🔌🧪✅ Missing key test passed: received expected NOT_FOUND error")
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_kv_concurrent_operations(kv_client) -> None:
     """Test concurrent Put/Get operations."""
-    stub = kv_pb2_grpc.KVStub(kv_client._channel)
+    stub = _get_stub(kv_client._channel)
     logger.debug("🔌🧪🚀 Starting concurrent operations test")
 
     # Number of concurrent operations
     operation_count = 5  # Reduced count for faster tests
 
+    # Build every request up front so the concurrent section only does RPCs
+    operations = []
+    for i in range(operation_count):
+        key = f"concurrent_key_{i}"
+        value = f"concurrent_value_{i}".encode('utf-8')
+        operations.append(
+            (value, kv_pb2.PutRequest(key=key, value=value), kv_pb2.GetRequest(key=key))
+        )
+
     # Create operation function
     async def put_get(i: int) -> bool:
+        value, put_request, get_request = operations[i]
         try:
-            key = f"concurrent_key_{i}"
-            value = f"concurrent_value_{i}".encode('utf-8')
-
             logger.debug(f"🔌🧪🔍 Concurrent operation {i}: Put")
-            await stub.Put(kv_pb2.PutRequest(key=key, value=value))
+            await stub.Put(put_request)
 
             logger.debug(f"🔌🧪🔍 Concurrent operation {i}: Get")
-            response = await stub.Get(kv_pb2.GetRequest(key=key))
+            response = await stub.Get(get_request)
 
             # Verify response
             assert response.value == value, \
@@ -260,11 +297,10 @@ async def test_kv_concurrent_operations(kv_client) -> None:
             logger.error(f"🔌🧪❌ Concurrent operation {i} failed: {e}")
             return False
 
-    # Run concurrent operations
-    results = await asyncio.gather(
-        *[put_get(i) for i in range(operation_count)],
-        return_exceptions=True
-    )
+    # Run concurrent operations; put_get reports failures as False itself
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(put_get(i)) for i in range(operation_count)]
+    results = [task.result() for task in tasks]
 
     # Count successes
     success_count = sum(1 for result in results if result is True)
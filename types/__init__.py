@@ -1,23 +1,34 @@
 
 # pyvider/cty/types/__init__.py
 
+import importlib
+
 from pyvider.cty.types.base import CtyType
 
-from pyvider.cty.types.collections import (
-    CtyList,
-    CtyMap,
-    CtySet,
-)
-from pyvider.cty.types.primitives import (
-    CtyBool,
-    CtyNumber,
-    CtyString,
-)
-from pyvider.cty.types.structural import (
-    CtyDynamic,
-    CtyObject,
-    CtyTuple,
-)
+# Everything except CtyType is imported on first access (PEP 562), so
+# importing one type does not load every collection and structural module.
+_LAZY_IMPORTS = {
+    "CtyBool": "pyvider.cty.types.primitives",
+    "CtyNumber": "pyvider.cty.types.primitives",
+    "CtyString": "pyvider.cty.types.primitives",
+    "CtyList": "pyvider.cty.types.collections",
+    "CtyMap": "pyvider.cty.types.collections",
+    "CtySet": "pyvider.cty.types.collections",
+    "CtyDynamic": "pyvider.cty.types.structural",
+    "CtyObject": "pyvider.cty.types.structural",
+    "CtyTuple": "pyvider.cty.types.structural",
+}
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     "CtyType",
@@ -40,7 +40,10 @@ class CtyType(ABC, Generic[T]):
         """Determine if this type can be used as another."""
 
     def __eq__(self, other: "CtyType[T]") -> bool:
-        return isinstance(other, CtyType)
+        return type(other) is type(self)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}"
@@ -41,16 +41,21 @@ class CtyList(CtyType[list[T]], Generic[T]):
                 f"Expected list or tuple, got {type(value).__name__}"
             )
 
-        validated: list[T] = []
+        validate = self.element_type.validate
+        try:
+            return [validate(item) for item in value]
+        except Exception as e:
+            error = e
+
+        # Slow path: revalidate element by element to report the failing index
         for i, item in enumerate(value):
             try:
-                validated.append(self.element_type.validate(item))
+                validate(item)
             except Exception as e:
                 raise ValidationError(
                     f"Invalid element at index {i}: {e!s}"
                 ) from e
-
-        return validated
+        raise ValidationError(f"Invalid element: {error!s}") from error
 
     def element_at(self, value: list[T], index: int) -> T:
         if not isinstance(value, list):
@@ -71,7 +76,7 @@ class CtyList(CtyType[list[T]], Generic[T]):
 
     def usable_as(self, other: "CtyType") -> bool:
         """
-        Checks if this tuple type can be used as another type.
+        Checks if this list type can be used as another type.
 
         Args:
             other (CtyType): Another type to check compatibility with.
@@ -79,9 +84,8 @@ class CtyList(CtyType[list[T]], Generic[T]):
         Returns:
             bool: True if compatible, False otherwise.
         """
-        return isinstance(other, CtyList) and all(
-            issubclass(self_type, other_type)
-            for self_type, other_type in zip(self.types, other.types)
+        return isinstance(other, CtyList) and self.element_type.usable_as(
+            other.element_type
         )
 
     def __str__(self) -> str:
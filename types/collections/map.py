@@ -26,6 +26,7 @@ class CtyMap(CtyType[dict[str, T]], Generic[T]):
     metadata: Optional[Mapping[str, Any]] = field(default=None)
     default: Optional[Mapping[str, T]] = field(default=None)
     mutable: bool = field(default=False)  # Default to immutable
+    deep_copy: bool = False  # Copy nested values too
 
     def __attrs_post_init__(self):
         if not isinstance(self.value_type, CtyType):
@@ -38,14 +39,18 @@ class CtyMap(CtyType[dict[str, T]], Generic[T]):
             from pyvider.cty import CtyString
             object.__setattr__(self, "key_type", CtyString())
 
+        # A shallow copy isolates the top level from the caller's dict;
+        # nested values are only copied when deep_copy is requested.
+        copy_mapping = copy.deepcopy if self.deep_copy else dict
+
         if isinstance(self.metadata, dict):
-            metadata = copy.deepcopy(self.metadata)
+            metadata = copy_mapping(self.metadata)
             if not self.mutable:
                 metadata = MappingProxyType(metadata)
             object.__setattr__(self, "metadata", metadata)
 
         if isinstance(self.default, dict):
-            default = copy.deepcopy(self.default)
+            default = copy_mapping(self.default)
             if not self.mutable:
                 default = MappingProxyType(default)
             object.__setattr__(self, "default", default)
@@ -55,29 +60,23 @@ class CtyMap(CtyType[dict[str, T]], Generic[T]):
             raise ValidationError(f"Expected dict, got {type(value).__name__}")
 
         validated = {}
+        key_validate = self.key_type.validate
+        validate_value = self._validate_value
         for k, v in value.items():
-            validated_key = self.key_type.validate(k)
-            validated_value = self._wrap_value(v)
-
-            if isinstance(validated_value, list):
-                validated_value = [
-                    item.value if isinstance(item, CtyType) else item for item in validated_value
-                ]
-            else:
-                validated_value = (
-                    validated_value.value if isinstance(validated_value, CtyType) else validated_value
-                )
-
-            validated[validated_key.value if isinstance(validated_key, CtyType) else validated_key] = validated_value
+            validated_key = key_validate(k)
+            if isinstance(validated_key, CtyType):
+                validated_key = validated_key.value
+            validated[validated_key] = validate_value(v)
 
         return MappingProxyType(validated) if not self.mutable else validated
 
-    def _wrap_value(self, value: Any) -> CtyType:
+    def _validate_value(self, value: Any) -> Any:
+        """Check a map value against value_type and return its raw Python value."""
         if isinstance(value, CtyType):
-            return value
+            return value.value
 
         if isinstance(value, list):
-            return [self._wrap_value(item) for item in value]
+            return [self._validate_value(item) for item in value]
 
         if isinstance(value, dict):
             if isinstance(self.value_type, CtyMap):
@@ -95,11 +94,11 @@ class CtyMap(CtyType[dict[str, T]], Generic[T]):
             return self.value_type.validate({value: value})
 
         if isinstance(value, bool) and isinstance(self.value_type, CtyBool):
-            return CtyBool(value)
+            return value
         if isinstance(value, (int, float)) and isinstance(self.value_type, CtyNumber):
-            return CtyNumber(value)
+            return value
         if isinstance(value, str) and isinstance(self.value_type, CtyString):
-            return CtyString(value)
+            return value
 
         raise ValidationError(
             f"Invalid type for map value: {type(value).__name__}. Expected {self.value_type.__class__.__name__}."
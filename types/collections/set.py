@@ -49,18 +49,19 @@ class CtySet(CtyType[PySet[T]], Generic[T]):
 
         return evolve(self, value=validated)
 
-    def add(self, element):
+    def add(self, element) -> "CtySet":
         try:
-            self.validate(self.value | {element})
-            self.value.add(element)
+            if isinstance(element, (set, frozenset)):
+                raise ValidationError("Nested sets are not allowed in CtySet.")
+            validated_item = self.element_type.validate(element)
         except ValidationError as e:
             raise ValidationError(f"Failed to add element: {e}")
+        return evolve(self, value=self.value | {validated_item})
 
     def remove(self, item: T) -> "CtySet":
         try:
             validated_item = self.element_type.validate(item)
-            new_set = {x for x in self.value if x != validated_item}
-            return evolve(self, value=new_set)
+            return evolve(self, value=self.value - {validated_item})
         except Exception as e:
             raise ValidationError(f"Failed to remove item: {e}")
 
@@ -14,7 +14,9 @@ class CtyBool(CtyType[bool]):
 
     def validate(self, value: Any) -> "CtyBool":
         if isinstance(value, bool):
-            return CtyBool(value=value)
+            if type(self) is CtyBool:
+                return _BOOL_VALUES[value]
+            return self.__class__(value=value)
         raise ValidationError("Value must be a boolean.")
 
     def equal(self, other: "CtyType[bool]") -> bool:
@@ -33,3 +35,7 @@ class CtyBool(CtyType[bool]):
 
     def __hash__(self):
         return hash(self.value)
+
+
+# Frozen, so the two possible instances can be shared by every validate() call.
+_BOOL_VALUES = {False: CtyBool(value=False), True: CtyBool(value=True)}
@@ -2,7 +2,7 @@
 
 from typing import ClassVar
 
-from attrs import define, evolve, field
+from attrs import define, field
 
 from pyvider.cty.exceptions import ValidationError
 
@@ -17,7 +17,11 @@ class CtyNumber(CtyType[float]):
     def validate(self, value):
         if not isinstance(value, (int, float)):
             raise ValidationError("Value must be a number.")
-        return evolve(self, value=value)
+        if value is self.value:
+            return self
+        if type(value) is int and -5 <= value <= 256 and type(self) is CtyNumber:
+            return _SMALL_INTS[value + 5]
+        return self.__class__(value=value)
 
     def equal(self, other: "CtyType[float]") -> bool:
         return isinstance(other, CtyNumber)
@@ -42,3 +46,7 @@ class CtyNumber(CtyType[float]):
 
     def __hash__(self):
         return hash(self.value)
+
+
+# Shared instances for small ints, mirroring CPython's own small-int cache.
+_SMALL_INTS = tuple(CtyNumber(value=i) for i in range(-5, 257))
@@ -1,6 +1,6 @@
 from typing import Any, ClassVar, TypeVar
 
-from attrs import define, evolve, field
+from attrs import define, field
 
 from pyvider.cty.exceptions import ValidationError
 
@@ -16,8 +16,12 @@ class CtyString(CtyType[str]):
     def validate(self, value):
         if not isinstance(value, str):
             raise ValidationError("Value must be a string.")
-        # Evolve and return the new instance
-        return evolve(self, value=value)
+        # Reuse this instance when it already holds an identical string
+        if type(value) is str and value == self.value:
+            return self
+        if value == "" and type(self) is CtyString:
+            return _EMPTY_STRING
+        return self.__class__(value=value)
 
     def equal(self, other: CtyType[Any]) -> bool:
         """
@@ -54,3 +58,7 @@ class CtyString(CtyType[str]):
 
     def __str__(self) -> str:
         return "CtyString"
+
+
+# Shared instance for the empty string, the most common default value.
+_EMPTY_STRING = CtyString(value="")
@@ -10,7 +10,11 @@ validates attribute types and presence/absence of required attributes.
 """
 
 import logging
-from typing import Any, Dict, FrozenSet, Optional, Set, Type, Union, cast
+import sys
+import weakref
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Sequence, Set, Tuple, Type, Union, cast
 
 import attrs
 
@@ -25,6 +29,19 @@ from pyvider.cty.exceptions import (
 )
 
 
+def _debug_enabled() -> bool:
+    """Whether the cty logger emits DEBUG records; assumed on if it can't say."""
+    is_enabled_for = getattr(logger, "isEnabledFor", None) or getattr(logger, "is_enabled_for", None)
+    return is_enabled_for is None or bool(is_enabled_for(logging.DEBUG))
+
+
+# Interned CtyObject schemas, see CtyObject.intern()
+_INTERNED: "weakref.WeakValueDictionary[tuple, CtyObject]" = weakref.WeakValueDictionary()
+
+# Shared default for unset attribute flags
+_EMPTY_FROZENSET: FrozenSet[str] = frozenset()
+
+
 @attrs.define(frozen=True, slots=True)
 class CtyObject(CtyType[Dict[str, Any]]):
     """
@@ -35,24 +52,47 @@ class CtyObject(CtyType[Dict[str, Any]]):
     and can have attributes of different types.
     
     Attributes:
-        attribute_types: Dictionary mapping attribute names to their types
+        attribute_types: Read-only mapping of attribute names to their types;
+            the dict passed in is copied, so interned instances can be shared
         optional_attributes: Set of attribute names that are optional
         computed_attributes: Set of attribute names computed by the provider
         block_attributes: Set of attribute names that represent blocks
         sensitive_attributes: Set of attribute names containing sensitive data
+        validation_order: Attribute names validate() checks first, e.g. a
+            discriminator that rejects most bad values; the rest follow in
+            definition order. Does not affect equality.
     """
-    attribute_types: Dict[str, CtyType] = attrs.field(factory=dict)
+    attribute_types: Mapping[str, CtyType] = attrs.field(factory=dict)
     optional_attributes: FrozenSet[str] = attrs.field(factory=frozenset)
     computed_attributes: FrozenSet[str] = attrs.field(factory=frozenset)
     block_attributes: FrozenSet[str] = attrs.field(factory=frozenset)
     sensitive_attributes: FrozenSet[str] = attrs.field(factory=frozenset)
+    validation_order: Optional[Tuple[str, ...]] = attrs.field(
+        default=None, converter=attrs.converters.optional(tuple), eq=False, repr=False,
+    )
+    # Derived from the fields above in __attrs_post_init__
+    _attribute_names: FrozenSet[str] = attrs.field(init=False, default=None, eq=False, repr=False)
+    _required: FrozenSet[str] = attrs.field(init=False, default=None, eq=False, repr=False)
+    # 64-bit summary of the attribute names, see _derive()
+    _name_mask: int = attrs.field(init=False, default=0, eq=False, repr=False)
+    # Validation plan built on first validate(); see _validation_plan()
+    _plan: Optional[tuple] = attrs.field(init=False, default=None, eq=False, repr=False)
+    # str() and hash() results, computed on first use
+    _str_cache: Optional[str] = attrs.field(init=False, default=None, eq=False, repr=False)
+    _hash_cache: Optional[int] = attrs.field(init=False, default=None, eq=False, repr=False)
     
     def __attrs_post_init__(self) -> None:
         """Validate object type configuration."""
         logger.debug("🧩🔍 Validating CtyObject configuration on initialization")
-        
-        # Validate attribute_types is a dictionary
-        if not isinstance(self.attribute_types, dict):
+        self._validate_config()
+        self._intern_names()
+        self._derive()
+        logger.debug("🧩✅ CtyObject configuration validated successfully")
+    
+    def _validate_config(self) -> None:
+        """Check attribute_types and the flag sets against each other."""
+        # Validate attribute_types is a dictionary (or another schema's frozen one)
+        if not isinstance(self.attribute_types, (dict, MappingProxyType)):
             error_msg = f"Expected dict for attribute_types, got {type(self.attribute_types).__name__}"
             logger.error(f"🧩❌ {error_msg}")
             raise InvalidTypeError(error_msg)
@@ -67,35 +107,148 @@ class CtyObject(CtyType[Dict[str, Any]]):
             logger.error(f"🧩❌ {error_msg}")
             raise AttributeValidationError(error_msg)
         
-        # Validate optional attributes exist in the type definition
-        unknown_optional = set(self.optional_attributes) - set(self.attribute_types)
-        if unknown_optional:
-            error_msg = f"Unknown optional attributes: {', '.join(unknown_optional)}"
+        # Validate flagged attributes exist in the type definition; probing
+        # the dict directly copies nothing and accepts any iterable of names
+        has_attribute = self.attribute_types.__contains__
+        flagged = (
+            ("optional", self.optional_attributes),
+            ("computed", self.computed_attributes),
+            ("block", self.block_attributes),
+            ("sensitive", self.sensitive_attributes),
+        )
+        for kind, names in flagged:
+            if not all(map(has_attribute, names)):
+                unknown = [name for name in names if not has_attribute(name)]
+                error_msg = f"Unknown {kind} attributes: {', '.join(unknown)}"
+                logger.error(f"🧩❌ {error_msg}")
+                raise AttributeValidationError(error_msg)
+        
+        if self.validation_order is not None and not all(map(has_attribute, self.validation_order)):
+            unknown = [name for name in self.validation_order if not has_attribute(name)]
+            error_msg = f"Unknown validation_order attributes: {', '.join(unknown)}"
             logger.error(f"🧩❌ {error_msg}")
             raise AttributeValidationError(error_msg)
+    
+    def _intern_names(self) -> None:
+        """
+        Intern attribute names so lookups during validation compare by identity.
         
-        # Validate computed attributes exist
-        unknown_computed = set(self.computed_attributes) - set(self.attribute_types)
-        if unknown_computed:
-            error_msg = f"Unknown computed attributes: {', '.join(unknown_computed)}"
-            logger.error(f"🧩❌ {error_msg}")
-            raise AttributeValidationError(error_msg)
+        Names built at runtime (e.g. decoded from a provider schema) are not
+        interned automatically, so each dict probe would otherwise fall back
+        to a full string comparison. The names go into a private copy that is
+        exposed read-only, so the caller's dict stays independent.
+        """
+        def intern_name(name: Any) -> Any:
+            return sys.intern(name) if type(name) is str else name
+        
+        object.__setattr__(
+            self,
+            "attribute_types",
+            MappingProxyType(
+                {intern_name(name): type_ for name, type_ in self.attribute_types.items()}
+            ),
+        )
+        for field in ("optional_attributes", "computed_attributes",
+                      "block_attributes", "sensitive_attributes"):
+            names = getattr(self, field)
+            if names:
+                object.__setattr__(self, field, frozenset(map(intern_name, names)))
+    
+    def _derive(self) -> None:
+        """Compute the attribute-name and required-name sets."""
+        attribute_names = frozenset(self.attribute_types)
+        object.__setattr__(self, "_attribute_names", attribute_names)
+        # Two bits per name hash, Bloom-filter style: differing masks prove
+        # differing name sets without hashing every name again
+        mask = 0
+        for name in attribute_names:
+            h = hash(name)
+            mask |= (1 << (h & 63)) | (1 << ((h >> 6) & 63))
+        object.__setattr__(self, "_name_mask", mask)
+        object.__setattr__(
+            self,
+            "_required",
+            attribute_names.difference(self.optional_attributes, self.computed_attributes),
+        )
+    
+    @classmethod
+    def _unchecked(
+        cls,
+        attribute_types: Dict[str, CtyType],
+        optional_attributes: FrozenSet[str],
+        computed_attributes: FrozenSet[str],
+        block_attributes: FrozenSet[str],
+        sensitive_attributes: FrozenSet[str],
+        validation_order: Optional[Tuple[str, ...]] = None,
+    ) -> "CtyObject":
+        """
+        Construct from a configuration already known to be valid.
         
-        # Validate block attributes exist
-        unknown_blocks = set(self.block_attributes) - set(self.attribute_types)
-        if unknown_blocks:
-            error_msg = f"Unknown block attributes: {', '.join(unknown_blocks)}"
-            logger.error(f"🧩❌ {error_msg}")
-            raise AttributeValidationError(error_msg)
+        Used when deriving a schema from an existing CtyObject, whose
+        attribute types were checked when it was built; skips
+        _validate_config() and only computes the derived sets.
+        attribute_types must be a dict private to the new object, which
+        exposes it read-only.
+        """
+        obj = object.__new__(cls)
+        for field in attrs.fields(cls):
+            object.__setattr__(obj, field.name, None)
+        object.__setattr__(obj, "attribute_types", MappingProxyType(attribute_types))
+        object.__setattr__(obj, "optional_attributes", optional_attributes)
+        object.__setattr__(obj, "computed_attributes", computed_attributes)
+        object.__setattr__(obj, "block_attributes", block_attributes)
+        object.__setattr__(obj, "sensitive_attributes", sensitive_attributes)
+        object.__setattr__(obj, "validation_order", validation_order)
+        obj._derive()
+        return obj
+    
+    @classmethod
+    def intern(
+        cls,
+        attribute_types: Optional[Dict[str, CtyType]] = None,
+        optional_attributes: FrozenSet[str] = frozenset(),
+        computed_attributes: FrozenSet[str] = frozenset(),
+        block_attributes: FrozenSet[str] = frozenset(),
+        sensitive_attributes: FrozenSet[str] = frozenset(),
+        validation_order: Optional[Sequence[str]] = None,
+        _trusted: bool = False,
+    ) -> "CtyObject":
+        """
+        Return a shared CtyObject for this schema, creating it on first use.
         
-        # Validate sensitive attributes exist
-        unknown_sensitive = set(self.sensitive_attributes) - set(self.attribute_types)
-        if unknown_sensitive:
-            error_msg = f"Unknown sensitive attributes: {', '.join(unknown_sensitive)}"
-            logger.error(f"🧩❌ {error_msg}")
-            raise AttributeValidationError(error_msg)
+        Identical schemas then share one instance, so configuration checks
+        and the validation plan, str and hash caches are built once. Schemas
+        whose attribute types are unhashable are constructed without interning.
+        The with_* methods pass _trusted=True as they only recombine an
+        already validated configuration.
         
-        logger.debug("🧩✅ CtyObject configuration validated successfully")
+        Returns:
+            CtyObject: The interned object type
+        """
+        if attribute_types is None:
+            attribute_types = {}
+        flags = (
+            frozenset(optional_attributes),
+            frozenset(computed_attributes),
+            frozenset(block_attributes),
+            frozenset(sensitive_attributes),
+        )
+        if validation_order is not None:
+            validation_order = tuple(validation_order)
+        construct = cls._unchecked if _trusted else cls
+        try:
+            key = (
+                tuple(sorted(attribute_types.items(), key=itemgetter(0))),
+                *flags,
+                validation_order,
+            )
+            obj = _INTERNED.get(key)
+        except TypeError:
+            return construct(dict(attribute_types), *flags, validation_order=validation_order)
+        if obj is None:
+            obj = construct(dict(attribute_types), *flags, validation_order=validation_order)
+            _INTERNED[key] = obj
+        return obj
     
     def validate(self, value: Any) -> Dict[str, Any]:
         """
@@ -110,74 +263,102 @@ class CtyObject(CtyType[Dict[str, Any]]):
         Raises:
             ValidationError: If the value doesn't match this type
         """
-        logger.debug(f"🧩🔍 Validating value against CtyObject: {value}")
+        debug = _debug_enabled()
+        if debug:
+            logger.debug("🧩🔍 Validating value against CtyObject: %s", value)
         
         # Handle null values as None
         if value is None:
-            logger.debug("🧩🔍 Received null value, returning None")
+            if debug:
+                logger.debug("🧩🔍 Received null value, returning None")
             return None
         
         # Value must be a dictionary
         if not isinstance(value, dict):
             type_name = type(value).__name__
-            error_msg = f"Expected a dictionary, got {type_name}: {value}"
-            logger.error(f"🧩🔍❌ {error_msg}")
-            raise ValidationError(error_msg)
+            raise ValidationError(f"Expected a dictionary, got {type_name}: {value}")
+        
+        required_attrs, known_attrs, steps, result_order = self._plan or self._validation_plan()
         
         # Check for required attributes
-        required_attrs = self.required_attributes()
-        logger.debug(f"🧩🔍 Required attributes: {required_attrs}")
-        for name in required_attrs:
-            if name not in value:
-                error_msg = f"Missing required attribute: {name}"
-                logger.error(f"🧩🔍❌ {error_msg}")
-                raise ValidationError(error_msg)
-        
-        # Check for unknown attributes
-        unknown_attrs = set(value.keys()) - set(self.attribute_types.keys())
-        if unknown_attrs:
-            error_msg = f"Unknown attributes: {', '.join(unknown_attrs)}"
-            logger.warning(f"🧩🔍⚠️ {error_msg}")
-            if len(unknown_attrs) > 0:
-                # In this implementation, we'll raise an error for unknown attributes
-                # This can be changed to just warn if needed
-                logger.error(f"🧩🔍❌ {error_msg}")
-                raise ValidationError(error_msg)
+        if debug:
+            logger.debug("🧩🔍 Required attributes: %s", required_attrs)
+        if not required_attrs <= value.keys():
+            # Report the first missing one in schema order
+            for name, _ in steps:
+                if name in required_attrs and name not in value:
+                    raise ValidationError(f"Missing required attribute: {name}")
+        
+        # Check for unknown attributes; these are rejected rather than ignored.
+        # The subset test walks only the value's keys and allocates nothing.
+        if not value.keys() <= known_attrs:
+            unknown_attrs = value.keys() - known_attrs
+            raise ValidationError(f"Unknown attributes: {', '.join(unknown_attrs)}")
         
         # Validate each attribute
         validated = {}
         
-        # Process each attribute
-        for name, attr_type in self.attribute_types.items():
-            logger.debug(f"🧩🔍 Validating attribute {name} with type {attr_type}")
-            
-            # Skip if attribute isn't present and is optional
-            if name not in value:
-                if name in self.optional_attributes or name in self.computed_attributes:
-                    logger.debug(f"🧩🔍 Attribute {name} is optional/computed and not provided")
+        # Process each attribute through the pre-bound validators; a single
+        # handler around the loop reports whichever attribute was in flight
+        name = None
+        try:
+            for name, validate_attr in steps:
+                if debug:
+                    logger.debug(
+                        "🧩🔍 Validating attribute %s with type %s",
+                        name, self.attribute_types[name],
+                    )
+
+                # Required attributes were checked above, so a missing one is
+                # optional/computed
+                if name not in value:
+                    if debug:
+                        logger.debug("🧩🔍 Attribute %s is optional/computed and not provided", name)
                     validated[name] = None
-                continue
-            
-            # Get the attribute value
-            attr_value = value[name]
-            
-            try:
-                # Validate the attribute
-                validated_value = attr_type.validate(attr_value)
-                logger.debug(f"🧩🔍✅ Validated attribute {name}: {validated_value}")
+                    continue
+
+                validated_value = validate_attr(value[name])
+                if debug:
+                    logger.debug("🧩🔍✅ Validated attribute %s: %s", name, validated_value)
                 validated[name] = validated_value
-            except ValidationError as e:
-                error_msg = f"Invalid value for attribute '{name}': {e}"
-                logger.error(f"🧩🔍❌ {error_msg}")
-                raise ValidationError(error_msg) from e
-            except Exception as e:
-                error_msg = f"Error validating attribute '{name}': {e}"
-                logger.error(f"🧩🔍❌ {error_msg}")
-                raise ValidationError(error_msg) from e
-        
-        logger.debug(f"🧩🔍✅ Successfully validated object: {validated}")
+        except ValidationError as e:
+            raise ValidationError(f"Invalid value for attribute '{name}': {e}") from e
+        except Exception as e:
+            raise ValidationError(f"Error validating attribute '{name}': {e}") from e
+        
+        if result_order is not None:
+            # Checked in validation_order; return keys in schema order as usual
+            validated = {name: validated[name] for name in result_order}
+        
+        if debug:
+            logger.debug("🧩🔍✅ Successfully validated object: %s", validated)
         return validated
     
+    def _validation_plan(self) -> tuple:
+        """
+        Build and cache what validate() needs from the schema.
+        
+        Returns:
+            tuple: (required names, known names, (name, bound validate) per
+            attribute, schema-ordered names to rebuild the result in, or None
+            when attributes are already checked in schema order)
+        """
+        names = list(self.attribute_types)
+        result_order = None
+        if self.validation_order:
+            first = dict.fromkeys(self.validation_order)
+            reordered = [*first, *(name for name in names if name not in first)]
+            if reordered != names:
+                names, result_order = reordered, tuple(names)
+        plan = (
+            self._required,
+            self._attribute_names,
+            tuple((name, self.attribute_types[name].validate) for name in names),
+            result_order,
+        )
+        object.__setattr__(self, "_plan", plan)
+        return plan
+    
     def required_attributes(self) -> FrozenSet[str]:
         """
         Get the set of required attribute names.
@@ -185,11 +366,7 @@ class CtyObject(CtyType[Dict[str, Any]]):
         Returns:
             FrozenSet[str]: Names of all required attributes
         """
-        return frozenset(
-            name for name in self.attribute_types
-            if name not in self.optional_attributes
-            and name not in self.computed_attributes
-        )
+        return self._required
     
     def get_attribute(self, value: Dict[str, Any], name: str) -> Any:
         """
@@ -206,24 +383,23 @@ class CtyObject(CtyType[Dict[str, Any]]):
             AttributeValidationError: If attribute doesn't exist
             ValidationError: If value is not a valid object
         """
-        logger.debug(f"🧩🔍 Getting attribute {name} from object")
+        debug = _debug_enabled()
+        if debug:
+            logger.debug("🧩🔍 Getting attribute %s from object", name)
         
         # Validate input
         if not isinstance(value, dict):
             type_name = type(value).__name__
-            error_msg = f"Expected a dictionary, got {type_name}: {value}"
-            logger.error(f"🧩🔍❌ {error_msg}")
-            raise ValidationError(error_msg)
+            raise ValidationError(f"Expected a dictionary, got {type_name}: {value}")
         
         # Check attribute exists in schema
         if name not in self.attribute_types:
-            error_msg = f"Unknown attribute: {name}"
-            logger.error(f"🧩🔍❌ {error_msg}")
-            raise AttributeValidationError(error_msg)
+            raise AttributeValidationError(f"Unknown attribute: {name}")
         
         # Return attribute value (may be None)
         attr_value = value.get(name)
-        logger.debug(f"🧩🔍✅ Found attribute {name}: {attr_value}")
+        if debug:
+            logger.debug("🧩🔍✅ Found attribute %s: %s", name, attr_value)
         return attr_value
     
     def has_attribute(self, name: str) -> bool:
@@ -237,46 +413,79 @@ class CtyObject(CtyType[Dict[str, Any]]):
             bool: True if the attribute exists
         """
         result = name in self.attribute_types
-        logger.debug(f"🧩🔍 Checking if attribute {name} exists: {result}")
+        logger.debug("🧩🔍 Checking if attribute %s exists: %s", name, result)
         return result
     
-    def with_optional_attributes(self, *names: str) -> "CtyObject":
+    def with_flags(
+        self,
+        *,
+        optional: Iterable[str] = (),
+        computed: Iterable[str] = (),
+        block: Iterable[str] = (),
+        sensitive: Iterable[str] = (),
+    ) -> "CtyObject":
         """
-        Create a new object type with additional optional attributes.
+        Create a new object type with additional flagged attributes.
+        
+        Merges several with_*_attributes() calls into one, so a chain of
+        flag changes checks names and builds a schema only once.
         
         Args:
-            *names: Names of attributes to mark as optional
+            optional: Names of attributes to mark as optional
+            computed: Names of attributes to mark as computed
+            block: Names of attributes to mark as blocks
+            sensitive: Names of attributes to mark as sensitive
         
         Returns:
-            CtyObject: New object type with updated optional attributes
+            CtyObject: New object type with updated attribute flags
         
         Raises:
             SchemaValidationError: If any name is not a valid attribute
         """
-        logger.debug(f"🧩🔧 Creating new object type with optional attributes: {names}")
+        optional, computed, block, sensitive = (
+            frozenset(optional), frozenset(computed), frozenset(block), frozenset(sensitive)
+        )
+        logger.debug(
+            "🧩🔧 Creating new object type with flags: optional=%s computed=%s block=%s sensitive=%s",
+            optional, computed, block, sensitive,
+        )
         
         # Validate all names exist in attribute_types
-        unknown = set(names) - set(self.attribute_types)
+        unknown = (optional | computed | block | sensitive) - self._attribute_names
         if unknown:
             error_msg = f"Unknown attributes: {', '.join(unknown)}"
             logger.error(f"🧩🔧❌ {error_msg}")
             raise SchemaValidationError(error_msg)
         
-        # Create new optional set
-        new_optional = frozenset(set(self.optional_attributes) | set(names))
-        
         # Create new object type
-        new_obj = CtyObject(
+        new_obj = CtyObject.intern(
             attribute_types=self.attribute_types,
-            optional_attributes=new_optional,
-            computed_attributes=self.computed_attributes,
-            block_attributes=self.block_attributes,
-            sensitive_attributes=self.sensitive_attributes
+            optional_attributes=self.optional_attributes | optional,
+            computed_attributes=self.computed_attributes | computed,
+            block_attributes=self.block_attributes | block,
+            sensitive_attributes=self.sensitive_attributes | sensitive,
+            validation_order=self.validation_order,
+            _trusted=True,
         )
         
-        logger.debug(f"🧩🔧✅ Created new object type with optional attributes: {new_optional}")
+        logger.debug("🧩🔧✅ Created new object type with flags")
         return new_obj
     
+    def with_optional_attributes(self, *names: str) -> "CtyObject":
+        """
+        Create a new object type with additional optional attributes.
+        
+        Args:
+            *names: Names of attributes to mark as optional
+        
+        Returns:
+            CtyObject: New object type with updated optional attributes
+        
+        Raises:
+            SchemaValidationError: If any name is not a valid attribute
+        """
+        return self.with_flags(optional=names)
+    
     def with_required_attributes(self, *names: str) -> "CtyObject":
         """
         Create a new object type with additional required attributes.
@@ -293,28 +502,31 @@ class CtyObject(CtyType[Dict[str, Any]]):
         logger.debug(f"🧩🔧 Creating new object type with required attributes: {names}")
         
         # Validate all names exist in attribute_types and are currently optional
-        unknown = set(names) - set(self.attribute_types)
+        names = frozenset(names)
+        unknown = names - self._attribute_names
         if unknown:
             error_msg = f"Unknown attributes: {', '.join(unknown)}"
             logger.error(f"🧩🔧❌ {error_msg}")
             raise SchemaValidationError(error_msg)
         
-        not_optional = set(names) - set(self.optional_attributes)
+        not_optional = names - self.optional_attributes
         if not_optional:
             error_msg = f"Attributes already required: {', '.join(not_optional)}"
             logger.error(f"🧩🔧❌ {error_msg}")
             raise SchemaValidationError(error_msg)
         
         # Create new optional set
-        new_optional = frozenset(set(self.optional_attributes) - set(names))
+        new_optional = self.optional_attributes - names
         
         # Create new object type
-        new_obj = CtyObject(
+        new_obj = CtyObject.intern(
             attribute_types=self.attribute_types,
             optional_attributes=new_optional,
             computed_attributes=self.computed_attributes,
             block_attributes=self.block_attributes,
-            sensitive_attributes=self.sensitive_attributes
+            sensitive_attributes=self.sensitive_attributes,
+            validation_order=self.validation_order,
+            _trusted=True,
         )
         
         logger.debug(f"🧩🔧✅ Created new object type with required attributes: {names}")
@@ -333,29 +545,7 @@ class CtyObject(CtyType[Dict[str, Any]]):
         Raises:
             SchemaValidationError: If any name is not a valid attribute
         """
-        logger.debug(f"🧩🔧 Creating new object type with computed attributes: {names}")
-        
-        # Validate all names exist in attribute_types
-        unknown = set(names) - set(self.attribute_types)
-        if unknown:
-            error_msg = f"Unknown attributes: {', '.join(unknown)}"
-            logger.error(f"🧩🔧❌ {error_msg}")
-            raise SchemaValidationError(error_msg)
-        
-        # Create new computed set
-        new_computed = frozenset(set(self.computed_attributes) | set(names))
-        
-        # Create new object type
-        new_obj = CtyObject(
-            attribute_types=self.attribute_types,
-            optional_attributes=self.optional_attributes,
-            computed_attributes=new_computed,
-            block_attributes=self.block_attributes,
-            sensitive_attributes=self.sensitive_attributes
-        )
-        
-        logger.debug(f"🧩🔧✅ Created new object type with computed attributes: {new_computed}")
-        return new_obj
+        return self.with_flags(computed=names)
     
     def with_block_attributes(self, *names: str) -> "CtyObject":
         """
@@ -370,29 +560,7 @@ class CtyObject(CtyType[Dict[str, Any]]):
         Raises:
             SchemaValidationError: If any name is not a valid attribute
         """
-        logger.debug(f"🧩🔧 Creating new object type with block attributes: {names}")
-        
-        # Validate all names exist in attribute_types
-        unknown = set(names) - set(self.attribute_types)
-        if unknown:
-            error_msg = f"Unknown attributes: {', '.join(unknown)}"
-            logger.error(f"🧩🔧❌ {error_msg}")
-            raise SchemaValidationError(error_msg)
-        
-        # Create new block set
-        new_blocks = frozenset(set(self.block_attributes) | set(names))
-        
-        # Create new object type
-        new_obj = CtyObject(
-            attribute_types=self.attribute_types,
-            optional_attributes=self.optional_attributes,
-            computed_attributes=self.computed_attributes,
-            block_attributes=new_blocks,
-            sensitive_attributes=self.sensitive_attributes
-        )
-        
-        logger.debug(f"🧩🔧✅ Created new object type with block attributes: {new_blocks}")
-        return new_obj
+        return self.with_flags(block=names)
     
     def with_sensitive_attributes(self, *names: str) -> "CtyObject":
         """
@@ -407,29 +575,7 @@ class CtyObject(CtyType[Dict[str, Any]]):
         Raises:
             SchemaValidationError: If any name is not a valid attribute
         """
-        logger.debug(f"🧩🔧 Creating new object type with sensitive attributes: {names}")
-        
-        # Validate all names exist in attribute_types
-        unknown = set(names) - set(self.attribute_types)
-        if unknown:
-            error_msg = f"Unknown attributes: {', '.join(unknown)}"
-            logger.error(f"🧩🔧❌ {error_msg}")
-            raise SchemaValidationError(error_msg)
-        
-        # Create new sensitive set
-        new_sensitive = frozenset(set(self.sensitive_attributes) | set(names))
-        
-        # Create new object type
-        new_obj = CtyObject(
-            attribute_types=self.attribute_types,
-            optional_attributes=self.optional_attributes,
-            computed_attributes=self.computed_attributes,
-            block_attributes=self.block_attributes,
-            sensitive_attributes=new_sensitive
-        )
-        
-        logger.debug(f"🧩🔧✅ Created new object type with sensitive attributes: {new_sensitive}")
-        return new_obj
+        return self.with_flags(sensitive=names)
     
     def with_attribute(self, name: str, type_: CtyType, *, 
                       optional: bool = False, computed: bool = False, 
@@ -459,32 +605,28 @@ class CtyObject(CtyType[Dict[str, Any]]):
             logger.error(f"🧩🔧❌ {error_msg}")
             raise SchemaValidationError(error_msg)
         
-        # Create new attribute_types dict
+        # The existing attribute types were checked when self was built
+        if not isinstance(type_, CtyType):
+            error_msg = f"Invalid types for attributes: {name}"
+            logger.error(f"🧩🔧❌ {error_msg}")
+            raise AttributeValidationError(error_msg)
+        
+        # Create new attribute_types dict; existing names are already interned
+        if type(name) is str:
+            name = sys.intern(name)
         new_attrs = dict(self.attribute_types)
         new_attrs[name] = type_
         
-        # Update attribute sets based on flags
-        new_optional = set(self.optional_attributes)
-        new_computed = set(self.computed_attributes)
-        new_blocks = set(self.block_attributes)
-        new_sensitive = set(self.sensitive_attributes)
-        
-        if optional:
-            new_optional.add(name)
-        if computed:
-            new_computed.add(name)
-        if block:
-            new_blocks.add(name)
-        if sensitive:
-            new_sensitive.add(name)
-        
-        # Create new object type
-        new_obj = CtyObject(
+        # Flag sets are shared with self unless the new attribute joins them
+        added = frozenset((name,))
+        new_obj = CtyObject.intern(
             attribute_types=new_attrs,
-            optional_attributes=frozenset(new_optional),
-            computed_attributes=frozenset(new_computed),
-            block_attributes=frozenset(new_blocks),
-            sensitive_attributes=frozenset(new_sensitive)
+            optional_attributes=self.optional_attributes | added if optional else self.optional_attributes,
+            computed_attributes=self.computed_attributes | added if computed else self.computed_attributes,
+            block_attributes=self.block_attributes | added if block else self.block_attributes,
+            sensitive_attributes=self.sensitive_attributes | added if sensitive else self.sensitive_attributes,
+            validation_order=self.validation_order,
+            _trusted=True,
         )
         
         logger.debug(f"🧩🔧✅ Created new object type with attribute: {name}")
@@ -500,46 +642,60 @@ class CtyObject(CtyType[Dict[str, Any]]):
         Returns:
             bool: True if the types are equal
         """
-        logger.debug(f"🧩🔍 Checking equality with {other.__class__.__name__}")
+        # Interned schemas make the identical-object case the common one
+        if self is other:
+            return True
+        
+        debug = _debug_enabled()
+        if debug:
+            logger.debug(f"🧩🔍 Checking equality with {other.__class__.__name__}")
         
         # Must be a CtyObject
         if not isinstance(other, CtyObject):
-            logger.debug(f"🧩🔍❌ Not equal: {other.__class__.__name__} is not CtyObject")
+            if debug:
+                logger.debug(f"🧩🔍❌ Not equal: {other.__class__.__name__} is not CtyObject")
             return False
         
         # Must have same attribute names
-        if set(self.attribute_types) != set(other.attribute_types):
-            logger.debug("🧩🔍❌ Not equal: attribute names differ")
+        if self._name_mask != other._name_mask or self._attribute_names != other._attribute_names:
+            if debug:
+                logger.debug("🧩🔍❌ Not equal: attribute names differ")
             return False
         
         # Must have same attribute types
         for name, type_ in self.attribute_types.items():
             other_type = other.attribute_types[name]
             if not type_.equal(other_type):
-                logger.debug(f"🧩🔍❌ Not equal: attribute {name} types differ")
+                if debug:
+                    logger.debug(f"🧩🔍❌ Not equal: attribute {name} types differ")
                 return False
         
         # Must have same optional attributes
         if self.optional_attributes != other.optional_attributes:
-            logger.debug("🧩🔍❌ Not equal: optional attributes differ")
+            if debug:
+                logger.debug("🧩🔍❌ Not equal: optional attributes differ")
             return False
         
         # Must have same computed attributes
         if self.computed_attributes != other.computed_attributes:
-            logger.debug("🧩🔍❌ Not equal: computed attributes differ")
+            if debug:
+                logger.debug("🧩🔍❌ Not equal: computed attributes differ")
             return False
         
         # Must have same block attributes
         if self.block_attributes != other.block_attributes:
-            logger.debug("🧩🔍❌ Not equal: block attributes differ")
+            if debug:
+                logger.debug("🧩🔍❌ Not equal: block attributes differ")
             return False
         
         # Must have same sensitive attributes
         if self.sensitive_attributes != other.sensitive_attributes:
-            logger.debug("🧩🔍❌ Not equal: sensitive attributes differ")
+            if debug:
+                logger.debug("🧩🔍❌ Not equal: sensitive attributes differ")
             return False
         
-        logger.debug("🧩🔍✅ Objects are equal")
+        if debug:
+            logger.debug("🧩🔍✅ Objects are equal")
         return True
     
     def usable_as(self, other: CtyType) -> bool:
@@ -552,42 +708,87 @@ class CtyObject(CtyType[Dict[str, Any]]):
         Returns:
             bool: True if usable as the target type
         """
-        logger.debug(f"🧩🔍 Checking usability as {other.__class__.__name__}")
+        debug = _debug_enabled()
+        if debug:
+            logger.debug(f"🧩🔍 Checking usability as {other.__class__.__name__}")
+        
+        # Interned schemas make identical objects the same instance
+        if self is other:
+            return True
         
         # Must be a CtyObject
         if not isinstance(other, CtyObject):
-            logger.debug(f"🧩🔍❌ Not usable as {other.__class__.__name__}")
+            if debug:
+                logger.debug(f"🧩🔍❌ Not usable as {other.__class__.__name__}")
             return False
         
         # Other type must not have attributes that we don't have
-        other_attrs = set(other.attribute_types)
-        self_attrs = set(self.attribute_types)
-        missing_attrs = other_attrs - self_attrs
-        if missing_attrs:
-            logger.debug(f"🧩🔍❌ Not usable: missing attributes {missing_attrs}")
+        if other._name_mask & ~self._name_mask or not other._attribute_names <= self._attribute_names:
+            if debug:
+                missing_attrs = other._attribute_names - self._attribute_names
+                logger.debug(f"🧩🔍❌ Not usable: missing attributes {missing_attrs}")
             return False
         
-        # For attributes in both, our type must be usable as other's type
-        for name in other_attrs:
-            self_type = self.attribute_types[name]
-            other_type = other.attribute_types[name]
-            if not self_type.equal(other_type):
-                logger.debug(f"🧩🔍❌ Not usable: attribute {name} type not compatible")
+        # For attributes in both, our type must be usable as other's type;
+        # shared attribute type instances need no structural comparison
+        self_types = self.attribute_types
+        for name, other_type in other.attribute_types.items():
+            self_type = self_types[name]
+            if self_type is not other_type and not self_type.equal(other_type):
+                if debug:
+                    logger.debug(f"🧩🔍❌ Not usable: attribute {name} type not compatible")
                 return False
         
         # Required attributes: other's required must be subset of ours
-        other_required = other.required_attributes()
-        self_required = self.required_attributes()
-        if not other_required.issubset(self_required):
-            extra_required = other_required - self_required
-            logger.debug(f"🧩🔍❌ Not usable: other requires attributes we don't: {extra_required}")
+        if not other._required <= self._required:
+            if debug:
+                extra_required = other._required - self._required
+                logger.debug(f"🧩🔍❌ Not usable: other requires attributes we don't: {extra_required}")
             return False
         
-        logger.debug("🧩🔍✅ Object is usable as target type")
+        if debug:
+            logger.debug("🧩🔍✅ Object is usable as target type")
         return True
     
+    def __hash__(self) -> int:
+        """Hash the schema fields that take part in equality, once."""
+        if self._hash_cache is None:
+            object.__setattr__(self, "_hash_cache", hash((
+                frozenset(self.attribute_types.items()),
+                frozenset(self.optional_attributes),
+                frozenset(self.computed_attributes),
+                frozenset(self.block_attributes),
+                frozenset(self.sensitive_attributes),
+            )))
+        return self._hash_cache
+    
+    def __copy__(self) -> "CtyObject":
+        # Immutable once built; shared like the interned instances
+        return self
+    
+    def __deepcopy__(self, memo: dict) -> "CtyObject":
+        return self
+    
+    def __reduce__(self) -> tuple:
+        # The read-only attribute_types proxy cannot be pickled; rebuild
+        # through intern() from a plain dict instead
+        return (type(self).intern, (
+            dict(self.attribute_types),
+            self.optional_attributes,
+            self.computed_attributes,
+            self.block_attributes,
+            self.sensitive_attributes,
+            self.validation_order,
+        ))
+    
     def __str__(self) -> str:
         """Get string representation of the type."""
+        if self._str_cache is None:
+            object.__setattr__(self, "_str_cache", self._format())
+        return self._str_cache
+    
+    def _format(self) -> str:
+        """Build the object(...) type string used by __str__."""
         parts = []
         for name, type_ in sorted(self.attribute_types.items()):
             part = f"{name}: {type_}"
@@ -623,26 +824,33 @@ def create_object(**kwargs) -> CtyObject:
             name=CtyString(),
             age=CtyNumber(),
             is_active=CtyBool(),
-            optional=["is_active"]
+            optional=["is_active"],
+            discriminator="name",
         )
     
+    A ``discriminator`` names an attribute validated before all others,
+    so values of the wrong kind are rejected as early as possible.
+    
     Args:
         **kwargs: Attribute types and configuration
         
     Returns:
         CtyObject: The created object type
     """
-    # Extract special configuration parameters
-    optional = kwargs.pop("optional", [])
-    computed = kwargs.pop("computed", [])
-    blocks = kwargs.pop("blocks", [])
-    sensitive = kwargs.pop("sensitive", [])
+    # Extract special configuration parameters; intern() converts them to
+    # frozensets, which is free for the shared empty default
+    optional = kwargs.pop("optional", _EMPTY_FROZENSET)
+    computed = kwargs.pop("computed", _EMPTY_FROZENSET)
+    blocks = kwargs.pop("blocks", _EMPTY_FROZENSET)
+    sensitive = kwargs.pop("sensitive", _EMPTY_FROZENSET)
+    discriminator = kwargs.pop("discriminator", None)
     
     # Create CtyObject with remaining kwargs as attribute_types
-    return CtyObject(
+    return CtyObject.intern(
         attribute_types=kwargs,
-        optional_attributes=frozenset(optional),
-        computed_attributes=frozenset(computed),
-        block_attributes=frozenset(blocks),
-        sensitive_attributes=frozenset(sensitive)
+        optional_attributes=optional,
+        computed_attributes=computed,
+        block_attributes=blocks,
+        sensitive_attributes=sensitive,
+        validation_order=None if discriminator is None else (discriminator,),
     )
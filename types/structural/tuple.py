@@ -15,6 +15,8 @@ class CtyTuple(CtyType[tuple[T, U]], Generic[T, U]):
     Represents a Terraform tuple type with a fixed structure.
     """
 
+    __slots__ = ("types", "_n", "_types_tuple", "_hash")
+
     def __init__(self, types: tuple[Any, ...]):
         """
         Initializes the tuple type with the expected element types.
@@ -23,6 +25,10 @@ class CtyTuple(CtyType[tuple[T, U]], Generic[T, U]):
             types (CtyTuple[Any, ...]): A tuple of types defining the expected structure.
         """
         self.types = types
+        # Fixed-size view used by validate() and usable_as()
+        self._types_tuple = tuple(types)
+        self._n = len(self._types_tuple)
+        self._hash = hash((CtyTuple, self._types_tuple))
 
     def validate(self, value: tuple[T, U]) -> None:
         """
@@ -36,9 +42,13 @@ class CtyTuple(CtyType[tuple[T, U]], Generic[T, U]):
         """
         if not isinstance(value, tuple):
             raise ValidationError(f"Expected a tuple, got {type(value).__name__}: {value}")
-        if len(value) != len(self.types):
-            raise ValidationError(f"Expected {len(self.types)} elements, got {len(value)}: {value}")
-        for i, (item, expected_type) in enumerate(zip(value, self.types)):
+        if len(value) != self._n:
+            raise ValidationError(f"Expected {self._n} elements, got {len(value)}: {value}")
+        types = self._types_tuple
+        if all(map(isinstance, value, types)):
+            return
+        # Slow path: locate the first mismatch for the error message
+        for i, (item, expected_type) in enumerate(zip(value, types)):
             if not isinstance(item, expected_type):
                 raise ValidationError(
                     f"Element {i} expected type {expected_type.__name__}, got {type(item).__name__}: {item}"
@@ -54,7 +64,7 @@ class CtyTuple(CtyType[tuple[T, U]], Generic[T, U]):
         Returns:
             bool: True if the types are equal, False otherwise.
         """
-        return isinstance(other, CtyTuple) and self.types == other.types
+        return isinstance(other, CtyTuple) and self._types_tuple == other._types_tuple
 
     def usable_as(self, other: "CtyType") -> bool:
         """
@@ -66,16 +76,24 @@ class CtyTuple(CtyType[tuple[T, U]], Generic[T, U]):
         Returns:
             bool: True if compatible, False otherwise.
         """
-        return isinstance(other, CtyTuple) and all(
-            issubclass(self_type, other_type)
-            for self_type, other_type in zip(self.types, other.types)
-        )
+        if not isinstance(other, CtyTuple) or self._n != other._n:
+            return False
+        for self_type, other_type in zip(self._types_tuple, other._types_tuple):
+            if isinstance(self_type, CtyType):
+                if not self_type.usable_as(other_type):
+                    return False
+            elif not (isinstance(other_type, type) and issubclass(self_type, other_type)):
+                return False
+        return True
 
     def __repr__(self):
         return f"{self.__class__.__name__}()"
 
     def __eq__(self, other):
-        return super().__eq__(other)
+        return self.equal(other)
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def __str__(self) -> str:
         """